@@ -1,4 +1,31 @@
 from typing import List
 
+from money.contracts.build_manifest import BuildManifest, compute_input_digest
+from money.contracts.policy_snapshot import (
+    LocalePolicyRules,
+    PolicySnapshot,
+    PolicySnapshotCache,
+    current_policy_snapshot,
+    get_policy_snapshot_cache,
+)
+from money.contracts.registry import (
+    CompiledContract,
+    ContractRegistry,
+    ContractValidationError,
+    get_contract_registry,
+)
 
-__all__: List[str] = []
+
+__all__: List[str] = [
+    "BuildManifest",
+    "CompiledContract",
+    "ContractRegistry",
+    "ContractValidationError",
+    "LocalePolicyRules",
+    "PolicySnapshot",
+    "PolicySnapshotCache",
+    "compute_input_digest",
+    "current_policy_snapshot",
+    "get_contract_registry",
+    "get_policy_snapshot_cache",
+]
@@ -0,0 +1,82 @@
+import copy
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+BUILD_MANIFEST_FILENAME = "build_manifest.json"
+BUILD_MANIFEST_VERSION = 1
+
+
+def compute_input_digest(payload: Any) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._entries = {}  # type: Dict[str, Dict[str, Any]]
+        self._dirty = False
+        if self._path.exists():
+            try:
+                document = json.loads(self._path.read_text(encoding="utf-8"))
+            except ValueError:
+                document = None
+            if (
+                isinstance(document, dict)
+                and document.get("version") == BUILD_MANIFEST_VERSION
+            ):
+                self._entries = dict(document.get("artifacts", {}))
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path) -> "BuildManifest":
+        return cls(Path(output_dir) / BUILD_MANIFEST_FILENAME)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, artifact_key: str, input_digest: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(artifact_key)
+        if entry is None or entry.get("input_digest") != input_digest:
+            return None
+        for artifact_path in entry.get("paths", []):
+            if not Path(artifact_path).exists():
+                return None
+        return copy.deepcopy(entry.get("result", {}))
+
+    def record(
+        self,
+        artifact_key: str,
+        input_digest: str,
+        result: Dict[str, Any],
+        paths: Iterable[str],
+    ) -> None:
+        self._entries[artifact_key] = {
+            "input_digest": input_digest,
+            "paths": sorted(set(str(path) for path in paths)),
+            "result": copy.deepcopy(result),
+        }
+        self._dirty = True
+
+    def save(self) -> Path:
+        if not self._dirty and self._path.exists():
+            return self._path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        temp_path.write_text(
+            json.dumps(
+                {"version": BUILD_MANIFEST_VERSION, "artifacts": self._entries},
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        temp_path.replace(self._path)
+        self._dirty = False
+        return self._path
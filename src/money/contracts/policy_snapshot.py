@@ -0,0 +1,227 @@
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+POLICY_PATH = ROOT_DIR / "docs" / "policy" / "locale_compliance_policy.json"
+DEFAULT_REFRESH_INTERVAL_SECONDS = 5.0
+
+
+class LocalePolicyRules:
+    def __init__(
+        self,
+        locale: str,
+        blocked_categories: FrozenSet[str],
+        category_reason_code: Mapping[str, str],
+        originality_threshold: float,
+    ) -> None:
+        self._locale = locale
+        self._blocked_categories = blocked_categories
+        self._category_reason_code = category_reason_code
+        self._originality_threshold = originality_threshold
+
+    @property
+    def locale(self) -> str:
+        return self._locale
+
+    @property
+    def blocked_categories(self) -> FrozenSet[str]:
+        return self._blocked_categories
+
+    @property
+    def category_reason_code(self) -> Mapping[str, str]:
+        return self._category_reason_code
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            _rebuild_locale_policy_rules,
+            (
+                self._locale,
+                self._blocked_categories,
+                dict(self._category_reason_code),
+                self._originality_threshold,
+            ),
+        )
+
+    @property
+    def originality_threshold(self) -> float:
+        return self._originality_threshold
+
+
+class PolicySnapshot:
+    def __init__(
+        self,
+        policy_version: str,
+        snapshot_id: str,
+        locale_rules: Mapping[str, LocalePolicyRules],
+        reason_codes: Mapping[str, str],
+    ) -> None:
+        self._policy_version = policy_version
+        self._snapshot_id = snapshot_id
+        self._locale_rules = locale_rules
+        self._reason_codes = reason_codes
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (
+            _rebuild_policy_snapshot,
+            (
+                self._policy_version,
+                self._snapshot_id,
+                dict(self._locale_rules),
+                dict(self._reason_codes),
+            ),
+        )
+
+    @classmethod
+    def from_text(cls, raw_text: str) -> "PolicySnapshot":
+        document = json.loads(raw_text)
+        policy_version = str(document.get("policy_version", "unversioned"))
+        digest = hashlib.sha1(raw_text.encode("utf-8")).hexdigest()[:12]
+
+        locale_rules = {}  # type: Dict[str, LocalePolicyRules]
+        for locale, rules in document.get("locale_rules", {}).items():
+            reason_code_by_category = dict(rules["category_reason_code"])
+            locale_rules[locale] = LocalePolicyRules(
+                locale=locale,
+                blocked_categories=frozenset(rules["blocked_categories"]),
+                category_reason_code=MappingProxyType(reason_code_by_category),
+                originality_threshold=float(rules["originality_threshold"]),
+            )
+
+        return cls(
+            policy_version=policy_version,
+            snapshot_id="policy-%s-%s" % (policy_version, digest),
+            locale_rules=MappingProxyType(locale_rules),
+            reason_codes=MappingProxyType(dict(document.get("reason_codes", {}))),
+        )
+
+    @property
+    def policy_version(self) -> str:
+        return self._policy_version
+
+    @property
+    def snapshot_id(self) -> str:
+        return self._snapshot_id
+
+    @property
+    def reason_codes(self) -> Mapping[str, str]:
+        return self._reason_codes
+
+    def supported_locales(self) -> List[str]:
+        return sorted(self._locale_rules.keys())
+
+    def rules_for(self, locale: str) -> Optional[LocalePolicyRules]:
+        return self._locale_rules.get(locale)
+
+
+def _rebuild_locale_policy_rules(
+    locale: str,
+    blocked_categories: FrozenSet[str],
+    category_reason_code: Dict[str, str],
+    originality_threshold: float,
+) -> LocalePolicyRules:
+    return LocalePolicyRules(
+        locale=locale,
+        blocked_categories=blocked_categories,
+        category_reason_code=MappingProxyType(category_reason_code),
+        originality_threshold=originality_threshold,
+    )
+
+
+def _rebuild_policy_snapshot(
+    policy_version: str,
+    snapshot_id: str,
+    locale_rules: Dict[str, LocalePolicyRules],
+    reason_codes: Dict[str, str],
+) -> PolicySnapshot:
+    return PolicySnapshot(
+        policy_version=policy_version,
+        snapshot_id=snapshot_id,
+        locale_rules=MappingProxyType(locale_rules),
+        reason_codes=MappingProxyType(reason_codes),
+    )
+
+
+class PolicySnapshotCache:
+    def __init__(
+        self,
+        policy_path: Path = POLICY_PATH,
+        refresh_interval_seconds: Optional[float] = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policy_path = policy_path
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._current = None  # type: Optional[PolicySnapshot]
+        self._snapshots_by_version = {}  # type: Dict[str, PolicySnapshot]
+        self._policy_mtime_ns = -1
+        self._next_refresh_at = 0.0
+
+    @property
+    def policy_path(self) -> Path:
+        return self._policy_path
+
+    def current(self) -> PolicySnapshot:
+        snapshot = self._current
+        if snapshot is None:
+            return self.reload()
+        if self._refresh_interval_seconds is None:
+            return snapshot
+
+        now = self._clock()
+        if now < self._next_refresh_at:
+            return snapshot
+        self._next_refresh_at = now + self._refresh_interval_seconds
+        try:
+            self.reload_if_changed()
+        except (OSError, ValueError, KeyError):
+            return snapshot
+        return self._current or snapshot
+
+    def get(self, policy_version: str) -> Optional[PolicySnapshot]:
+        return self._snapshots_by_version.get(policy_version)
+
+    def reload(self) -> PolicySnapshot:
+        with self._lock:
+            mtime_ns = self._policy_path.stat().st_mtime_ns
+            candidate = PolicySnapshot.from_text(
+                self._policy_path.read_text(encoding="utf-8")
+            )
+            known = self._snapshots_by_version.get(candidate.policy_version)
+            if known is not None and known.snapshot_id == candidate.snapshot_id:
+                candidate = known
+            self._snapshots_by_version[candidate.policy_version] = candidate
+            self._current = candidate
+            self._policy_mtime_ns = mtime_ns
+            if self._refresh_interval_seconds is not None:
+                self._next_refresh_at = self._clock() + self._refresh_interval_seconds
+            return candidate
+
+    def reload_if_changed(self) -> bool:
+        if self._current is not None:
+            if self._policy_path.stat().st_mtime_ns == self._policy_mtime_ns:
+                return False
+        previous = self._current
+        return self.reload() is not previous
+
+
+_DEFAULT_CACHE = None  # type: Optional[PolicySnapshotCache]
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_policy_snapshot_cache() -> PolicySnapshotCache:
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        with _DEFAULT_CACHE_LOCK:
+            if _DEFAULT_CACHE is None:
+                _DEFAULT_CACHE = PolicySnapshotCache()
+    return _DEFAULT_CACHE
+
+
+def current_policy_snapshot() -> PolicySnapshot:
+    return get_policy_snapshot_cache().current()
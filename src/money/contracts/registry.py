@@ -0,0 +1,279 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[3]
+SCHEMA_PATH = ROOT_DIR / "src" / "money" / "contracts" / "pipeline_contracts.schema.json"
+
+ContractIssue = Tuple[str, str, str]
+FieldCheck = Callable[[Any], Optional[ContractIssue]]
+
+
+class ContractValidationError(Exception):
+    def __init__(self, code: str, field: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.field = field
+
+
+def _check_type(value: Any, schema_type: str) -> bool:
+    if schema_type == "string":
+        return isinstance(value, str)
+    if schema_type == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if schema_type == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if schema_type == "boolean":
+        return isinstance(value, bool)
+    if schema_type == "array":
+        return isinstance(value, list)
+    if schema_type == "object":
+        return isinstance(value, dict)
+    return False
+
+
+def _enum_contains(allowed: FrozenSet[Any], value: Any) -> bool:
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+def _compile_enum_check(field: str, enum_values: List[Any]) -> FieldCheck:
+    allowed = frozenset(enum_values)
+
+    def _check(value: Any) -> Optional[ContractIssue]:
+        if _enum_contains(allowed, value):
+            return None
+        return (
+            "CONTRACT_ENUM_VIOLATION",
+            field,
+            f"enum violation at {field}: {value}",
+        )
+
+    return _check
+
+
+def _compile_field_check(
+    field: str,
+    field_schema: Dict[str, Any],
+    defs: Dict[str, Any],
+) -> Optional[FieldCheck]:
+    if "$ref" in field_schema:
+        ref_name = field_schema["$ref"].split("/")[-1]
+        ref_schema = defs[ref_name]
+        if "enum" not in ref_schema:
+            return None
+        return _compile_enum_check(field, ref_schema["enum"])
+
+    field_type = field_schema.get("type")
+    enum_check = None  # type: Optional[FieldCheck]
+    if "enum" in field_schema:
+        enum_check = _compile_enum_check(field, field_schema["enum"])
+
+    minimum = None
+    maximum = None
+    if field_type in {"number", "integer"}:
+        minimum = field_schema.get("minimum")
+        maximum = field_schema.get("maximum")
+
+    item_type = None
+    if field_type == "array" and "items" in field_schema:
+        item_type = field_schema["items"].get("type")
+
+    if not field_type and enum_check is None:
+        return None
+
+    def _check(value: Any) -> Optional[ContractIssue]:
+        if field_type and not _check_type(value, field_type):
+            return (
+                "CONTRACT_TYPE_MISMATCH",
+                field,
+                f"type mismatch at {field}: expected {field_type}",
+            )
+        if enum_check is not None:
+            issue = enum_check(value)
+            if issue is not None:
+                return issue
+        if minimum is not None and value < minimum:
+            return (
+                "CONTRACT_TYPE_MISMATCH",
+                field,
+                f"value below minimum at {field}: {value}",
+            )
+        if maximum is not None and value > maximum:
+            return (
+                "CONTRACT_TYPE_MISMATCH",
+                field,
+                f"value above maximum at {field}: {value}",
+            )
+        if item_type:
+            for idx, item in enumerate(value):
+                if not _check_type(item, item_type):
+                    return (
+                        "CONTRACT_TYPE_MISMATCH",
+                        f"{field}[{idx}]",
+                        f"array item type mismatch at {field}[{idx}]",
+                    )
+        return None
+
+    return _check
+
+
+class CompiledContract:
+    def __init__(
+        self,
+        entity_name: str,
+        entity_schema: Dict[str, Any],
+        defs: Dict[str, Any],
+    ) -> None:
+        properties = entity_schema.get("properties", {})
+        self.entity_name = entity_name
+        self.required = tuple(entity_schema.get("required", []))  # type: Tuple[str, ...]
+        self.allowed_fields = None  # type: Optional[FrozenSet[str]]
+        if entity_schema.get("additionalProperties") is False:
+            self.allowed_fields = frozenset(properties.keys())
+
+        field_checks = []  # type: List[Tuple[str, FieldCheck]]
+        for field, field_schema in properties.items():
+            check = _compile_field_check(field, field_schema, defs)
+            if check is not None:
+                field_checks.append((field, check))
+        self.field_checks = tuple(field_checks)
+
+    def first_issue(self, payload: Dict[str, Any]) -> Optional[ContractIssue]:
+        for field in self.required:
+            if field not in payload:
+                return (
+                    "CONTRACT_REQUIRED_FIELD",
+                    field,
+                    f"missing required field: {field}",
+                )
+
+        if self.allowed_fields is not None:
+            allowed_fields = self.allowed_fields
+            extra_fields = [field for field in payload if field not in allowed_fields]
+            if extra_fields:
+                extra_field = sorted(extra_fields)[0]
+                return (
+                    "CONTRACT_ADDITIONAL_PROPERTY",
+                    extra_field,
+                    f"additional property is not allowed: {extra_field}",
+                )
+
+        for field, check in self.field_checks:
+            if field not in payload:
+                continue
+            issue = check(payload[field])
+            if issue is not None:
+                return issue
+        return None
+
+    def collect_issues(self, payload: Any) -> List[ContractIssue]:
+        if not isinstance(payload, dict):
+            return [
+                (
+                    "CONTRACT_TYPE_MISMATCH",
+                    self.entity_name,
+                    f"type mismatch at {self.entity_name}: expected object",
+                )
+            ]
+
+        issues = []  # type: List[ContractIssue]
+        for field in self.required:
+            if field not in payload:
+                issues.append(
+                    (
+                        "CONTRACT_REQUIRED_FIELD",
+                        field,
+                        f"missing required field: {field}",
+                    )
+                )
+
+        if self.allowed_fields is not None:
+            allowed_fields = self.allowed_fields
+            extra_fields = [field for field in payload if field not in allowed_fields]
+            for extra_field in sorted(extra_fields):
+                issues.append(
+                    (
+                        "CONTRACT_ADDITIONAL_PROPERTY",
+                        extra_field,
+                        f"additional property is not allowed: {extra_field}",
+                    )
+                )
+
+        for field, check in self.field_checks:
+            if field not in payload:
+                continue
+            issue = check(payload[field])
+            if issue is not None:
+                issues.append(issue)
+        return issues
+
+    def validate(self, payload: Dict[str, Any]) -> None:
+        issue = self.first_issue(payload)
+        if issue is not None:
+            raise ContractValidationError(
+                code=issue[0],
+                field=issue[1],
+                message=issue[2],
+            )
+
+
+class ContractRegistry:
+    def __init__(self, schema_path: Path = SCHEMA_PATH) -> None:
+        self._schema_path = schema_path
+        self._lock = threading.Lock()
+        self._contracts = {}  # type: Dict[str, CompiledContract]
+        self._schema_mtime_ns = -1
+        self.reload()
+
+    @property
+    def schema_path(self) -> Path:
+        return self._schema_path
+
+    def reload(self) -> None:
+        with self._lock:
+            mtime_ns = self._schema_path.stat().st_mtime_ns
+            schema = json.loads(self._schema_path.read_text(encoding="utf-8"))
+            defs = schema.get("$defs", {})
+            contracts = {}  # type: Dict[str, CompiledContract]
+            for entity_name, entity_schema in defs.items():
+                if entity_schema.get("type") != "object":
+                    continue
+                contracts[entity_name] = CompiledContract(
+                    entity_name,
+                    entity_schema,
+                    defs,
+                )
+            self._contracts = contracts
+            self._schema_mtime_ns = mtime_ns
+
+    def reload_if_changed(self) -> bool:
+        if self._schema_path.stat().st_mtime_ns == self._schema_mtime_ns:
+            return False
+        self.reload()
+        return True
+
+    def entity_names(self) -> List[str]:
+        return sorted(self._contracts.keys())
+
+    def get(self, entity_name: str) -> CompiledContract:
+        return self._contracts[entity_name]
+
+    def validate(self, entity_name: str, payload: Dict[str, Any]) -> None:
+        self._contracts[entity_name].validate(payload)
+
+
+_DEFAULT_REGISTRY = None  # type: Optional[ContractRegistry]
+_DEFAULT_REGISTRY_LOCK = threading.Lock()
+
+
+def get_contract_registry() -> ContractRegistry:
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        with _DEFAULT_REGISTRY_LOCK:
+            if _DEFAULT_REGISTRY is None:
+                _DEFAULT_REGISTRY = ContractRegistry()
+    return _DEFAULT_REGISTRY
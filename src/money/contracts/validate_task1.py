@@ -1,157 +1,118 @@
 import argparse
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from money.contracts.policy_snapshot import PolicySnapshot, current_policy_snapshot
+from money.contracts.registry import ContractValidationError, get_contract_registry
 
 
 ROOT_DIR = Path(__file__).resolve().parents[3]
-SCHEMA_PATH = ROOT_DIR / "src" / "money" / "contracts" / "pipeline_contracts.schema.json"
-POLICY_PATH = ROOT_DIR / "docs" / "policy" / "locale_compliance_policy.json"
 EVIDENCE_DIR = ROOT_DIR / ".sisyphus" / "evidence"
 
 
-class ContractValidationError(Exception):
-    def __init__(self, code: str, field: str, message: str) -> None:
-        super().__init__(message)
-        self.code = code
-        self.field = field
-
-
-def _load_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def _check_type(value: Any, schema_type: str) -> bool:
-    if schema_type == "string":
-        return isinstance(value, str)
-    if schema_type == "number":
-        return isinstance(value, (int, float)) and not isinstance(value, bool)
-    if schema_type == "integer":
-        return isinstance(value, int) and not isinstance(value, bool)
-    if schema_type == "boolean":
-        return isinstance(value, bool)
-    if schema_type == "array":
-        return isinstance(value, list)
-    if schema_type == "object":
-        return isinstance(value, dict)
-    return False
-
-
 def validate_contract(entity_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    schema = _load_json(SCHEMA_PATH)
-    entity_schema = schema["$defs"][entity_name]
-
-    required = entity_schema.get("required", [])
-    for field in required:
-        if field not in payload:
-            raise ContractValidationError(
-                code="CONTRACT_REQUIRED_FIELD",
-                field=field,
-                message=f"missing required field: {field}",
-            )
-
-    if entity_schema.get("additionalProperties") is False:
-        allowed_fields = set(entity_schema.get("properties", {}).keys())
-        extra_fields = sorted(set(payload.keys()) - allowed_fields)
-        if extra_fields:
-            raise ContractValidationError(
-                code="CONTRACT_ADDITIONAL_PROPERTY",
-                field=extra_fields[0],
-                message=f"additional property is not allowed: {extra_fields[0]}",
-            )
+    get_contract_registry().validate(entity_name, payload)
+    return {
+        "status": "accepted",
+        "result_code": "PASS",
+        "entity": entity_name,
+    }
 
-    for field, field_schema in entity_schema.get("properties", {}).items():
-        if field not in payload:
-            continue
-        value = payload[field]
-
-        if "$ref" in field_schema:
-            ref_name = field_schema["$ref"].split("/")[-1]
-            ref_schema = schema["$defs"][ref_name]
-            if "enum" in ref_schema and value not in ref_schema["enum"]:
-                raise ContractValidationError(
-                    code="CONTRACT_ENUM_VIOLATION",
-                    field=field,
-                    message=f"enum violation at {field}: {value}",
-                )
-            continue
 
-        field_type = field_schema.get("type")
-        if field_type and not _check_type(value, field_type):
+def _iter_columnar_records(columns: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    row_count = None  # type: Optional[int]
+    for field, values in columns.items():
+        if not isinstance(values, list):
             raise ContractValidationError(
                 code="CONTRACT_TYPE_MISMATCH",
                 field=field,
-                message=f"type mismatch at {field}: expected {field_type}",
+                message=f"columnar batch column must be an array: {field}",
             )
-
-        if "enum" in field_schema and value not in field_schema["enum"]:
+        if row_count is None:
+            row_count = len(values)
+        elif len(values) != row_count:
             raise ContractValidationError(
-                code="CONTRACT_ENUM_VIOLATION",
+                code="CONTRACT_TYPE_MISMATCH",
                 field=field,
-                message=f"enum violation at {field}: {value}",
+                message=f"columnar batch column length mismatch at {field}",
             )
 
-        if field_type in {"number", "integer"}:
-            minimum = field_schema.get("minimum")
-            maximum = field_schema.get("maximum")
-            if minimum is not None and value < minimum:
-                raise ContractValidationError(
-                    code="CONTRACT_TYPE_MISMATCH",
-                    field=field,
-                    message=f"value below minimum at {field}: {value}",
-                )
-            if maximum is not None and value > maximum:
-                raise ContractValidationError(
-                    code="CONTRACT_TYPE_MISMATCH",
-                    field=field,
-                    message=f"value above maximum at {field}: {value}",
-                )
-
-        if field_type == "array" and "items" in field_schema:
-            item_type = field_schema["items"].get("type")
-            if item_type:
-                for idx, item in enumerate(value):
-                    if not _check_type(item, item_type):
-                        raise ContractValidationError(
-                            code="CONTRACT_TYPE_MISMATCH",
-                            field=f"{field}[{idx}]",
-                            message=f"array item type mismatch at {field}[{idx}]",
-                        )
+    fields = list(columns.keys())
+    column_values = [columns[field] for field in fields]
+    for row in zip(*column_values):
+        yield dict(zip(fields, row))
+
+
+def validate_contract_batch(
+    entity_name: str,
+    records: Union[Iterable[Dict[str, Any]], Dict[str, List[Any]]],
+) -> Dict[str, Any]:
+    contract = get_contract_registry().get(entity_name)
+    if isinstance(records, dict):
+        rows = _iter_columnar_records(records)  # type: Iterable[Any]
+    else:
+        rows = records
+
+    record_count = 0
+    record_errors = []  # type: List[Dict[str, Any]]
+    error_counts = {}  # type: Dict[str, int]
+    first_issue = contract.first_issue
+    for index, record in enumerate(rows):
+        record_count += 1
+        if isinstance(record, dict) and first_issue(record) is None:
+            continue
+
+        errors = []  # type: List[Dict[str, str]]
+        for code, field, message in contract.collect_issues(record):
+            error_counts[code] = error_counts.get(code, 0) + 1
+            errors.append({"code": code, "field": field, "message": message})
+        record_errors.append({"index": index, "errors": errors})
 
+    invalid_count = len(record_errors)
     return {
-        "status": "accepted",
-        "result_code": "PASS",
+        "status": "accepted" if invalid_count == 0 else "rejected",
+        "result_code": "PASS" if invalid_count == 0 else "BLOCKED_CONTRACT",
         "entity": entity_name,
+        "record_count": record_count,
+        "valid_count": record_count - invalid_count,
+        "invalid_count": invalid_count,
+        "error_counts": error_counts,
+        "record_errors": record_errors,
     }
 
 
-def evaluate_policy(locale: str, categories: List[str], similarity_score: float) -> Dict[str, Any]:
-    policy = _load_json(POLICY_PATH)
-    locale_rules = policy["locale_rules"]
+def evaluate_policy(
+    locale: str,
+    categories: List[str],
+    similarity_score: float,
+    snapshot: Optional[PolicySnapshot] = None,
+) -> Dict[str, Any]:
+    policy = snapshot if snapshot is not None else current_policy_snapshot()
+    rules = policy.rules_for(locale)
 
-    if locale not in locale_rules:
+    if rules is None:
         return {
             "status": "blocked",
             "result_code": "BLOCK",
             "policy_code": "POLICY_LOCALE_UNSUPPORTED",
             "reason_code": "POLICY_LOCALE_UNSUPPORTED",
+            "policy_snapshot_id": policy.snapshot_id,
         }
 
-    rules = locale_rules[locale]
-    blocked_categories = set(rules["blocked_categories"])
-    category_reason_code = rules["category_reason_code"]
-
+    blocked_categories = rules.blocked_categories
     for category in categories:
         if category in blocked_categories:
             return {
                 "status": "blocked",
                 "result_code": "BLOCK",
                 "policy_code": "POLICY_BLOCKED_CATEGORY",
-                "reason_code": category_reason_code[category],
+                "reason_code": rules.category_reason_code[category],
                 "blocked_category": category,
+                "policy_snapshot_id": policy.snapshot_id,
             }
 
-    threshold = float(rules["originality_threshold"])
+    threshold = rules.originality_threshold
     if similarity_score >= threshold:
         return {
             "status": "blocked",
@@ -160,6 +121,7 @@ def evaluate_policy(locale: str, categories: List[str], similarity_score: float)
             "reason_code": "RISKY_FINANCIAL_PROMISE",
             "similarity_score": similarity_score,
             "originality_threshold": threshold,
+            "policy_snapshot_id": policy.snapshot_id,
         }
 
     return {
@@ -169,6 +131,7 @@ def evaluate_policy(locale: str, categories: List[str], similarity_score: float)
         "reason_code": "PASS",
         "similarity_score": similarity_score,
         "originality_threshold": threshold,
+        "policy_snapshot_id": policy.snapshot_id,
     }
 
 
@@ -1,4 +1,19 @@
+from money.ingestion.collector import (
+    CollectionReport,
+    NdjsonFileFeed,
+    TrendFeedCollector,
+    TrendSourceAdapter,
+)
+from money.ingestion.rate_limit import TokenBucketRateLimiter
+from money.ingestion.scoring import (
+    DEFAULT_MONETIZATION_WEIGHTS,
+    MONETIZATION_WEIGHT_PROFILES,
+    MonetizationWeights,
+    score_monetization_columns,
+)
+from money.ingestion.store import BloomFilter, CandidateStore
 from money.ingestion.trend_ingestion import (
+    BulkIngestionResult,
     IngestionError,
     IngestionResult,
     TrendCandidate,
@@ -6,8 +21,20 @@ from money.ingestion.trend_ingestion import (
 )
 
 __all__ = [
+    "BloomFilter",
+    "BulkIngestionResult",
+    "CandidateStore",
+    "CollectionReport",
+    "DEFAULT_MONETIZATION_WEIGHTS",
     "IngestionError",
     "IngestionResult",
+    "MONETIZATION_WEIGHT_PROFILES",
+    "MonetizationWeights",
+    "NdjsonFileFeed",
+    "TokenBucketRateLimiter",
     "TrendCandidate",
+    "TrendFeedCollector",
     "TrendIngestionService",
+    "TrendSourceAdapter",
+    "score_monetization_columns",
 ]
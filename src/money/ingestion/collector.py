@@ -0,0 +1,173 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from money.ingestion.trend_ingestion import TrendIngestionService
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_QUEUE_SIZE = 8
+
+
+class TrendSourceAdapter:
+    def __init__(self, source_platform: str) -> None:
+        self.source_platform = source_platform
+
+    async def fetch_batch(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        return None
+
+
+class NdjsonFileFeed(TrendSourceAdapter):
+    def __init__(
+        self,
+        source_platform: str,
+        path: Path,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        super().__init__(source_platform)
+        self._path = Path(path)
+        self._page_size = page_size
+        self._latency_seconds = latency_seconds
+        self._handle = None  # type: Optional[Any]
+
+    async def fetch_batch(self) -> List[Dict[str, Any]]:
+        if self._latency_seconds > 0:
+            await asyncio.sleep(self._latency_seconds)
+        if self._handle is None:
+            self._handle = self._path.open("r", encoding="utf-8")
+
+        records = []  # type: List[Dict[str, Any]]
+        while len(records) < self._page_size:
+            line = self._handle.readline()
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict):
+                record.setdefault("source_platform", self.source_platform)
+            records.append(record)
+        return records
+
+    async def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class CollectionReport:
+    def __init__(self) -> None:
+        self.batch_count = 0
+        self.record_count = 0
+        self.created_count = 0
+        self.duplicate_count = 0
+        self.rejected_count = 0
+        self.rejected_by_code = {}  # type: Dict[str, int]
+        self.records_by_platform = {}  # type: Dict[str, int]
+        self.source_errors = {}  # type: Dict[str, str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batch_count": self.batch_count,
+            "record_count": self.record_count,
+            "created_count": self.created_count,
+            "duplicate_count": self.duplicate_count,
+            "rejected_count": self.rejected_count,
+            "rejected_by_code": dict(self.rejected_by_code),
+            "records_by_platform": dict(self.records_by_platform),
+            "source_errors": dict(self.source_errors),
+        }
+
+
+class TrendFeedCollector:
+    def __init__(
+        self,
+        service: TrendIngestionService,
+        adapters: Sequence[TrendSourceAdapter],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least one")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least one")
+        self._service = service
+        self._adapters = list(adapters)
+        self._max_concurrency = max_concurrency
+        self._queue_size = queue_size
+
+    async def collect(self) -> CollectionReport:
+        report = CollectionReport()
+        queue = asyncio.Queue(maxsize=self._queue_size)  # type: asyncio.Queue
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        producers = [
+            asyncio.ensure_future(self._produce(adapter, queue, semaphore, report))
+            for adapter in self._adapters
+        ]
+        consumer = asyncio.ensure_future(self._consume(queue, report))
+        try:
+            producing = asyncio.gather(*producers)
+            waiters = [producing, consumer]  # type: List[asyncio.Future]
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            if consumer.done():
+                consumer.result()
+            await producing
+            await queue.put(None)
+            await consumer
+        finally:
+            for task in producers + [consumer]:
+                if not task.done():
+                    task.cancel()
+            for adapter in self._adapters:
+                await adapter.close()
+        return report
+
+    def collect_sync(self) -> CollectionReport:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.collect())
+        finally:
+            loop.close()
+
+    async def _produce(
+        self,
+        adapter: TrendSourceAdapter,
+        queue: "asyncio.Queue",
+        semaphore: asyncio.Semaphore,
+        report: CollectionReport,
+    ) -> None:
+        while True:
+            async with semaphore:
+                try:
+                    batch = await adapter.fetch_batch()
+                except (OSError, ValueError) as error:
+                    report.source_errors[adapter.source_platform] = str(error)
+                    return
+            if not batch:
+                return
+            platform_count = report.records_by_platform.get(adapter.source_platform, 0)
+            report.records_by_platform[adapter.source_platform] = (
+                platform_count + len(batch)
+            )
+            await queue.put(batch)
+
+    async def _consume(self, queue: "asyncio.Queue", report: CollectionReport) -> None:
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+            result = self._service.ingest_many(batch, chunk_size=max(1, len(batch)))
+            report.batch_count += 1
+            report.record_count += result.record_count
+            report.created_count += result.created_count
+            report.duplicate_count += result.duplicate_count
+            report.rejected_count += result.rejected_count
+            rejected_by_code = report.rejected_by_code
+            for code, count in result.rejected_by_code.items():
+                rejected_by_code[code] = rejected_by_code.get(code, 0) + count
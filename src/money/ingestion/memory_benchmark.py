@@ -0,0 +1,107 @@
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from money.ingestion.trend_ingestion import TrendCandidate
+
+DEFAULT_BENCHMARK_COUNT = 1000000
+
+PLATFORMS = ("youtube", "tiktok")
+
+
+class LegacyTrendCandidate:
+    def __init__(
+        self,
+        candidate_id: str,
+        source_platform: str,
+        external_id: str,
+        topic: str,
+        signal_score: float,
+        captured_at: str,
+        monetization_score: float,
+        analysis_only: bool,
+        beat_map_artifact: str,
+        pacing_map_artifact: str,
+    ) -> None:
+        self.candidate_id = candidate_id
+        self.source_platform = source_platform
+        self.external_id = external_id
+        self.topic = topic
+        self.signal_score = signal_score
+        self.captured_at = captured_at
+        self.monetization_score = monetization_score
+        self.analysis_only = analysis_only
+        self.beat_map_artifact = beat_map_artifact
+        self.pacing_map_artifact = pacing_map_artifact
+
+
+def _build_legacy(index: int, topic: str, captured_at: str) -> Any:
+    candidate_id = "trend-%016x" % index
+    return LegacyTrendCandidate(
+        candidate_id,
+        PLATFORMS[index % 2],
+        "ext-%d" % index,
+        topic,
+        0.5,
+        captured_at,
+        0.5,
+        False,
+        "artifacts/{0}/beat_map.json".format(candidate_id),
+        "artifacts/{0}/pacing_map.json".format(candidate_id),
+    )
+
+
+def _build_compact(index: int, topic: str, captured_at: str) -> Any:
+    return TrendCandidate(
+        "trend-%016x" % index,
+        PLATFORMS[index % 2],
+        "ext-%d" % index,
+        topic,
+        0.5,
+        captured_at,
+        0.5,
+        False,
+    )
+
+
+def measure_bytes_per_candidate(
+    count: int,
+    factory: Callable[[int, str, str], Any],
+) -> float:
+    topic = "benchmark topic"
+    captured_at = "2026-02-16T00:00:00Z"
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        candidates = [factory(index, topic, captured_at) for index in range(count)]
+        current = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del candidates
+    return (current - baseline) / float(max(1, count))
+
+
+def run_memory_benchmark(count: int = DEFAULT_BENCHMARK_COUNT) -> Dict[str, Any]:
+    legacy = measure_bytes_per_candidate(count, _build_legacy)
+    compact = measure_bytes_per_candidate(count, _build_compact)
+    return {
+        "candidate_count": count,
+        "legacy_bytes_per_candidate": round(legacy, 1),
+        "compact_bytes_per_candidate": round(compact, 1),
+        "reduction_ratio": round(1.0 - (compact / legacy), 4) if legacy else 0.0,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=DEFAULT_BENCHMARK_COUNT)
+    args = parser.parse_args(argv)
+    print(json.dumps(run_memory_benchmark(args.count), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
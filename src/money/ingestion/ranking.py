@@ -0,0 +1,154 @@
+import base64
+import heapq
+import json
+from bisect import bisect_right, insort
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from money.ingestion.trend_ingestion import TrendCandidate
+
+
+RankKey = Tuple[float, str, str]
+SegmentKey = Tuple[str, bool]
+
+
+def rank_key(candidate: "TrendCandidate") -> RankKey:
+    return (
+        -candidate.monetization_score,
+        candidate.captured_at,
+        candidate.candidate_id,
+    )
+
+
+def encode_cursor(key: RankKey) -> str:
+    raw = json.dumps([-key[0], key[1], key[2]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> RankKey:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        parts = json.loads(raw)
+    except (UnicodeError, ValueError):
+        parts = None
+    if (
+        not isinstance(parts, list)
+        or len(parts) != 3
+        or isinstance(parts[0], bool)
+        or not isinstance(parts[0], (int, float))
+        or not isinstance(parts[1], str)
+        or not isinstance(parts[2], str)
+    ):
+        raise ValueError("malformed ranking cursor: {0}".format(cursor))
+    return (-float(parts[0]), parts[1], parts[2])
+
+
+class CandidateRankingIndex:
+    def __init__(self) -> None:
+        self._segments = {}  # type: Dict[SegmentKey, List[RankKey]]
+        self._entries = {}  # type: Dict[str, Tuple[SegmentKey, RankKey]]
+        self._candidates = {}  # type: Dict[str, "TrendCandidate"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, candidate: "TrendCandidate") -> None:
+        self.remove(candidate.candidate_id)
+        segment_key = (candidate.source_platform, bool(candidate.analysis_only))
+        key = rank_key(candidate)
+        insort(self._segments.setdefault(segment_key, []), key)
+        self._entries[candidate.candidate_id] = (segment_key, key)
+        self._candidates[candidate.candidate_id] = candidate
+
+    def rebuild(self, candidates: Iterable["TrendCandidate"]) -> None:
+        segments = {}  # type: Dict[SegmentKey, List[RankKey]]
+        entries = {}  # type: Dict[str, Tuple[SegmentKey, RankKey]]
+        by_id = {}  # type: Dict[str, "TrendCandidate"]
+        for candidate in candidates:
+            segment_key = (candidate.source_platform, bool(candidate.analysis_only))
+            key = rank_key(candidate)
+            segments.setdefault(segment_key, []).append(key)
+            entries[candidate.candidate_id] = (segment_key, key)
+            by_id[candidate.candidate_id] = candidate
+        for segment in segments.values():
+            segment.sort()
+        self._segments = segments
+        self._entries = entries
+        self._candidates = by_id
+
+    def remove(self, candidate_id: str) -> bool:
+        entry = self._entries.pop(candidate_id, None)
+        if entry is None:
+            return False
+        segment_key, key = entry
+        segment = self._segments[segment_key]
+        position = bisect_right(segment, key) - 1
+        del segment[position]
+        if not segment:
+            del self._segments[segment_key]
+        del self._candidates[candidate_id]
+        return True
+
+    def iter_ranked(
+        self,
+        *,
+        publishable_only: bool = False,
+        source_platform: Optional[str] = None,
+        after: Optional[RankKey] = None,
+    ) -> Iterator["TrendCandidate"]:
+        streams = []  # type: List[Iterator[RankKey]]
+        for (platform, analysis_only), segment in self._segments.items():
+            if publishable_only and analysis_only:
+                continue
+            if source_platform is not None and platform != source_platform:
+                continue
+            start = 0 if after is None else bisect_right(segment, after)
+            streams.append(self._iter_segment(segment, start))
+
+        for key in heapq.merge(*streams):
+            yield self._candidates[key[2]]
+
+    def top_k(
+        self,
+        k: int,
+        *,
+        publishable_only: bool = False,
+        source_platform: Optional[str] = None,
+    ) -> List["TrendCandidate"]:
+        candidates, _ = self.page(
+            k,
+            publishable_only=publishable_only,
+            source_platform=source_platform,
+        )
+        return candidates
+
+    def page(
+        self,
+        limit: int,
+        *,
+        cursor: Optional[str] = None,
+        publishable_only: bool = False,
+        source_platform: Optional[str] = None,
+    ) -> Tuple[List["TrendCandidate"], Optional[str]]:
+        after = None if cursor is None else decode_cursor(cursor)
+        candidates = []  # type: List[TrendCandidate]
+        if limit <= 0:
+            return candidates, cursor
+        ranked = self.iter_ranked(
+            publishable_only=publishable_only,
+            source_platform=source_platform,
+            after=after,
+        )
+        for candidate in ranked:
+            candidates.append(candidate)
+            if len(candidates) == limit:
+                break
+
+        next_cursor = None  # type: Optional[str]
+        if len(candidates) == limit:
+            next_cursor = encode_cursor(self._entries[candidates[-1].candidate_id][1])
+        return candidates, next_cursor
+
+    def _iter_segment(self, segment: List[RankKey], start: int) -> Iterator[RankKey]:
+        for position in range(start, len(segment)):
+            yield segment[position]
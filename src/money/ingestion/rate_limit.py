@@ -0,0 +1,85 @@
+import math
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+GLOBAL_BUCKET = "*"
+
+
+class TokenBucketRateLimiter:
+    def __init__(
+        self,
+        refill_rate_per_second: float,
+        burst_size: int,
+        per_source_platform: bool = True,
+        platform_overrides: Optional[Dict[str, Tuple[float, int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if refill_rate_per_second <= 0:
+            raise ValueError("refill_rate_per_second must be greater than zero")
+        if burst_size < 1:
+            raise ValueError("burst_size must be at least one")
+        self._refill_rate_per_second = float(refill_rate_per_second)
+        self._burst_size = int(burst_size)
+        self._per_source_platform = per_source_platform
+        self._platform_overrides = dict(platform_overrides or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets = {}  # type: Dict[str, Tuple[float, float]]
+
+    def try_acquire(self, source_platform: str, tokens: float = 1.0) -> float:
+        bucket = self._bucket_name(source_platform)
+        refill_rate, burst_size = self._limits_for(bucket)
+        if tokens > burst_size:
+            raise ValueError("cannot acquire more tokens than the burst size")
+        with self._lock:
+            available, now = self._refill(bucket, refill_rate, burst_size)
+            if available >= tokens:
+                self._buckets[bucket] = (available - tokens, now)
+                return 0.0
+            self._buckets[bucket] = (available, now)
+            return self._round_up((tokens - available) / refill_rate)
+
+    def retry_after_seconds(self, source_platform: str, tokens: float = 1.0) -> float:
+        bucket = self._bucket_name(source_platform)
+        refill_rate, burst_size = self._limits_for(bucket)
+        with self._lock:
+            available, _ = self._refill(bucket, refill_rate, burst_size)
+        if available >= tokens:
+            return 0.0
+        return self._round_up((tokens - available) / refill_rate)
+
+    def available_tokens(self, source_platform: str) -> float:
+        bucket = self._bucket_name(source_platform)
+        refill_rate, burst_size = self._limits_for(bucket)
+        with self._lock:
+            available, _ = self._refill(bucket, refill_rate, burst_size)
+        return available
+
+    def _bucket_name(self, source_platform: str) -> str:
+        if self._per_source_platform:
+            return source_platform
+        return GLOBAL_BUCKET
+
+    def _limits_for(self, bucket: str) -> Tuple[float, int]:
+        override = self._platform_overrides.get(bucket)
+        if override is not None:
+            return float(override[0]), int(override[1])
+        return self._refill_rate_per_second, self._burst_size
+
+    def _refill(
+        self,
+        bucket: str,
+        refill_rate: float,
+        burst_size: int,
+    ) -> Tuple[float, float]:
+        now = self._clock()
+        state = self._buckets.get(bucket)
+        if state is None:
+            return float(burst_size), now
+        tokens, updated_at = state
+        elapsed = max(0.0, now - updated_at)
+        return min(float(burst_size), tokens + elapsed * refill_rate), now
+
+    def _round_up(self, seconds: float) -> float:
+        return math.ceil(seconds * 1000.0) / 1000.0
@@ -0,0 +1,143 @@
+import importlib
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    _numpy = importlib.import_module("numpy")  # type: Optional[Any]
+except ImportError:
+    _numpy = None
+
+
+class MonetizationWeights:
+    def __init__(
+        self,
+        signal: float,
+        engagement_velocity: float,
+        advertiser_fit: float,
+        region_match: float,
+        profile_name: str = "custom",
+    ) -> None:
+        values = (signal, engagement_velocity, advertiser_fit, region_match)
+        for value in values:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError("monetization weights must be numbers")
+            if value < 0:
+                raise ValueError("monetization weights must be non-negative")
+        self._signal = float(signal)
+        self._engagement_velocity = float(engagement_velocity)
+        self._advertiser_fit = float(advertiser_fit)
+        self._region_match = float(region_match)
+        self._profile_name = profile_name
+
+    @property
+    def signal(self) -> float:
+        return self._signal
+
+    @property
+    def engagement_velocity(self) -> float:
+        return self._engagement_velocity
+
+    @property
+    def advertiser_fit(self) -> float:
+        return self._advertiser_fit
+
+    @property
+    def region_match(self) -> float:
+        return self._region_match
+
+    @property
+    def profile_name(self) -> str:
+        return self._profile_name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "profile_name": self._profile_name,
+            "signal": self._signal,
+            "engagement_velocity": self._engagement_velocity,
+            "advertiser_fit": self._advertiser_fit,
+            "region_match": self._region_match,
+        }
+
+
+DEFAULT_MONETIZATION_WEIGHTS = MonetizationWeights(0.55, 0.25, 0.15, 0.05, "default")
+
+MONETIZATION_WEIGHT_PROFILES = {
+    "default": DEFAULT_MONETIZATION_WEIGHTS,
+    "engagement_first": MonetizationWeights(0.40, 0.40, 0.15, 0.05, "engagement_first"),
+    "advertiser_first": MonetizationWeights(0.40, 0.15, 0.35, 0.10, "advertiser_first"),
+}  # type: Dict[str, MonetizationWeights]
+
+
+def get_weight_profile(profile_name: str) -> MonetizationWeights:
+    return MONETIZATION_WEIGHT_PROFILES[profile_name]
+
+
+def numpy_available() -> bool:
+    return _numpy is not None
+
+
+def _clamp_column(values: Sequence[float]) -> "array[float]":
+    column = array("d", values)
+    for position, value in enumerate(column):
+        if value < 0:
+            column[position] = 0.0
+        elif value > 1:
+            column[position] = 1.0
+    return column
+
+
+def _score_with_numpy(
+    columns: Sequence[Sequence[float]],
+    weights: MonetizationWeights,
+) -> List[float]:
+    assert _numpy is not None
+    signal, velocity, fit, region = [
+        _numpy.clip(_numpy.asarray(column, dtype=_numpy.float64), 0.0, 1.0)
+        for column in columns
+    ]
+    weighted_sum = (
+        (weights.signal * signal)
+        + (weights.engagement_velocity * velocity)
+        + (weights.advertiser_fit * fit)
+        + (weights.region_match * region)
+    )
+    return [round(value, 6) for value in weighted_sum.tolist()]
+
+
+def _score_with_arrays(
+    columns: Sequence[Sequence[float]],
+    weights: MonetizationWeights,
+) -> List[float]:
+    signal, velocity, fit, region = [_clamp_column(column) for column in columns]
+    w_signal = weights.signal
+    w_velocity = weights.engagement_velocity
+    w_fit = weights.advertiser_fit
+    w_region = weights.region_match
+    return [
+        round(
+            (w_signal * s) + (w_velocity * v) + (w_fit * f) + (w_region * r),
+            6,
+        )
+        for s, v, f, r in zip(signal, velocity, fit, region)
+    ]
+
+
+def score_monetization_columns(
+    signal_scores: Sequence[float],
+    engagement_velocities: Sequence[float],
+    advertiser_fits: Sequence[float],
+    region_matches: Sequence[float],
+    weights: MonetizationWeights = DEFAULT_MONETIZATION_WEIGHTS,
+    use_numpy: Optional[bool] = None,
+) -> List[float]:
+    columns = (signal_scores, engagement_velocities, advertiser_fits, region_matches)
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError("monetization columns must have equal lengths")
+    if not signal_scores:
+        return []
+    if use_numpy is None:
+        use_numpy = _numpy is not None
+    if use_numpy and _numpy is not None:
+        return _score_with_numpy(columns, weights)
+    return _score_with_arrays(columns, weights)
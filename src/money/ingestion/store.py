@@ -0,0 +1,206 @@
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+SourceKey = Tuple[str, str]
+
+DEFAULT_BLOOM_CAPACITY = 1000000
+DEFAULT_BLOOM_FALSE_POSITIVE_RATE = 0.01
+SQLITE_MAX_VARIABLES = 900
+
+STORED_CANDIDATE_FIELDS = (
+    "candidate_id",
+    "source_platform",
+    "external_id",
+    "topic",
+    "signal_score",
+    "captured_at",
+    "monetization_score",
+    "analysis_only",
+    "beat_map_artifact",
+    "pacing_map_artifact",
+    "engagement_velocity",
+    "advertiser_fit",
+    "region_match",
+)
+
+
+def _source_key_bytes(source_platform: str, external_id: str) -> bytes:
+    return "{0}\x1f{1}".format(source_platform, external_id).encode("utf-8")
+
+
+class BloomFilter:
+    def __init__(
+        self,
+        capacity: int = DEFAULT_BLOOM_CAPACITY,
+        false_positive_rate: float = DEFAULT_BLOOM_FALSE_POSITIVE_RATE,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least one")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between zero and one")
+        bit_count = int(
+            math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        )
+        self._bit_count = max(8, bit_count)
+        self._hash_count = max(1, int(round(self._bit_count / capacity * math.log(2))))
+        self._bits = bytearray((self._bit_count + 7) // 8)
+        self._item_count = 0
+
+    @property
+    def bit_count(self) -> int:
+        return self._bit_count
+
+    @property
+    def hash_count(self) -> int:
+        return self._hash_count
+
+    def __len__(self) -> int:
+        return self._item_count
+
+    def add(self, key: bytes) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._item_count += 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, bytes):
+            return False
+        for position in self._positions(key):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def _positions(self, key: bytes) -> List[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [
+            (first + index * second) % self._bit_count
+            for index in range(self._hash_count)
+        ]
+
+
+class CandidateStore:
+    def __init__(
+        self,
+        path: Path,
+        use_bloom_filter: bool = True,
+        bloom_capacity: Optional[int] = None,
+        bloom_false_positive_rate: float = DEFAULT_BLOOM_FALSE_POSITIVE_RATE,
+    ) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS trend_candidates ("
+            "source_platform TEXT NOT NULL, "
+            "external_id TEXT NOT NULL, "
+            "candidate_id TEXT NOT NULL, "
+            "payload TEXT NOT NULL, "
+            "PRIMARY KEY (source_platform, external_id)"
+            ") WITHOUT ROWID"
+        )
+        self._connection.commit()
+
+        self._bloom = None  # type: Optional[BloomFilter]
+        if use_bloom_filter:
+            existing = self.count()
+            capacity = bloom_capacity or max(DEFAULT_BLOOM_CAPACITY, existing * 2)
+            self._bloom = BloomFilter(capacity, bloom_false_positive_rate)
+            cursor = self._connection.execute(
+                "SELECT source_platform, external_id FROM trend_candidates"
+            )
+            for source_platform, external_id in cursor:
+                self._bloom.add(_source_key_bytes(source_platform, external_id))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def count(self) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM trend_candidates"
+            ).fetchone()
+        return int(row[0])
+
+    def might_contain(self, source_platform: str, external_id: str) -> bool:
+        if self._bloom is None:
+            return True
+        return _source_key_bytes(source_platform, external_id) in self._bloom
+
+    def get(self, source_platform: str, external_id: str) -> Optional[Dict[str, Any]]:
+        if not self.might_contain(source_platform, external_id):
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM trend_candidates "
+                "WHERE source_platform = ? AND external_id = ?",
+                (source_platform, external_id),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def find_existing(self, keys: Iterable[SourceKey]) -> Dict[SourceKey, str]:
+        candidates = [key for key in set(keys) if self.might_contain(key[0], key[1])]
+        found = {}  # type: Dict[SourceKey, str]
+        step = SQLITE_MAX_VARIABLES // 2
+        for start in range(0, len(candidates), step):
+            found.update(self._select_candidate_ids(candidates[start : start + step]))
+        return found
+
+    def put(self, candidate: Any) -> None:
+        self.put_many([candidate])
+
+    def put_many(self, candidates: Sequence[Any]) -> None:
+        rows = []  # type: List[Tuple[str, str, str, str]]
+        for candidate in candidates:
+            payload = {field: getattr(candidate, field) for field in STORED_CANDIDATE_FIELDS}
+            rows.append(
+                (
+                    candidate.source_platform,
+                    candidate.external_id,
+                    candidate.candidate_id,
+                    json.dumps(payload, sort_keys=True),
+                )
+            )
+        if not rows:
+            return
+        with self._lock:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO trend_candidates "
+                    "(source_platform, external_id, candidate_id, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        if self._bloom is not None:
+            for source_platform, external_id, _, _ in rows:
+                self._bloom.add(_source_key_bytes(source_platform, external_id))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _select_candidate_ids(self, keys: List[SourceKey]) -> Dict[SourceKey, str]:
+        if not keys:
+            return {}
+        clauses = " OR ".join(["(source_platform = ? AND external_id = ?)"] * len(keys))
+        parameters = []  # type: List[str]
+        for source_platform, external_id in keys:
+            parameters.extend((source_platform, external_id))
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT source_platform, external_id, candidate_id "
+                "FROM trend_candidates WHERE " + clauses,
+                parameters,
+            ).fetchall()
+        return {(row[0], row[1]): row[2] for row in rows}
@@ -1,9 +1,54 @@
+import heapq
+import sys
+from collections import deque
+from datetime import datetime
 from hashlib import sha1
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
-from money.contracts.validate_task1 import validate_contract
+from money.contracts.validate_task1 import validate_contract, validate_contract_batch
+from money.ingestion.ranking import CandidateRankingIndex
+from money.ingestion.rate_limit import TokenBucketRateLimiter
+from money.ingestion.scoring import (
+    DEFAULT_MONETIZATION_WEIGHTS,
+    MonetizationWeights,
+    score_monetization_columns,
+)
+from money.ingestion.store import CandidateStore
 
 
+DEFAULT_INGEST_CHUNK_SIZE = 1000
+
+CAPTURED_AT_FORMATS = ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%fZ")
+EPOCH = datetime(1970, 1, 1)
+
+BEAT_MAP_ARTIFACT_TEMPLATE = "artifacts/{0}/beat_map.json"
+PACING_MAP_ARTIFACT_TEMPLATE = "artifacts/{0}/pacing_map.json"
+
+TREND_CONTRACT_FIELDS = (
+    "source_platform",
+    "external_id",
+    "topic",
+    "signal_score",
+    "captured_at",
+)
+
+SCORING_FACTOR_DEFAULTS = (
+    ("engagement_velocity", 0.0),
+    ("advertiser_fit", 0.5),
+    ("region_match", 0.5),
+)
+
 FORBIDDEN_SOURCE_MEDIA_FIELDS = {
     "media_blob",
     "media_bytes",
@@ -14,13 +59,68 @@ FORBIDDEN_SOURCE_MEDIA_FIELDS = {
 }
 
 
+def _intern_platform(source_platform: str) -> str:
+    if isinstance(source_platform, str):
+        return sys.intern(source_platform)
+    return source_platform
+
+
+def _captured_at_epoch(captured_at: Any) -> Optional[float]:
+    if not isinstance(captured_at, str):
+        return None
+    for timestamp_format in CAPTURED_AT_FORMATS:
+        try:
+            parsed = datetime.strptime(captured_at, timestamp_format)
+        except ValueError:
+            continue
+        return (parsed - EPOCH).total_seconds()
+    return None
+
+
+def _tombstone_key(source_platform: str, external_id: str) -> int:
+    digest = sha1("{0}\x1f{1}".format(source_platform, external_id).encode("utf-8"))
+    return int.from_bytes(digest.digest()[:8], "little")
+
+
+def _artifact_override(
+    artifact_path: Optional[str],
+    template: str,
+    candidate_id: str,
+) -> Optional[str]:
+    if artifact_path is None or artifact_path == template.format(candidate_id):
+        return None
+    return artifact_path
+
+
 class IngestionError(Exception):
-    def __init__(self, code: str, message: str) -> None:
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        retry_after_seconds: Optional[float] = None,
+    ) -> None:
         super().__init__(message)
         self.code = code
+        self.retry_after_seconds = retry_after_seconds
 
 
 class TrendCandidate:
+    __slots__ = (
+        "candidate_id",
+        "source_platform",
+        "external_id",
+        "topic",
+        "signal_score",
+        "captured_at",
+        "monetization_score",
+        "analysis_only",
+        "engagement_velocity",
+        "advertiser_fit",
+        "region_match",
+        "_beat_map_artifact",
+        "_pacing_map_artifact",
+    )
+
     def __init__(
         self,
         candidate_id: str,
@@ -31,19 +131,61 @@ class TrendCandidate:
         captured_at: str,
         monetization_score: float,
         analysis_only: bool,
-        beat_map_artifact: str,
-        pacing_map_artifact: str,
+        beat_map_artifact: Optional[str] = None,
+        pacing_map_artifact: Optional[str] = None,
+        engagement_velocity: float = 0.0,
+        advertiser_fit: float = 0.5,
+        region_match: float = 0.5,
     ) -> None:
         self.candidate_id = candidate_id
-        self.source_platform = source_platform
+        self.source_platform = _intern_platform(source_platform)
         self.external_id = external_id
         self.topic = topic
         self.signal_score = signal_score
         self.captured_at = captured_at
         self.monetization_score = monetization_score
         self.analysis_only = analysis_only
-        self.beat_map_artifact = beat_map_artifact
-        self.pacing_map_artifact = pacing_map_artifact
+        self.engagement_velocity = engagement_velocity
+        self.advertiser_fit = advertiser_fit
+        self.region_match = region_match
+        self._beat_map_artifact = _artifact_override(
+            beat_map_artifact,
+            BEAT_MAP_ARTIFACT_TEMPLATE,
+            candidate_id,
+        )
+        self._pacing_map_artifact = _artifact_override(
+            pacing_map_artifact,
+            PACING_MAP_ARTIFACT_TEMPLATE,
+            candidate_id,
+        )
+
+    @property
+    def beat_map_artifact(self) -> str:
+        if self._beat_map_artifact is not None:
+            return self._beat_map_artifact
+        return BEAT_MAP_ARTIFACT_TEMPLATE.format(self.candidate_id)
+
+    @beat_map_artifact.setter
+    def beat_map_artifact(self, value: str) -> None:
+        self._beat_map_artifact = _artifact_override(
+            value,
+            BEAT_MAP_ARTIFACT_TEMPLATE,
+            self.candidate_id,
+        )
+
+    @property
+    def pacing_map_artifact(self) -> str:
+        if self._pacing_map_artifact is not None:
+            return self._pacing_map_artifact
+        return PACING_MAP_ARTIFACT_TEMPLATE.format(self.candidate_id)
+
+    @pacing_map_artifact.setter
+    def pacing_map_artifact(self, value: str) -> None:
+        self._pacing_map_artifact = _artifact_override(
+            value,
+            PACING_MAP_ARTIFACT_TEMPLATE,
+            self.candidate_id,
+        )
 
 
 class IngestionResult:
@@ -52,17 +194,51 @@ class IngestionResult:
         self.candidate = candidate
 
 
+class BulkIngestionResult:
+    def __init__(
+        self,
+        created_count: int,
+        duplicate_count: int,
+        rejected_count: int,
+        rejected_by_code: Dict[str, int],
+        results: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self.created_count = created_count
+        self.duplicate_count = duplicate_count
+        self.rejected_count = rejected_count
+        self.rejected_by_code = rejected_by_code
+        self.results = results
+
+    @property
+    def record_count(self) -> int:
+        return self.created_count + self.duplicate_count + self.rejected_count
+
+
 class TrendIngestionService:
     def __init__(
         self,
         max_new_candidates: int = 100,
         backoff_base_seconds: int = 2,
+        monetization_weights: MonetizationWeights = DEFAULT_MONETIZATION_WEIGHTS,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        candidate_store: Optional[CandidateStore] = None,
+        candidate_ttl_seconds: Optional[float] = None,
+        now_provider: Optional[Callable[[], datetime]] = None,
     ) -> None:
         self._candidates_by_source_id = {}  # type: Dict[Tuple[str, str], TrendCandidate]
         self._candidates_by_id = {}  # type: Dict[str, TrendCandidate]
+        self._ranking = CandidateRankingIndex()
         self._max_new_candidates = max_new_candidates
         self._backoff_base_seconds = backoff_base_seconds
         self._new_candidate_count = 0
+        self._monetization_weights = monetization_weights
+        self._rate_limiter = rate_limiter
+        self._candidate_store = candidate_store
+        self._candidate_ttl_seconds = candidate_ttl_seconds
+        self._now_provider = now_provider
+        self._expiry_heap = []  # type: List[Tuple[float, str]]
+        self._tombstones = {}  # type: Dict[int, float]
+        self._tombstone_queue = deque()  # type: Deque[Tuple[float, int]]
 
     def ingest(
         self,
@@ -80,12 +256,27 @@ class TrendIngestionService:
         backoff_attempt: int = 0,
     ) -> IngestionResult:
         self._assert_metadata_only(metadata or {})
+        self.evict_expired()
 
         key = (source_platform, external_id)
         if key in self._candidates_by_source_id:
             return IngestionResult(False, self._candidates_by_source_id[key])
+        if self._is_tombstoned(source_platform, external_id):
+            raise IngestionError(
+                code="TREND_CANDIDATE_EXPIRED",
+                message="trend candidate was evicted after its TTL elapsed",
+            )
+        if self._candidate_store is not None:
+            stored = self._candidate_store.get(source_platform, external_id)
+            if stored is not None:
+                return IngestionResult(False, TrendCandidate(**stored))
+        if self._is_stale(captured_at):
+            raise IngestionError(
+                code="TREND_CANDIDATE_EXPIRED",
+                message="captured_at is older than the candidate TTL",
+            )
 
-        self._enforce_rate_limit(backoff_attempt)
+        self._enforce_rate_limit(backoff_attempt, source_platform)
 
         candidate_id = self._candidate_id(source_platform, external_id)
         contract_payload = {
@@ -105,33 +296,265 @@ class TrendIngestionService:
             region_match=region_match,
         )
 
-        candidate = TrendCandidate(
-            candidate_id,
-            source_platform,
-            external_id,
-            topic,
-            signal_score,
-            captured_at,
-            monetization_score,
-            analysis_only,
-            "artifacts/{0}/beat_map.json".format(candidate_id),
-            "artifacts/{0}/pacing_map.json".format(candidate_id),
+        candidate = self._register_candidate(
+            contract_payload,
+            monetization_score=monetization_score,
+            analysis_only=analysis_only,
+            scoring_factors={
+                "engagement_velocity": engagement_velocity,
+                "advertiser_fit": advertiser_fit,
+                "region_match": region_match,
+            },
         )
-        self._candidates_by_source_id[key] = candidate
-        self._candidates_by_id[candidate_id] = candidate
-        self._new_candidate_count += 1
         return IngestionResult(True, candidate)
 
+    def ingest_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE,
+        include_results: bool = False,
+    ) -> BulkIngestionResult:
+        if int(chunk_size) <= 0:
+            raise IngestionError(
+                code="INGEST_CHUNK_SIZE_INVALID",
+                message="chunk_size must be greater than zero",
+            )
+
+        counts = {"created": 0, "duplicate": 0, "rejected": 0}
+        rejected_by_code = {}  # type: Dict[str, int]
+        results = [] if include_results else None  # type: Optional[List[Dict[str, Any]]]
+
+        def _record_outcome(
+            index: int,
+            status: str,
+            candidate_id: Optional[str] = None,
+            error_code: Optional[str] = None,
+        ) -> None:
+            counts[status] += 1
+            if error_code is not None:
+                rejected_by_code[error_code] = rejected_by_code.get(error_code, 0) + 1
+            if results is not None:
+                results.append(
+                    {
+                        "index": index,
+                        "status": status,
+                        "candidate_id": candidate_id,
+                        "error_code": error_code,
+                    }
+                )
+
+        indexed_records = enumerate(records)
+        while True:
+            chunk = list(islice(indexed_records, int(chunk_size)))
+            if not chunk:
+                break
+            for outcome in self._ingest_chunk(chunk):
+                _record_outcome(*outcome)
+
+        if results is not None:
+            results.sort(key=lambda item: item["index"])
+        return BulkIngestionResult(
+            created_count=counts["created"],
+            duplicate_count=counts["duplicate"],
+            rejected_count=counts["rejected"],
+            rejected_by_code=rejected_by_code,
+            results=results,
+        )
+
+    def _ingest_chunk(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+    ) -> Iterator[Tuple[int, str, Optional[str], Optional[str]]]:
+        self.evict_expired()
+        pending = []  # type: List[Tuple[int, Dict[str, Any], Dict[str, Any]]]
+        for index, record in chunk:
+            if not isinstance(record, dict):
+                yield (index, "rejected", None, "CONTRACT_TYPE_MISMATCH")
+                continue
+            try:
+                self._assert_metadata_only(record.get("metadata") or {})
+            except IngestionError as error:
+                yield (index, "rejected", None, error.code)
+                continue
+            if "analysis_only" not in record:
+                yield (index, "rejected", None, "CONTRACT_REQUIRED_FIELD")
+                continue
+            if not isinstance(record["analysis_only"], bool):
+                yield (index, "rejected", None, "CONTRACT_TYPE_MISMATCH")
+                continue
+            if not self._scoring_factors_valid(record):
+                yield (index, "rejected", None, "CONTRACT_TYPE_MISMATCH")
+                continue
+
+            source_platform = record.get("source_platform")
+            external_id = record.get("external_id")
+            if isinstance(source_platform, str) and isinstance(external_id, str):
+                existing = self._candidates_by_source_id.get(
+                    (source_platform, external_id)
+                )
+                if existing is not None:
+                    yield (index, "duplicate", existing.candidate_id, None)
+                    continue
+                if self._is_tombstoned(source_platform, external_id):
+                    yield (index, "rejected", None, "TREND_CANDIDATE_EXPIRED")
+                    continue
+
+            candidate_id = self._candidate_id(str(source_platform), str(external_id))
+            contract_payload = {
+                "candidate_id": candidate_id,
+            }  # type: Dict[str, Any]
+            for field in TREND_CONTRACT_FIELDS:
+                if field in record:
+                    contract_payload[field] = record[field]
+            pending.append((index, record, contract_payload))
+
+        if not pending:
+            return
+
+        report = validate_contract_batch(
+            "trend_candidate",
+            [contract_payload for _, _, contract_payload in pending],
+        )
+        error_code_by_position = {}  # type: Dict[int, str]
+        for entry in report["record_errors"]:
+            error_code_by_position[entry["index"]] = entry["errors"][0]["code"]
+
+        persisted_ids = {}  # type: Dict[Tuple[str, str], str]
+        if self._candidate_store is not None:
+            persisted_ids = self._candidate_store.find_existing(
+                (contract_payload["source_platform"], contract_payload["external_id"])
+                for position, (_, _, contract_payload) in enumerate(pending)
+                if position not in error_code_by_position
+            )
+
+        admitted = []  # type: List[Tuple[int, Dict[str, Any], Dict[str, Any]]]
+        admitted_ids = {}  # type: Dict[Tuple[str, str], str]
+        for position, (index, record, contract_payload) in enumerate(pending):
+            error_code = error_code_by_position.get(position)
+            if error_code is not None:
+                yield (index, "rejected", None, error_code)
+                continue
+
+            key = (contract_payload["source_platform"], contract_payload["external_id"])
+            if key in admitted_ids:
+                yield (index, "duplicate", admitted_ids[key], None)
+                continue
+            if key in persisted_ids:
+                yield (index, "duplicate", persisted_ids[key], None)
+                continue
+            if self._is_stale(contract_payload["captured_at"]):
+                yield (index, "rejected", None, "TREND_CANDIDATE_EXPIRED")
+                continue
+
+            if not self._admit_new_candidate(key[0], len(admitted)):
+                yield (index, "rejected", None, "RATE_LIMIT_BACKOFF_REQUIRED")
+                continue
+
+            admitted_ids[key] = contract_payload["candidate_id"]
+            admitted.append((index, record, contract_payload))
+
+        scores = self._rank_monetization_batch([record for _, record, _ in admitted])
+        created = []  # type: List[TrendCandidate]
+        for (_, record, contract_payload), score in zip(admitted, scores):
+            created.append(
+                self._register_candidate(
+                    contract_payload,
+                    monetization_score=score,
+                    analysis_only=record["analysis_only"],
+                    scoring_factors=record,
+                    persist=False,
+                )
+            )
+        if self._candidate_store is not None:
+            self._candidate_store.put_many(created)
+        for (index, _, _), candidate in zip(admitted, created):
+            yield (index, "created", candidate.candidate_id, None)
+
     def list_ranked_candidates(self) -> List[TrendCandidate]:
-        candidates = list(self._candidates_by_id.values())
-        candidates.sort(
-            key=lambda item: (
-                -item.monetization_score,
-                item.captured_at,
-                item.candidate_id,
+        return list(self._ranking.iter_ranked())
+
+    def top_k(
+        self,
+        k: int,
+        *,
+        publishable_only: bool = False,
+        source_platform: Optional[str] = None,
+    ) -> List[TrendCandidate]:
+        return self._ranking.top_k(
+            k,
+            publishable_only=publishable_only,
+            source_platform=source_platform,
+        )
+
+    def list_ranked_page(
+        self,
+        limit: int,
+        *,
+        cursor: Optional[str] = None,
+        publishable_only: bool = False,
+        source_platform: Optional[str] = None,
+    ) -> Tuple[List[TrendCandidate], Optional[str]]:
+        try:
+            return self._ranking.page(
+                limit,
+                cursor=cursor,
+                publishable_only=publishable_only,
+                source_platform=source_platform,
             )
+        except ValueError as error:
+            raise IngestionError(
+                code="RANKING_CURSOR_INVALID",
+                message=str(error),
+            ) from error
+
+    @property
+    def monetization_weights(self) -> MonetizationWeights:
+        return self._monetization_weights
+
+    def rescore_candidates(
+        self,
+        weights: Optional[MonetizationWeights] = None,
+    ) -> int:
+        if weights is not None:
+            self._monetization_weights = weights
+        candidates = list(self._candidates_by_id.values())
+        scores = score_monetization_columns(
+            [candidate.signal_score for candidate in candidates],
+            [candidate.engagement_velocity for candidate in candidates],
+            [candidate.advertiser_fit for candidate in candidates],
+            [candidate.region_match for candidate in candidates],
+            weights=self._monetization_weights,
         )
-        return candidates
+        for candidate, score in zip(candidates, scores):
+            candidate.monetization_score = score
+        self._ranking.rebuild(candidates)
+        return len(candidates)
+
+    def evict_expired(self) -> int:
+        cutoff = self._expiry_cutoff()
+        if cutoff is None:
+            return 0
+        self._expire_tombstones(cutoff)
+        evicted_at = cutoff + float(self._candidate_ttl_seconds or 0.0)
+        evicted = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] < cutoff:
+            _, candidate_id = heapq.heappop(heap)
+            candidate = self._candidates_by_id.pop(candidate_id, None)
+            if candidate is None:
+                continue
+            key = (candidate.source_platform, candidate.external_id)
+            self._candidates_by_source_id.pop(key, None)
+            self._ranking.remove(candidate_id)
+            tombstone = _tombstone_key(key[0], key[1])
+            self._tombstones[tombstone] = evicted_at
+            self._tombstone_queue.append((evicted_at, tombstone))
+            evicted += 1
+        return evicted
+
+    def tombstone_count(self) -> int:
+        return len(self._tombstones)
 
     def candidate_count(self) -> int:
         return len(self._candidates_by_id)
@@ -158,7 +581,7 @@ class TrendIngestionService:
         return manifest
 
     def list_publishable_candidates(self) -> List[TrendCandidate]:
-        return [candidate for candidate in self.list_ranked_candidates() if not candidate.analysis_only]
+        return list(self._ranking.iter_ranked(publishable_only=True))
 
     def _assert_metadata_only(self, metadata: Dict[str, Any]) -> None:
         for field in sorted(FORBIDDEN_SOURCE_MEDIA_FIELDS):
@@ -168,15 +591,88 @@ class TrendIngestionService:
                     message="source media reuse is forbidden for trend ingestion",
                 )
 
-    def _enforce_rate_limit(self, backoff_attempt: int) -> None:
-        if self._new_candidate_count < self._max_new_candidates:
+    def _enforce_rate_limit(self, backoff_attempt: int, source_platform: str) -> None:
+        if self._rate_limiter is not None:
+            retry_after = self._rate_limiter.try_acquire(source_platform)
+            if retry_after <= 0:
+                return
+        elif self._new_candidate_count < self._max_new_candidates:
             return
-        retry_after = self._backoff_base_seconds * (2 ** max(0, int(backoff_attempt)))
+        else:
+            backoff_exponent = max(0, int(backoff_attempt))
+            retry_after = self._backoff_base_seconds * (2**backoff_exponent)
         raise IngestionError(
             code="RATE_LIMIT_BACKOFF_REQUIRED",
             message="rate limit exceeded; retry_after_seconds={0}".format(retry_after),
+            retry_after_seconds=retry_after,
         )
 
+    def _admit_new_candidate(self, source_platform: str, admitted_count: int) -> bool:
+        if self._rate_limiter is not None:
+            return self._rate_limiter.try_acquire(source_platform) <= 0
+        return self._new_candidate_count + admitted_count < self._max_new_candidates
+
+    def _register_candidate(
+        self,
+        contract_payload: Dict[str, Any],
+        *,
+        monetization_score: float,
+        analysis_only: bool,
+        scoring_factors: Dict[str, Any],
+        persist: bool = True,
+    ) -> TrendCandidate:
+        candidate_id = contract_payload["candidate_id"]
+        candidate = TrendCandidate(
+            candidate_id,
+            contract_payload["source_platform"],
+            contract_payload["external_id"],
+            contract_payload["topic"],
+            contract_payload["signal_score"],
+            contract_payload["captured_at"],
+            monetization_score,
+            analysis_only,
+            engagement_velocity=scoring_factors.get("engagement_velocity", 0.0),
+            advertiser_fit=scoring_factors.get("advertiser_fit", 0.5),
+            region_match=scoring_factors.get("region_match", 0.5),
+        )
+        key = (candidate.source_platform, candidate.external_id)
+        self._candidates_by_source_id[key] = candidate
+        self._candidates_by_id[candidate_id] = candidate
+        self._ranking.add(candidate)
+        self._new_candidate_count += 1
+        if self._candidate_ttl_seconds is not None:
+            captured_epoch = _captured_at_epoch(candidate.captured_at)
+            if captured_epoch is not None:
+                heapq.heappush(self._expiry_heap, (captured_epoch, candidate_id))
+        if persist and self._candidate_store is not None:
+            self._candidate_store.put(candidate)
+        return candidate
+
+    def _expiry_cutoff(self) -> Optional[float]:
+        if self._candidate_ttl_seconds is None:
+            return None
+        now = self._now_provider() if self._now_provider else datetime.utcnow()
+        return (now - EPOCH).total_seconds() - self._candidate_ttl_seconds
+
+    def _is_stale(self, captured_at: Any) -> bool:
+        cutoff = self._expiry_cutoff()
+        if cutoff is None:
+            return False
+        captured_epoch = _captured_at_epoch(captured_at)
+        return captured_epoch is not None and captured_epoch < cutoff
+
+    def _expire_tombstones(self, cutoff: float) -> None:
+        queue = self._tombstone_queue
+        while queue and queue[0][0] < cutoff:
+            evicted_at, tombstone = queue.popleft()
+            if self._tombstones.get(tombstone) == evicted_at:
+                del self._tombstones[tombstone]
+
+    def _is_tombstoned(self, source_platform: str, external_id: str) -> bool:
+        if not self._tombstones:
+            return False
+        return _tombstone_key(source_platform, external_id) in self._tombstones
+
     def _candidate_id(self, source_platform: str, external_id: str) -> str:
         digest = sha1("{0}:{1}".format(source_platform, external_id).encode("utf-8")).hexdigest()
         return "trend-{0}".format(digest[:12])
@@ -193,14 +689,33 @@ class TrendIngestionService:
         bounded_velocity = self._clamp01(engagement_velocity)
         bounded_advertiser_fit = self._clamp01(advertiser_fit)
         bounded_region_match = self._clamp01(region_match)
+        weights = self._monetization_weights
         weighted_sum = (
-            (0.55 * bounded_signal)
-            + (0.25 * bounded_velocity)
-            + (0.15 * bounded_advertiser_fit)
-            + (0.05 * bounded_region_match)
+            (weights.signal * bounded_signal)
+            + (weights.engagement_velocity * bounded_velocity)
+            + (weights.advertiser_fit * bounded_advertiser_fit)
+            + (weights.region_match * bounded_region_match)
         )
         return round(weighted_sum, 6)
 
+    def _scoring_factors_valid(self, record: Dict[str, Any]) -> bool:
+        for field, _ in SCORING_FACTOR_DEFAULTS:
+            if field not in record:
+                continue
+            value = record[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False
+        return True
+
+    def _rank_monetization_batch(self, records: List[Dict[str, Any]]) -> List[float]:
+        return score_monetization_columns(
+            [record["signal_score"] for record in records],
+            [record.get("engagement_velocity", 0.0) for record in records],
+            [record.get("advertiser_fit", 0.5) for record in records],
+            [record.get("region_match", 0.5) for record in records],
+            weights=self._monetization_weights,
+        )
+
     def _clamp01(self, value: float) -> float:
         if value < 0:
             return 0.0
@@ -3,6 +3,8 @@ import json
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
+from money.contracts.policy_snapshot import PolicySnapshot, current_policy_snapshot
+
 from .policy_gate import evaluate_localized_variant_policy
 from .transcreation import SUPPORTED_LOCALES, transcreate_script
 from .voiceover import generate_voiceover_asset
@@ -29,6 +31,7 @@ def localize_and_generate_voiceover(
     similarity_score: float,
     declared_categories: Optional[Iterable[str]] = None,
     asset_root: Optional[Path] = None,
+    snapshot: Optional[PolicySnapshot] = None,
 ) -> Dict[str, object]:
     transcreated = transcreate_script(script_draft=script_draft, locale=locale)
     policy = evaluate_localized_variant_policy(
@@ -36,6 +39,7 @@ def localize_and_generate_voiceover(
         localized_script=transcreated["localized_script"],
         similarity_score=similarity_score,
         declared_categories=declared_categories,
+        snapshot=snapshot,
     )
 
     draft_id = script_draft["draft_id"]
@@ -80,7 +84,10 @@ def localize_all_supported_locales(
     similarity_score: float,
     declared_categories_by_locale: Optional[Dict[str, List[str]]] = None,
     asset_root: Optional[Path] = None,
+    snapshot: Optional[PolicySnapshot] = None,
 ) -> List[Dict[str, object]]:
+    if snapshot is None:
+        snapshot = current_policy_snapshot()
     categories_by_locale = declared_categories_by_locale or {}
     outputs = []  # type: List[Dict[str, object]]
     for locale in SUPPORTED_LOCALES:
@@ -91,6 +98,7 @@ def localize_all_supported_locales(
                 similarity_score=similarity_score,
                 declared_categories=categories_by_locale.get(locale, []),
                 asset_root=asset_root,
+                snapshot=snapshot,
             )
         )
     return outputs
@@ -1,6 +1,8 @@
 from typing import Dict, Iterable, List, Optional, Set
 
+from money.contracts.policy_snapshot import PolicySnapshot
 from money.contracts.validate_task1 import evaluate_policy
+from money.matching import get_phrase_matcher
 
 
 KEYWORD_TO_CATEGORY_BY_LOCALE = {
@@ -24,12 +26,11 @@ KEYWORD_TO_CATEGORY_BY_LOCALE = {
 
 
 def _detect_policy_categories(locale: str, localized_script: str) -> List[str]:
-    categories = set()  # type: Set[str]
-    lowered_script = localized_script.lower()
     locale_rules = KEYWORD_TO_CATEGORY_BY_LOCALE.get(locale, {})
-    for phrase, category in locale_rules.items():
-        if phrase.lower() in lowered_script:
-            categories.add(category)
+    if not locale_rules:
+        return []
+    found = get_phrase_matcher(locale_rules).find(localized_script)
+    categories = set(locale_rules[phrase] for phrase in found)  # type: Set[str]
     return sorted(categories)
 
 
@@ -48,6 +49,7 @@ def evaluate_localized_variant_policy(
     localized_script: str,
     similarity_score: float,
     declared_categories: Optional[Iterable[str]] = None,
+    snapshot: Optional[PolicySnapshot] = None,
 ) -> Dict[str, object]:
     detected = _detect_policy_categories(locale, localized_script)
     merged_categories = _merge_categories(detected, declared_categories)
@@ -55,6 +57,7 @@ def evaluate_localized_variant_policy(
         locale=locale,
         categories=merged_categories,
         similarity_score=similarity_score,
+        snapshot=snapshot,
     )
 
     status = "policy_passed"
@@ -77,4 +80,5 @@ def evaluate_localized_variant_policy(
         "categories": merged_categories,
         "similarity_score": policy_result.get("similarity_score", similarity_score),
         "originality_threshold": policy_result.get("originality_threshold"),
+        "policy_snapshot_id": policy_result["policy_snapshot_id"],
     }
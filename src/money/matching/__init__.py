@@ -0,0 +1,8 @@
+from typing import List
+
+from money.matching.phrase_matcher import PhraseMatcher, get_phrase_matcher
+
+__all__: List[str] = [
+    "PhraseMatcher",
+    "get_phrase_matcher",
+]
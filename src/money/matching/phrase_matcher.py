@@ -0,0 +1,98 @@
+import functools
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+DEFAULT_MATCHER_CACHE_SIZE = 256
+
+
+class PhraseMatcher:
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self._phrases = []  # type: List[str]
+        self._always_matched = []  # type: List[int]
+        self._goto = [{}]  # type: List[Dict[str, int]]
+        self._fail = [0]  # type: List[int]
+        self._outputs = [[]]  # type: List[List[int]]
+
+        for phrase in dict.fromkeys(phrases):
+            phrase_id = len(self._phrases)
+            self._phrases.append(phrase)
+            normalized = phrase.lower()
+            if not normalized:
+                self._always_matched.append(phrase_id)
+                continue
+            state = 0
+            for character in normalized:
+                next_state = self._goto[state].get(character)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append([])
+                    self._goto[state][character] = next_state
+                state = next_state
+            self._outputs[state].append(phrase_id)
+        self._link_failures()
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    @property
+    def phrases(self) -> List[str]:
+        return list(self._phrases)
+
+    def find(self, text: str, lowered: bool = False) -> Set[str]:
+        found = set(self._always_matched)  # type: Set[int]
+        remaining = len(self._phrases) - len(found)
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        for character in text if lowered else text.lower():
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            for phrase_id in outputs[state]:
+                if phrase_id not in found:
+                    found.add(phrase_id)
+                    remaining -= 1
+            if not remaining:
+                break
+        return set(self._phrases[phrase_id] for phrase_id in found)
+
+    def contains_any(self, text: str) -> bool:
+        if self._always_matched:
+            return True
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        for character in text.lower():
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            if outputs[state]:
+                return True
+        return False
+
+    def _link_failures(self) -> None:
+        queue = list(self._goto[0].values())
+        position = 0
+        while position < len(queue):
+            state = queue[position]
+            position += 1
+            for character, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and character not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(character, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+
+
+@functools.lru_cache(maxsize=DEFAULT_MATCHER_CACHE_SIZE)
+def _cached_matcher(phrases: FrozenSet[str]) -> PhraseMatcher:
+    return PhraseMatcher(sorted(phrases))
+
+
+def get_phrase_matcher(phrases: Iterable[str]) -> PhraseMatcher:
+    return _cached_matcher(frozenset(phrases))
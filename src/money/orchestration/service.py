@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
+from money.scene_generation.profile_selector import SeedanceProfileSelector
+
 
 ISO_DATE = "%Y-%m-%d"
 
@@ -36,6 +38,7 @@ DEFAULT_SEEDANCE_PROFILE_FALLBACK_ORDER = [
     "seedance-balanced-v1",
     "seedance-speed-v1",
 ]
+SEEDANCE_REASON_PREFIX = "SEEDANCE_"
 
 
 class OrchestrationError(Exception):
@@ -69,6 +72,7 @@ class WorkflowOrchestrationService:
         max_retries_per_stage: int = DEFAULT_RETRY_CEILING,
         retry_backoff_base_seconds: int = DEFAULT_RETRY_BACKOFF_BASE_SECONDS,
         seedance_profile_fallback_order: Optional[List[str]] = None,
+        seedance_profile_selector: Optional[SeedanceProfileSelector] = None,
     ) -> None:
         if _round_usd(per_video_budget_cap_usd) <= 0:
             raise OrchestrationError(
@@ -106,6 +110,7 @@ class WorkflowOrchestrationService:
         self._max_retries_per_stage = int(max_retries_per_stage)
         self._retry_backoff_base_seconds = int(retry_backoff_base_seconds)
         self._seedance_profile_fallback_order = normalized_order
+        self._seedance_profile_selector = seedance_profile_selector
         self._daily_spend_by_date = {}  # type: Dict[str, float]
 
     def set_daily_spend(self, *, run_date: str, spend_usd: float) -> None:
@@ -176,12 +181,17 @@ class WorkflowOrchestrationService:
 
             retry_count = 0
             stage_cost_usd = 0.0
+            attempted_profiles = []  # type: List[str]
 
             while True:
                 attempt_number = retry_count + 1
                 seedance_profile = None
                 if stage == "scene_generation":
-                    seedance_profile = self._seedance_profile_for_retry(retry_count)
+                    seedance_profile = self._seedance_profile_for_retry(
+                        retry_count,
+                        attempted_profiles,
+                    )
+                    attempted_profiles.append(seedance_profile)
                     seedance_profile_trace.append(
                         {
                             "stage": stage,
@@ -198,6 +208,7 @@ class WorkflowOrchestrationService:
                     "max_retries": self._max_retries_per_stage,
                     "run_date": normalized_date,
                     "seedance_profile": seedance_profile,
+                    "resume": stage == "scene_generation" and retry_count > 0,
                 }
 
                 call_context = dict(workflow_context)
@@ -213,6 +224,9 @@ class WorkflowOrchestrationService:
                     seedance_profile=seedance_profile,
                 )
 
+                if seedance_profile is not None:
+                    self._record_seedance_outcome(seedance_profile, normalized_result)
+
                 stage_cost_usd = _round_usd(stage_cost_usd + normalized_result["cost_usd"])
                 workflow_cost_usd = _round_usd(workflow_cost_usd + normalized_result["cost_usd"])
 
@@ -508,12 +522,44 @@ class WorkflowOrchestrationService:
             }
         return None
 
-    def _seedance_profile_for_retry(self, retry_count: int) -> str:
+    def _seedance_profile_for_retry(
+        self,
+        retry_count: int,
+        attempted_profiles: Optional[List[str]] = None,
+    ) -> str:
+        if self._seedance_profile_selector is not None:
+            return self._seedance_profile_selector.select(attempted_profiles or [])
         bounded_index = retry_count
         if bounded_index >= len(self._seedance_profile_fallback_order):
             bounded_index = len(self._seedance_profile_fallback_order) - 1
         return self._seedance_profile_fallback_order[bounded_index]
 
+    def _record_seedance_outcome(
+        self,
+        seedance_profile: str,
+        normalized_result: Dict[str, Any],
+    ) -> None:
+        selector = self._seedance_profile_selector
+        if selector is None:
+            return
+        raw_result = normalized_result["raw"]
+        if raw_result.get("seedance_stats_recorded"):
+            return
+        status = normalized_result["status"]
+        if status in ["retryable_failure", "terminal_failure"]:
+            if not normalized_result["reason_code"].startswith(SEEDANCE_REASON_PREFIX):
+                return
+        elif status != "success":
+            return
+        selector.record(
+            seedance_profile,
+            succeeded=normalized_result["status"] == "success",
+            latency_ms=raw_result.get("latency_ms"),
+            cost_usd=normalized_result["cost_usd"],
+            rendered_seconds=raw_result.get("rendered_seconds"),
+        )
+        selector.save()
+
     def _normalize_stage_result(
         self,
         *,
@@ -654,6 +700,10 @@ class DeterministicStageHandlerFactory:
                     "seedance_profile_used",
                     attempt_metadata.get("seedance_profile"),
                 )
+                response.setdefault(
+                    "resumed",
+                    bool(attempt_metadata.get("resume")),
+                )
             if stage == "localization":
                 response.setdefault("policy_result_code", "PASS")
             if stage == "review":
@@ -18,6 +18,7 @@ from money.publishing.service import (
     YouTubeShortsAdapter,
 )
 from money.review.service import PUBLISH_BLOCK_CODE, ReviewError, ReviewQueueService
+from money.scene_generation.asset_cache import get_scene_asset_cache
 from money.scene_generation.service import load_prompt_pack, run_seedance_scene_generation
 from money.script_generation.pipeline import run_script_generation_pipeline
 
@@ -157,6 +158,7 @@ def _run_full_route(mode: str, locale: str, platform: str) -> Dict[str, Any]:
         prompt_pack=prompt_pack,
         output_dir=route_dir / "scenes",
         seedance_profile="seedance-quality-v1" if mode == "mock" else "seedance-balanced-v1",
+        asset_cache=get_scene_asset_cache(),
     )
 
     localized_output = localize_and_generate_voiceover(
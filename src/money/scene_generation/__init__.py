@@ -1,14 +1,52 @@
 from typing import List
 
+from money.scene_generation.asset_cache import (
+    SceneAssetCache,
+    get_scene_asset_cache,
+    scene_cache_key,
+)
+from money.scene_generation.partial_manifest import PartialSceneManifest
+from money.scene_generation.profile_selector import SeedanceProfileSelector
+from money.scene_generation.rendering import (
+    ConcurrentSceneRenderer,
+    HttpSeedanceClient,
+    LocalSeedanceClient,
+    SeedanceClient,
+    SeedanceRenderError,
+)
+from money.scene_generation.scheduler import (
+    ClientSceneBatchEngine,
+    SceneBatchEngine,
+    SceneBatchScheduler,
+    monetization_priority,
+)
 from money.scene_generation.service import (
     SceneGenerationError,
+    iter_completed_scenes,
     load_prompt_pack,
     run_seedance_scene_generation,
 )
+from money.scene_generation.stub_server import SeedanceStubServer
 
 
 __all__: List[str] = [
+    "ClientSceneBatchEngine",
+    "ConcurrentSceneRenderer",
+    "HttpSeedanceClient",
+    "LocalSeedanceClient",
+    "PartialSceneManifest",
+    "SceneAssetCache",
+    "SceneBatchEngine",
+    "SceneBatchScheduler",
     "SceneGenerationError",
+    "SeedanceClient",
+    "SeedanceProfileSelector",
+    "SeedanceRenderError",
+    "SeedanceStubServer",
+    "get_scene_asset_cache",
+    "iter_completed_scenes",
     "load_prompt_pack",
+    "monetization_priority",
     "run_seedance_scene_generation",
+    "scene_cache_key",
 ]
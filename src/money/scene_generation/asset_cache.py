@@ -0,0 +1,107 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_ASSET_CACHE_ENTRIES = 10000
+
+
+def scene_cache_key(prompt_text: str, seedance_profile: str, duration_ms: int) -> str:
+    seed = json.dumps([prompt_text, seedance_profile, int(duration_ms)])
+    return hashlib.sha1(seed.encode("utf-8")).hexdigest()
+
+
+def _entry_size(response: Dict[str, Any]) -> int:
+    asset_bytes = response.get("asset_bytes")
+    if isinstance(asset_bytes, int) and asset_bytes >= 0:
+        return asset_bytes
+    return len(json.dumps(response, sort_keys=True).encode("utf-8"))
+
+
+class SceneAssetCache:
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_ASSET_CACHE_ENTRIES,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least one")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least one")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()  # type: OrderedDict[str, Tuple[Dict[str, Any], int]]
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return copy.deepcopy(entry[0])
+
+    def put(self, key: str, response: Dict[str, Any]) -> bool:
+        size = _entry_size(response)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            if self._max_bytes is not None and size > self._max_bytes:
+                return False
+            self._entries[key] = (copy.deepcopy(response), size)
+            self._total_bytes += size
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._total_bytes > self._max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+                self._evictions += 1
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(float(self._hits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+_DEFAULT_CACHE = None  # type: Optional[SceneAssetCache]
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_scene_asset_cache() -> SceneAssetCache:
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = SceneAssetCache()
+        return _DEFAULT_CACHE
@@ -0,0 +1,175 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from money.scene_generation.partial_manifest import PartialSceneManifest
+from money.script_generation.schemas import PackValidationError, validate_prompt_pack
+
+PHASE1_ALLOWED_ENGINE = "seedance"
+DEFAULT_SEEDANCE_PROFILE = "seedance-default-v1"
+
+
+class SceneGenerationError(Exception):
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(message)
+        self.code = code
+        self.details = details or {}
+
+
+def _stable_hash(parts: List[str]) -> str:
+    joined = "|".join(parts)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:12]
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def scene_asset_entry(
+    scene_request: Dict[str, Any],
+    scene_payload: Dict[str, Any],
+    scene_assets_dir: Path,
+) -> Dict[str, Any]:
+    return {
+        "prompt_id": scene_request["prompt_id"],
+        "beat_index": scene_request["beat_index"],
+        "scene_asset_uri": scene_payload["scene_asset_uri"],
+        "duration_ms": scene_payload["duration_ms"],
+        "seedance_profile": scene_request["seedance_profile"],
+        "scene_asset_path": str(
+            scene_assets_dir / (scene_request["asset_id"] + ".json")
+        ),
+    }
+
+
+def validate_generation_gate(prompt_pack: Dict[str, Any], engine: str) -> None:
+    if engine != PHASE1_ALLOWED_ENGINE:
+        raise SceneGenerationError(
+            code="BLOCKED_ENGINE_POLICY",
+            message="phase-1 allows only Seedance scene generation",
+        )
+
+    try:
+        validate_prompt_pack(prompt_pack)
+    except PackValidationError as error:
+        raise SceneGenerationError(
+            code="BLOCKED_PROMPT_SCHEMA_INVALID",
+            message="prompt pack schema invalid at %s (%s)" % (error.field, error.code),
+        )
+
+    quality_checks = prompt_pack.get("quality_checks", {})
+    if not bool(quality_checks.get("schema_valid", False)):
+        raise SceneGenerationError(
+            code="BLOCKED_PROMPT_SCHEMA_INVALID",
+            message="prompt pack quality_checks.schema_valid must be true",
+        )
+
+    if not bool(quality_checks.get("policy_pass", False)):
+        raise SceneGenerationError(
+            code="BLOCKED_POLICY_NOT_PASSED",
+            message="prompt pack quality_checks.policy_pass must be true",
+        )
+
+
+def resolve_seedance_profile(
+    prompt_pack: Dict[str, Any],
+    seedance_profile: Optional[str],
+) -> str:
+    profile = seedance_profile or str(prompt_pack.get("seedance_profile_id", "")).strip()
+    return profile or DEFAULT_SEEDANCE_PROFILE
+
+
+def build_scene_requests(
+    prompt_pack: Dict[str, Any],
+    profile: str,
+) -> List[Dict[str, Any]]:
+    scene_requests = []  # type: List[Dict[str, Any]]
+    for scene_prompt in prompt_pack["scene_prompts"]:
+        prompt_id = scene_prompt["prompt_id"]
+        scene_fingerprint = _stable_hash(
+            [prompt_pack["prompt_pack_id"], prompt_id, profile, scene_prompt["prompt_text"]]
+        )
+        scene_requests.append(
+            {
+                "prompt_pack_id": prompt_pack["prompt_pack_id"],
+                "prompt_id": prompt_id,
+                "beat_index": scene_prompt["beat_index"],
+                "asset_id": scene_fingerprint,
+                "prompt_text": scene_prompt["prompt_text"],
+                "duration_ms": int(scene_prompt["target_duration_ms"]),
+                "seedance_profile": profile,
+            }
+        )
+    return scene_requests
+
+
+def store_scene_payload(
+    scene_assets_dir: Path,
+    scene_request: Dict[str, Any],
+    response: Dict[str, Any],
+) -> Dict[str, Any]:
+    scene_payload = {
+        "asset_id": scene_request["asset_id"],
+        "engine": PHASE1_ALLOWED_ENGINE,
+        "prompt_id": scene_request["prompt_id"],
+        "scene_asset_uri": response["scene_asset_uri"],
+        "duration_ms": int(response.get("duration_ms", scene_request["duration_ms"])),
+        "seedance_profile": scene_request["seedance_profile"],
+        "source_prompt_text": scene_request["prompt_text"],
+    }
+    _write_json(scene_assets_dir / (scene_request["asset_id"] + ".json"), scene_payload)
+    return scene_payload
+
+
+def build_generation_result(
+    prompt_pack: Dict[str, Any],
+    profile: str,
+    scene_requests: List[Dict[str, Any]],
+    scene_payloads: Dict[str, Dict[str, Any]],
+    scene_assets_dir: Path,
+) -> Dict[str, Any]:
+    return {
+        "status": "generated",
+        "result_code": "PASS",
+        "engine": PHASE1_ALLOWED_ENGINE,
+        "prompt_pack_id": prompt_pack["prompt_pack_id"],
+        "seedance_profile": profile,
+        "scene_assets": [
+            scene_asset_entry(
+                scene_request,
+                scene_payloads[scene_request["asset_id"]],
+                scene_assets_dir,
+            )
+            for scene_request in sorted(
+                scene_requests,
+                key=lambda item: item["beat_index"],
+            )
+        ],
+    }
+
+
+def write_generation_result(
+    output_dir: Path,
+    generation_result: Dict[str, Any],
+    partial_manifest: PartialSceneManifest,
+) -> Path:
+    generation_manifest_path = _write_json(
+        output_dir / "scene_generation.json",
+        generation_result,
+    )
+    generation_result["scene_generation_path"] = str(generation_manifest_path)
+    partial_manifest.finalize(
+        {
+            "prompt_pack_id": generation_result["prompt_pack_id"],
+            "scene_generation_path": str(generation_manifest_path),
+        }
+    )
+    return generation_manifest_path
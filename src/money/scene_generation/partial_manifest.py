@@ -0,0 +1,109 @@
+import json
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
+
+PARTIAL_MANIFEST_FILENAME = "scene_generation.partial.ndjson"
+ENTRY_KIND_SCENE = "scene"
+ENTRY_KIND_FINALIZED = "finalized"
+
+
+def partial_manifest_path(output_dir: Path) -> Path:
+    return Path(output_dir) / PARTIAL_MANIFEST_FILENAME
+
+
+def _encode_entry(entry: Dict[str, Any]) -> bytes:
+    return (json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n").encode(
+        "utf-8"
+    )
+
+
+def read_partial_entries(
+    path: Path,
+    offset: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    path = Path(path)
+    if not path.exists():
+        return [], offset
+    entries = []  # type: List[Dict[str, Any]]
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                entry = json.loads(line.decode("utf-8"))
+            except ValueError:
+                break
+            offset += len(line)
+            if isinstance(entry, dict):
+                entries.append(entry)
+    return entries, offset
+
+
+class PartialSceneManifest:
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._handle = None  # type: Optional[IO[bytes]]
+        self._scene_count = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def scene_count(self) -> int:
+        return self._scene_count
+
+    def start(self, completed_scenes: Iterable[Dict[str, Any]] = ()) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        encoded = [
+            _encode_entry(dict(scene, kind=ENTRY_KIND_SCENE))
+            for scene in completed_scenes
+        ]
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        temp_path.write_bytes(b"".join(encoded))
+        temp_path.replace(self._path)
+        with self._lock:
+            self._close_handle()
+            self._handle = self._path.open("ab")
+            self._scene_count = len(encoded)
+
+    def append(self, scene: Dict[str, Any]) -> None:
+        encoded = _encode_entry(dict(scene, kind=ENTRY_KIND_SCENE))
+        with self._lock:
+            handle = self._require_handle()
+            handle.write(encoded)
+            handle.flush()
+            self._scene_count += 1
+
+    def finalize(self, summary: Dict[str, Any]) -> None:
+        encoded = _encode_entry(
+            dict(summary, kind=ENTRY_KIND_FINALIZED, scene_count=self._scene_count)
+        )
+        with self._lock:
+            handle = self._require_handle()
+            handle.write(encoded)
+            handle.flush()
+            self._close_handle()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def __enter__(self) -> "PartialSceneManifest":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _require_handle(self) -> IO[bytes]:
+        if self._handle is None:
+            raise RuntimeError("partial scene manifest is not open")
+        return self._handle
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
@@ -0,0 +1,210 @@
+import json
+import math
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+DEFAULT_PROFILE_STATS_WINDOW = 50
+DEFAULT_MIN_SUCCESS_RATE = 0.8
+DEFAULT_MIN_PROFILE_SAMPLES = 5
+PROFILE_STATS_VERSION = 1
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    rank = int(math.ceil(percentile / 100.0 * len(sorted_values)))
+    return sorted_values[max(rank, 1) - 1]
+
+
+class SeedanceProfileSelector:
+    def __init__(
+        self,
+        profiles: Sequence[str],
+        latency_target_ms: Optional[float] = None,
+        cost_target_usd_per_second: Optional[float] = None,
+        min_success_rate: float = DEFAULT_MIN_SUCCESS_RATE,
+        min_samples: int = DEFAULT_MIN_PROFILE_SAMPLES,
+        window_size: int = DEFAULT_PROFILE_STATS_WINDOW,
+        stats_path: Optional[Path] = None,
+    ) -> None:
+        normalized = []  # type: List[str]
+        for profile in profiles:
+            value = str(profile).strip()
+            if value and value not in normalized:
+                normalized.append(value)
+        if not normalized:
+            raise ValueError("profile selector requires at least one profile")
+        if window_size < 1:
+            raise ValueError("window_size must be at least one")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least one")
+        if not 0.0 <= min_success_rate <= 1.0:
+            raise ValueError("min_success_rate must be between zero and one")
+        self._profiles = normalized
+        self._latency_target_ms = latency_target_ms
+        self._cost_target_usd_per_second = cost_target_usd_per_second
+        self._min_success_rate = min_success_rate
+        self._min_samples = min_samples
+        self._window_size = window_size
+        self._stats_path = Path(stats_path) if stats_path is not None else None
+        self._lock = threading.Lock()
+        self._observations = {}  # type: Dict[str, Deque[Dict[str, Any]]]
+        if self._stats_path is not None and self._stats_path.exists():
+            self._load(self._stats_path)
+
+    @property
+    def profiles(self) -> List[str]:
+        return list(self._profiles)
+
+    def record(
+        self,
+        profile: str,
+        succeeded: bool,
+        latency_ms: Optional[float] = None,
+        cost_usd: Optional[float] = None,
+        rendered_seconds: Optional[float] = None,
+    ) -> None:
+        cost_per_second = None  # type: Optional[float]
+        if cost_usd is not None and rendered_seconds:
+            cost_per_second = float(cost_usd) / float(rendered_seconds)
+        observation = {
+            "succeeded": bool(succeeded),
+            "latency_ms": float(latency_ms) if latency_ms is not None else None,
+            "cost_per_second_usd": cost_per_second,
+        }
+        with self._lock:
+            self._window(profile).append(observation)
+
+    def profile_stats(self, profile: str) -> Dict[str, Any]:
+        with self._lock:
+            observations = list(self._observations.get(profile, []))
+        sample_count = len(observations)
+        latencies = sorted(
+            item["latency_ms"]
+            for item in observations
+            if item["latency_ms"] is not None
+        )
+        costs = [
+            item["cost_per_second_usd"]
+            for item in observations
+            if item["cost_per_second_usd"] is not None
+        ]
+        return {
+            "sample_count": sample_count,
+            "success_rate": (
+                round(
+                    float(sum(1 for item in observations if item["succeeded"]))
+                    / sample_count,
+                    4,
+                )
+                if sample_count
+                else None
+            ),
+            "p50_latency_ms": _percentile(latencies, 50),
+            "p95_latency_ms": _percentile(latencies, 95),
+            "cost_per_second_usd": (
+                round(sum(costs) / len(costs), 6) if costs else None
+            ),
+        }
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            profiles = sorted(set(self._profiles) | set(self._observations))
+        return {profile: self.profile_stats(profile) for profile in profiles}
+
+    def meets_targets(self, profile: str) -> bool:
+        stats = self.profile_stats(profile)
+        if stats["sample_count"] < self._min_samples:
+            return True
+        if stats["success_rate"] < self._min_success_rate:
+            return False
+        if (
+            self._latency_target_ms is not None
+            and stats["p95_latency_ms"] is not None
+            and stats["p95_latency_ms"] > self._latency_target_ms
+        ):
+            return False
+        if (
+            self._cost_target_usd_per_second is not None
+            and stats["cost_per_second_usd"] is not None
+            and stats["cost_per_second_usd"] > self._cost_target_usd_per_second
+        ):
+            return False
+        return True
+
+    def ranked_profiles(self) -> List[str]:
+        eligible = [
+            profile for profile in self._profiles if self.meets_targets(profile)
+        ]
+        degraded = [profile for profile in self._profiles if profile not in eligible]
+        degraded.sort(key=self._degraded_rank)
+        return eligible + degraded
+
+    def select(self, exclude: Sequence[str] = ()) -> str:
+        ranked = self.ranked_profiles()
+        for profile in ranked:
+            if profile not in exclude:
+                return profile
+        return ranked[-1]
+
+    def save(self) -> Optional[Path]:
+        if self._stats_path is None:
+            return None
+        with self._lock:
+            document = {
+                "version": PROFILE_STATS_VERSION,
+                "window_size": self._window_size,
+                "profiles": {
+                    profile: list(observations)
+                    for profile, observations in sorted(self._observations.items())
+                },
+            }
+        self._stats_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._stats_path.with_name(self._stats_path.name + ".tmp")
+        temp_path.write_text(
+            json.dumps(document, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        temp_path.replace(self._stats_path)
+        return self._stats_path
+
+    def _window(self, profile: str) -> Deque[Dict[str, Any]]:
+        window = self._observations.get(profile)
+        if window is None:
+            window = deque(maxlen=self._window_size)
+            self._observations[profile] = window
+        return window
+
+    def _degraded_rank(self, profile: str) -> Any:
+        stats = self.profile_stats(profile)
+        p95 = stats["p95_latency_ms"]
+        return (
+            -(stats["success_rate"] or 0.0),
+            p95 if p95 is not None else float("inf"),
+            self._profiles.index(profile),
+        )
+
+    def _load(self, path: Path) -> None:
+        try:
+            document = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            return
+        if not isinstance(document, dict):
+            return
+        if document.get("version") != PROFILE_STATS_VERSION:
+            return
+        for profile, observations in dict(document.get("profiles", {})).items():
+            window = self._window(str(profile))
+            for observation in observations:
+                if isinstance(observation, dict) and "succeeded" in observation:
+                    window.append(
+                        {
+                            "succeeded": bool(observation["succeeded"]),
+                            "latency_ms": observation.get("latency_ms"),
+                            "cost_per_second_usd": observation.get(
+                                "cost_per_second_usd"
+                            ),
+                        }
+                    )
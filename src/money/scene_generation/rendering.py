@@ -0,0 +1,183 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+DEFAULT_RENDER_WORKERS = 8
+DEFAULT_PROFILE_CONCURRENCY = 4
+DEFAULT_HTTP_TIMEOUT_SECONDS = 30.0
+SEEDANCE_RENDER_PATH = "/v1/scenes"
+
+RenderCallback = Callable[[Dict[str, Any], Dict[str, Any], float], None]
+FailureCallback = Callable[[Dict[str, Any], "SeedanceRenderError", float], None]
+
+
+class SeedanceRenderError(Exception):
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def seedance_asset_uri(prompt_pack_id: str, asset_id: str) -> str:
+    return "seedance://{0}/{1}.mp4".format(prompt_pack_id, asset_id)
+
+
+class SeedanceClient:
+    def render_scene(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return None
+
+
+class LocalSeedanceClient(SeedanceClient):
+    def render_scene(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "scene_asset_uri": seedance_asset_uri(
+                request["prompt_pack_id"],
+                request["asset_id"],
+            ),
+            "duration_ms": int(request["duration_ms"]),
+        }
+
+
+class HttpSeedanceClient(SeedanceClient):
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: float = DEFAULT_HTTP_TIMEOUT_SECONDS,
+    ) -> None:
+        self._endpoint = base_url.rstrip("/") + SEEDANCE_RENDER_PATH
+        self._timeout_seconds = timeout_seconds
+
+    def render_scene(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        http_request = urllib.request.Request(
+            self._endpoint,
+            data=json.dumps(request, sort_keys=True).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(
+                http_request,
+                timeout=self._timeout_seconds,
+            ) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as error:
+            raise SeedanceRenderError(
+                code="SEEDANCE_RENDER_REJECTED",
+                message="seedance rejected beat %s with HTTP %d"
+                % (request.get("beat_index"), error.code),
+            )
+        except (urllib.error.URLError, OSError, ValueError) as error:
+            raise SeedanceRenderError(
+                code="SEEDANCE_RENDER_UNAVAILABLE",
+                message="seedance render failed for beat %s: %s"
+                % (request.get("beat_index"), error),
+            )
+        if not isinstance(payload, dict) or not payload.get("scene_asset_uri"):
+            raise SeedanceRenderError(
+                code="SEEDANCE_RENDER_INVALID_RESPONSE",
+                message="seedance response for beat %s has no scene_asset_uri"
+                % request.get("beat_index"),
+            )
+        return payload
+
+
+class ConcurrentSceneRenderer:
+    def __init__(
+        self,
+        client: Optional[SeedanceClient] = None,
+        max_workers: int = DEFAULT_RENDER_WORKERS,
+        profile_concurrency: Optional[Dict[str, int]] = None,
+        default_profile_concurrency: int = DEFAULT_PROFILE_CONCURRENCY,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least one")
+        if default_profile_concurrency < 1:
+            raise ValueError("default_profile_concurrency must be at least one")
+        for profile, limit in (profile_concurrency or {}).items():
+            if limit < 1:
+                raise ValueError(
+                    "concurrency limit for %s must be at least one" % profile
+                )
+        self._client = client or LocalSeedanceClient()
+        self._max_workers = max_workers
+        self._profile_concurrency = dict(profile_concurrency or {})
+        self._default_profile_concurrency = default_profile_concurrency
+        self._semaphores = {}  # type: Dict[str, threading.BoundedSemaphore]
+        self._semaphores_lock = threading.Lock()
+
+    @property
+    def client(self) -> SeedanceClient:
+        return self._client
+
+    def profile_limit(self, profile: str) -> int:
+        return self._profile_concurrency.get(profile, self._default_profile_concurrency)
+
+    def render(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        on_rendered: Optional[RenderCallback] = None,
+        on_failed: Optional[FailureCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        if not requests:
+            return []
+        results = [{} for _ in requests]  # type: List[Dict[str, Any]]
+        worker_count = min(self._max_workers, len(requests))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(
+                    self._render_one,
+                    position,
+                    request,
+                    results,
+                    on_rendered,
+                    on_failed,
+                )
+                for position, request in enumerate(requests)
+            ]
+            pending = wait(futures, return_when=FIRST_EXCEPTION).not_done
+            for future in pending:
+                future.cancel()
+        for future in futures:
+            if future.cancelled():
+                continue
+            future.result()
+        order = sorted(
+            range(len(requests)),
+            key=lambda position: requests[position]["beat_index"],
+        )
+        return [results[position] for position in order]
+
+    def _render_one(
+        self,
+        position: int,
+        request: Dict[str, Any],
+        results: List[Dict[str, Any]],
+        on_rendered: Optional[RenderCallback],
+        on_failed: Optional[FailureCallback],
+    ) -> None:
+        with self._semaphore(request["seedance_profile"]):
+            started = time.monotonic()
+            try:
+                response = self._client.render_scene(request)
+            except SeedanceRenderError as error:
+                if on_failed is not None:
+                    on_failed(request, error, (time.monotonic() - started) * 1000.0)
+                raise
+            latency_ms = (time.monotonic() - started) * 1000.0
+        if on_rendered is not None:
+            on_rendered(request, response, latency_ms)
+        results[position] = response
+
+    def _semaphore(self, profile: str) -> threading.BoundedSemaphore:
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(profile)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.profile_limit(profile))
+                self._semaphores[profile] = semaphore
+        return semaphore
@@ -0,0 +1,353 @@
+import heapq
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from money.scene_generation.assets import (
+    PHASE1_ALLOWED_ENGINE,
+    SceneGenerationError,
+    build_generation_result,
+    build_scene_requests,
+    resolve_seedance_profile,
+    scene_asset_entry,
+    store_scene_payload,
+    validate_generation_gate,
+    write_generation_result,
+)
+from money.scene_generation.partial_manifest import (
+    PartialSceneManifest,
+    partial_manifest_path,
+)
+from money.scene_generation.rendering import (
+    LocalSeedanceClient,
+    SeedanceClient,
+    SeedanceRenderError,
+)
+
+DEFAULT_SCENE_BATCH_SIZE = 16
+DEFAULT_SCENE_BATCH_MAX_WAIT_SECONDS = 2.0
+
+PriorityFunction = Callable[[Dict[str, Any], Optional[Dict[str, Any]]], float]
+QueuedScene = Tuple[float, int, str]
+QueuedEntry = Tuple[float, str, Dict[str, Any]]
+
+
+def monetization_priority(
+    prompt_pack: Dict[str, Any],
+    trend_candidate: Optional[Dict[str, Any]],
+) -> float:
+    source = trend_candidate if trend_candidate is not None else prompt_pack
+    try:
+        return float(source.get("monetization_score", 0.0) or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class SceneBatchEngine:
+    def render_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return None
+
+
+class ClientSceneBatchEngine(SceneBatchEngine):
+    def __init__(self, client: Optional[SeedanceClient] = None) -> None:
+        self._client = client or LocalSeedanceClient()
+
+    def render_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self._client.render_scene(request) for request in requests]
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class _ScheduledPack:
+    def __init__(
+        self,
+        prompt_pack: Dict[str, Any],
+        output_dir: Path,
+        profile: str,
+        scene_requests: List[Dict[str, Any]],
+        priority: float,
+    ) -> None:
+        self.prompt_pack = prompt_pack
+        self.output_dir = Path(output_dir)
+        self.profile = profile
+        self.scene_requests = scene_requests
+        self.priority = priority
+        self.scene_assets_dir = self.output_dir / "scene_assets"
+        self.scene_payloads = {}  # type: Dict[str, Dict[str, Any]]
+        self.remaining = set(request["asset_id"] for request in scene_requests)
+        self.batch_count = 0
+        self.partial_manifest = PartialSceneManifest(
+            partial_manifest_path(self.output_dir)
+        )
+
+
+class SceneBatchScheduler:
+    def __init__(
+        self,
+        engine: Optional[SceneBatchEngine] = None,
+        max_batch_size: int = DEFAULT_SCENE_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_SCENE_BATCH_MAX_WAIT_SECONDS,
+        priority: Optional[PriorityFunction] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least one")
+        if max_wait_seconds < 0:
+            raise ValueError("max_wait_seconds must be zero or greater")
+        self._engine = engine or ClientSceneBatchEngine()
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._priority = priority or monetization_priority
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._queues = {}  # type: Dict[str, List[QueuedScene]]
+        self._arrivals = {}  # type: Dict[str, Deque[Tuple[float, str]]]
+        self._queued = {}  # type: Dict[str, QueuedEntry]
+        self._packs = {}  # type: Dict[str, _ScheduledPack]
+        self._sequence = 0
+        self._batch_count = 0
+        self._dispatched_scene_count = 0
+
+    def submit(
+        self,
+        prompt_pack: Dict[str, Any],
+        output_dir: Path,
+        trend_candidate: Optional[Dict[str, Any]] = None,
+        seedance_profile: Optional[str] = None,
+    ) -> int:
+        validate_generation_gate(prompt_pack=prompt_pack, engine=PHASE1_ALLOWED_ENGINE)
+        profile = resolve_seedance_profile(prompt_pack, seedance_profile)
+        prompt_pack_id = str(prompt_pack["prompt_pack_id"])
+        scene_requests = build_scene_requests(prompt_pack, profile)
+        priority = float(self._priority(prompt_pack, trend_candidate))
+        with self._lock:
+            if prompt_pack_id in self._packs:
+                raise SceneGenerationError(
+                    code="SCENE_PACK_ALREADY_SCHEDULED",
+                    message="prompt pack %s is already scheduled" % prompt_pack_id,
+                )
+            pack = _ScheduledPack(
+                prompt_pack,
+                output_dir,
+                profile,
+                scene_requests,
+                priority,
+            )
+            pack.partial_manifest.start()
+            self._packs[prompt_pack_id] = pack
+            enqueued_at = self._clock()
+            queue = self._queues.setdefault(profile, [])
+            arrivals = self._arrivals.setdefault(profile, deque())
+            for scene_request in scene_requests:
+                self._sequence += 1
+                heapq.heappush(
+                    queue,
+                    (-priority, self._sequence, scene_request["asset_id"]),
+                )
+                arrivals.append((enqueued_at, scene_request["asset_id"]))
+                self._queued[scene_request["asset_id"]] = (
+                    enqueued_at,
+                    prompt_pack_id,
+                    scene_request,
+                )
+        return len(scene_requests)
+
+    def queued_count(self, seedance_profile: Optional[str] = None) -> int:
+        with self._lock:
+            if seedance_profile is not None:
+                return len(self._queues.get(seedance_profile, []))
+            return len(self._queued)
+
+    def seconds_until_due(self) -> Optional[float]:
+        with self._lock:
+            if not self._queued:
+                return None
+            now = self._clock()
+            due_in = []  # type: List[float]
+            for profile, queue in self._queues.items():
+                if len(queue) >= self._max_batch_size:
+                    return 0.0
+                if queue:
+                    waited = now - self._oldest_enqueued_at(profile)
+                    due_in.append(self._max_wait_seconds - waited)
+            return max(0.0, min(due_in))
+
+    def poll(self) -> List[Dict[str, Any]]:
+        return self._dispatch(force=False)
+
+    def flush(self) -> List[Dict[str, Any]]:
+        return self._dispatch(force=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queued_scenes": len(self._queued),
+                "pending_packs": len(self._packs),
+                "dispatched_batches": self._batch_count,
+                "dispatched_scenes": self._dispatched_scene_count,
+                "mean_batch_size": (
+                    round(float(self._dispatched_scene_count) / self._batch_count, 4)
+                    if self._batch_count
+                    else 0.0
+                ),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            for pack in self._packs.values():
+                pack.partial_manifest.close()
+        self._engine.close()
+
+    def __enter__(self) -> "SceneBatchScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _oldest_enqueued_at(self, profile: str) -> float:
+        arrivals = self._arrivals[profile]
+        while arrivals[0][1] not in self._queued:
+            arrivals.popleft()
+        return arrivals[0][0]
+
+    def _batch_due(self, profile: str, now: float, force: bool) -> bool:
+        queue = self._queues[profile]
+        if not queue:
+            return False
+        return (
+            force
+            or len(queue) >= self._max_batch_size
+            or now - self._oldest_enqueued_at(profile) >= self._max_wait_seconds
+        )
+
+    def _next_batch(self, force: bool) -> Optional[List[QueuedEntry]]:
+        now = self._clock()
+        for profile in sorted(self._queues):
+            if self._batch_due(profile, now, force):
+                queue = self._queues[profile]
+                batch_size = min(self._max_batch_size, len(queue))
+                return [
+                    self._queued.pop(heapq.heappop(queue)[2])
+                    for _ in range(batch_size)
+                ]
+        return None
+
+    def _dispatch(self, force: bool) -> List[Dict[str, Any]]:
+        results = []  # type: List[Dict[str, Any]]
+        while True:
+            with self._lock:
+                entries = self._next_batch(force)
+            if entries is None:
+                return results
+            results.extend(self._dispatch_batch(entries))
+
+    def _dispatch_batch(self, entries: List[QueuedEntry]) -> List[Dict[str, Any]]:
+        scene_requests = [scene_request for _, _, scene_request in entries]
+        batch_pack_ids = []  # type: List[str]
+        for _, prompt_pack_id, _ in entries:
+            if prompt_pack_id not in batch_pack_ids:
+                batch_pack_ids.append(prompt_pack_id)
+
+        try:
+            responses = self._engine.render_batch(scene_requests)
+            if len(responses) != len(scene_requests):
+                raise SeedanceRenderError(
+                    code="SEEDANCE_BATCH_RESPONSE_MISMATCH",
+                    message="seedance returned %d responses for a batch of %d scenes"
+                    % (len(responses), len(scene_requests)),
+                )
+        except Exception as error:
+            with self._lock:
+                return [
+                    self._fail_pack(prompt_pack_id, error)
+                    for prompt_pack_id in batch_pack_ids
+                    if prompt_pack_id in self._packs
+                ]
+
+        with self._lock:
+            self._batch_count += 1
+            self._dispatched_scene_count += len(scene_requests)
+            for prompt_pack_id in batch_pack_ids:
+                if prompt_pack_id in self._packs:
+                    self._packs[prompt_pack_id].batch_count += 1
+
+            completed = []  # type: List[Dict[str, Any]]
+            for (_, prompt_pack_id, scene_request), response in zip(entries, responses):
+                pack = self._packs.get(prompt_pack_id)
+                if pack is None:
+                    continue
+                scene_payload = store_scene_payload(
+                    pack.scene_assets_dir,
+                    scene_request,
+                    response,
+                )
+                pack.scene_payloads[scene_request["asset_id"]] = scene_payload
+                pack.partial_manifest.append(
+                    dict(
+                        scene_asset_entry(
+                            scene_request,
+                            scene_payload,
+                            pack.scene_assets_dir,
+                        ),
+                        asset_id=scene_request["asset_id"],
+                    )
+                )
+                pack.remaining.discard(scene_request["asset_id"])
+                if not pack.remaining:
+                    completed.append(self._complete_pack(prompt_pack_id))
+            return completed
+
+    def _complete_pack(self, prompt_pack_id: str) -> Dict[str, Any]:
+        pack = self._packs.pop(prompt_pack_id)
+        generation_result = build_generation_result(
+            pack.prompt_pack,
+            pack.profile,
+            pack.scene_requests,
+            pack.scene_payloads,
+            pack.scene_assets_dir,
+        )
+        generation_result["scheduled_priority"] = pack.priority
+        generation_result["batch_count"] = pack.batch_count
+        write_generation_result(
+            pack.output_dir,
+            generation_result,
+            pack.partial_manifest,
+        )
+        return generation_result
+
+    def _fail_pack(
+        self,
+        prompt_pack_id: str,
+        error: Exception,
+    ) -> Dict[str, Any]:
+        pack = self._packs.pop(prompt_pack_id)
+        dropped = set()  # type: Set[str]
+        for asset_id in pack.remaining:
+            if self._queued.pop(asset_id, None) is not None:
+                dropped.add(asset_id)
+        if dropped:
+            queue = [
+                entry for entry in self._queues[pack.profile] if entry[2] not in dropped
+            ]
+            heapq.heapify(queue)
+            self._queues[pack.profile] = queue
+        pack.partial_manifest.close()
+        return {
+            "status": "failed",
+            "result_code": "FAILED",
+            "reason_code": (
+                error.code
+                if isinstance(error, SeedanceRenderError)
+                else "SCENE_BATCH_RENDER_FAILED"
+            ),
+            "message": str(error),
+            "prompt_pack_id": prompt_pack_id,
+            "seedance_profile": pack.profile,
+            "completed_scene_count": len(pack.scene_payloads),
+        }
@@ -1,63 +1,90 @@
-import hashlib
 import json
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from money.script_generation.schemas import PackValidationError, validate_prompt_pack
+from money.contracts.build_manifest import BuildManifest, compute_input_digest
+from money.scene_generation.asset_cache import SceneAssetCache, scene_cache_key
+from money.scene_generation.assets import (
+    PHASE1_ALLOWED_ENGINE,
+    SceneGenerationError,
+    build_generation_result,
+    build_scene_requests,
+    resolve_seedance_profile,
+    scene_asset_entry,
+    store_scene_payload,
+    validate_generation_gate,
+    write_generation_result,
+)
+from money.scene_generation.partial_manifest import (
+    ENTRY_KIND_FINALIZED,
+    ENTRY_KIND_SCENE,
+    PartialSceneManifest,
+    partial_manifest_path,
+    read_partial_entries,
+)
+from money.scene_generation.profile_selector import SeedanceProfileSelector
+from money.scene_generation.rendering import (
+    ConcurrentSceneRenderer,
+    SeedanceRenderError,
+)
 
 
-PHASE1_ALLOWED_ENGINE = "seedance"
-DEFAULT_SEEDANCE_PROFILE = "seedance-default-v1"
-
-
-class SceneGenerationError(Exception):
-    def __init__(self, code: str, message: str) -> None:
-        super().__init__(message)
-        self.code = code
-
-
-def _stable_hash(parts: List[str]) -> str:
-    joined = "|".join(parts)
-    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:12]
-
-
-def _write_json(path: Path, payload: Dict[str, Any]) -> Path:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-    return path
+DEFAULT_STREAM_POLL_SECONDS = 0.05
 
 
 def load_prompt_pack(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def _validate_generation_gate(prompt_pack: Dict[str, Any], engine: str) -> None:
-    if engine != PHASE1_ALLOWED_ENGINE:
-        raise SceneGenerationError(
-            code="BLOCKED_ENGINE_POLICY",
-            message="phase-1 allows only Seedance scene generation",
-        )
-
+def _load_resumable_scene(
+    scene_file: Path,
+    scene_request: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    if not scene_file.exists():
+        return None
     try:
-        validate_prompt_pack(prompt_pack)
-    except PackValidationError as error:
-        raise SceneGenerationError(
-            code="BLOCKED_PROMPT_SCHEMA_INVALID",
-            message="prompt pack schema invalid at %s (%s)" % (error.field, error.code),
-        )
+        scene_payload = json.loads(scene_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(scene_payload, dict) or not scene_payload.get("scene_asset_uri"):
+        return None
+    if (
+        scene_payload.get("asset_id") != scene_request["asset_id"]
+        or scene_payload.get("seedance_profile") != scene_request["seedance_profile"]
+        or scene_payload.get("source_prompt_text") != scene_request["prompt_text"]
+    ):
+        return None
+    return scene_payload
 
-    quality_checks = prompt_pack.get("quality_checks", {})
-    if not bool(quality_checks.get("schema_valid", False)):
-        raise SceneGenerationError(
-            code="BLOCKED_PROMPT_SCHEMA_INVALID",
-            message="prompt pack quality_checks.schema_valid must be true",
-        )
 
-    if not bool(quality_checks.get("policy_pass", False)):
-        raise SceneGenerationError(
-            code="BLOCKED_POLICY_NOT_PASSED",
-            message="prompt pack quality_checks.policy_pass must be true",
-        )
+def iter_completed_scenes(
+    output_dir: Path,
+    follow: bool = False,
+    poll_interval_seconds: float = DEFAULT_STREAM_POLL_SECONDS,
+    timeout_seconds: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    path = partial_manifest_path(output_dir)
+    deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+    offset = 0
+    while True:
+        entries, offset = read_partial_entries(path, offset)
+        for entry in entries:
+            if entry.get("kind") == ENTRY_KIND_FINALIZED:
+                return
+            if entry.get("kind") == ENTRY_KIND_SCENE:
+                scene = dict(entry)
+                scene.pop("kind")
+                yield scene
+        if not follow:
+            return
+        if deadline is not None and time.monotonic() >= deadline:
+            raise SceneGenerationError(
+                code="SCENE_STREAM_TIMEOUT",
+                message="scene generation in %s did not finalize within %ss"
+                % (output_dir, timeout_seconds),
+            )
+        time.sleep(poll_interval_seconds)
 
 
 def run_seedance_scene_generation(
@@ -65,63 +92,255 @@ def run_seedance_scene_generation(
     output_dir: Path,
     engine: str = PHASE1_ALLOWED_ENGINE,
     seedance_profile: Optional[str] = None,
+    incremental: bool = False,
+    renderer: Optional[ConcurrentSceneRenderer] = None,
+    asset_cache: Optional[SceneAssetCache] = None,
+    resume: bool = False,
+    profile_selector: Optional[SeedanceProfileSelector] = None,
 ) -> Dict[str, Any]:
-    _validate_generation_gate(prompt_pack=prompt_pack, engine=engine)
+    if seedance_profile is None and profile_selector is not None:
+        seedance_profile = profile_selector.select()
+    profile = resolve_seedance_profile(prompt_pack, seedance_profile)
+
+    manifest = None  # type: Optional[BuildManifest]
+    generation_digest = ""
+    if incremental:
+        manifest = BuildManifest.for_output_dir(output_dir)
+        generation_digest = compute_input_digest(
+            {"engine": engine, "seedance_profile": profile, "prompt_pack": prompt_pack}
+        )
+        cached = manifest.lookup("scene_generation", generation_digest)
+        if cached is not None:
+            cached["rebuilt_artifacts"] = []
+            return cached
+
+    validate_generation_gate(prompt_pack=prompt_pack, engine=engine)
+
+    scene_assets_dir = output_dir / "scene_assets"
+    scene_requests = build_scene_requests(prompt_pack, profile)
+
+    scene_payloads = {}  # type: Dict[str, Dict[str, Any]]
+    pending_requests = []  # type: List[Dict[str, Any]]
+    for scene_request in scene_requests:
+        cached_payload = None  # type: Optional[Dict[str, Any]]
+        if manifest is not None:
+            cached_payload = manifest.lookup(
+                "scene_asset:%s" % scene_request["asset_id"],
+                compute_input_digest(scene_request),
+            )
+        if cached_payload is None:
+            pending_requests.append(scene_request)
+        else:
+            scene_payloads[scene_request["asset_id"]] = cached_payload
 
-    profile = seedance_profile or str(prompt_pack.get("seedance_profile_id", "")).strip()
-    if not profile:
-        profile = DEFAULT_SEEDANCE_PROFILE
+    resumed_requests = []  # type: List[Dict[str, Any]]
+    if resume:
+        unfinished_requests = []  # type: List[Dict[str, Any]]
+        for scene_request in pending_requests:
+            resumed_payload = _load_resumable_scene(
+                scene_assets_dir / (scene_request["asset_id"] + ".json"),
+                scene_request,
+            )
+            if resumed_payload is None:
+                unfinished_requests.append(scene_request)
+            else:
+                scene_payloads[scene_request["asset_id"]] = resumed_payload
+                resumed_requests.append(scene_request)
+        pending_requests = unfinished_requests
 
+    partial_manifest = PartialSceneManifest(partial_manifest_path(output_dir))
+    partial_manifest.start(
+        dict(
+            scene_asset_entry(
+                scene_request,
+                scene_payloads[scene_request["asset_id"]],
+                scene_assets_dir,
+            ),
+            asset_id=scene_request["asset_id"],
+        )
+        for scene_request in sorted(scene_requests, key=lambda item: item["beat_index"])
+        if scene_request["asset_id"] in scene_payloads
+    )
+    with partial_manifest:
+        return _generate_pending_scenes(
+            prompt_pack=prompt_pack,
+            output_dir=output_dir,
+            profile=profile,
+            scene_requests=scene_requests,
+            pending_requests=pending_requests,
+            resumed_requests=resumed_requests if resume else None,
+            scene_payloads=scene_payloads,
+            partial_manifest=partial_manifest,
+            renderer=renderer,
+            asset_cache=asset_cache,
+            profile_selector=profile_selector,
+            manifest=manifest,
+            generation_digest=generation_digest,
+        )
+
+
+def _generate_pending_scenes(
+    *,
+    prompt_pack: Dict[str, Any],
+    output_dir: Path,
+    profile: str,
+    scene_requests: List[Dict[str, Any]],
+    pending_requests: List[Dict[str, Any]],
+    resumed_requests: Optional[List[Dict[str, Any]]],
+    scene_payloads: Dict[str, Dict[str, Any]],
+    partial_manifest: PartialSceneManifest,
+    renderer: Optional[ConcurrentSceneRenderer],
+    asset_cache: Optional[SceneAssetCache],
+    profile_selector: Optional[SeedanceProfileSelector],
+    manifest: Optional[BuildManifest],
+    generation_digest: str,
+) -> Dict[str, Any]:
     scene_assets_dir = output_dir / "scene_assets"
-    scene_assets = []  # type: List[Dict[str, Any]]
 
-    for scene_prompt in prompt_pack["scene_prompts"]:
-        prompt_id = scene_prompt["prompt_id"]
-        scene_fingerprint = _stable_hash(
-            [prompt_pack["prompt_pack_id"], prompt_id, profile, scene_prompt["prompt_text"]]
+    def store_scene(scene_request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        scene_payload = store_scene_payload(scene_assets_dir, scene_request, response)
+        scene_payloads[scene_request["asset_id"]] = scene_payload
+        partial_manifest.append(
+            dict(
+                scene_asset_entry(scene_request, scene_payload, scene_assets_dir),
+                asset_id=scene_request["asset_id"],
+            )
         )
-        scene_asset_uri = "seedance://{0}/{1}.mp4".format(
-            prompt_pack["prompt_pack_id"],
-            scene_fingerprint,
+
+    render_queue = []  # type: List[Dict[str, Any]]
+    reused_requests = []  # type: List[Tuple[Dict[str, Any], str]]
+    cache_keys = {}  # type: Dict[str, str]
+    leaders = {}  # type: Dict[str, Dict[str, Any]]
+    for scene_request in pending_requests:
+        if asset_cache is None:
+            render_queue.append(scene_request)
+            continue
+        cache_key = scene_cache_key(
+            scene_request["prompt_text"],
+            profile,
+            scene_request["duration_ms"],
+        )
+        cache_keys[scene_request["asset_id"]] = cache_key
+        if cache_key in leaders:
+            reused_requests.append((scene_request, cache_key))
+            continue
+        cached_response = asset_cache.get(cache_key)
+        if cached_response is not None:
+            store_scene(scene_request, cached_response)
+            continue
+        leaders[cache_key] = scene_request
+        render_queue.append(scene_request)
+
+    rendered_responses = {}  # type: Dict[str, Dict[str, Any]]
+    render_latencies = []  # type: List[float]
+
+    def store_rendered(
+        scene_request: Dict[str, Any],
+        response: Dict[str, Any],
+        latency_ms: float,
+    ) -> None:
+        rendered_responses[scene_request["asset_id"]] = response
+        render_latencies.append(float(response.get("render_latency_ms", latency_ms)))
+        store_scene(scene_request, response)
+        if asset_cache is not None:
+            asset_cache.put(cache_keys[scene_request["asset_id"]], response)
+        if profile_selector is not None:
+            duration_ms = scene_payloads[scene_request["asset_id"]]["duration_ms"]
+            profile_selector.record(
+                profile,
+                succeeded=True,
+                latency_ms=render_latencies[-1],
+                cost_usd=response.get("cost_usd"),
+                rendered_seconds=duration_ms / 1000.0,
+            )
+
+    def record_failed(
+        scene_request: Dict[str, Any],
+        error: SeedanceRenderError,
+        latency_ms: float,
+    ) -> None:
+        if profile_selector is not None:
+            profile_selector.record(profile, succeeded=False, latency_ms=latency_ms)
+
+    try:
+        (renderer or ConcurrentSceneRenderer()).render(
+            render_queue,
+            on_rendered=store_rendered,
+            on_failed=record_failed,
         )
-        duration_ms = int(scene_prompt["target_duration_ms"])
-
-        scene_file = scene_assets_dir / (scene_fingerprint + ".json")
-        _write_json(
-            scene_file,
-            {
-                "asset_id": scene_fingerprint,
-                "engine": PHASE1_ALLOWED_ENGINE,
-                "prompt_id": prompt_id,
-                "scene_asset_uri": scene_asset_uri,
-                "duration_ms": duration_ms,
+    except SeedanceRenderError as error:
+        if profile_selector is not None:
+            profile_selector.save()
+        raise SceneGenerationError(
+            code=error.code,
+            message=str(error),
+            details={
                 "seedance_profile": profile,
-                "source_prompt_text": scene_prompt["prompt_text"],
+                "seedance_stats_recorded": profile_selector is not None,
             },
         )
+    if profile_selector is not None and render_queue:
+        profile_selector.save()
 
-        scene_assets.append(
-            {
-                "prompt_id": prompt_id,
-                "beat_index": scene_prompt["beat_index"],
-                "scene_asset_uri": scene_asset_uri,
-                "duration_ms": duration_ms,
-                "seedance_profile": profile,
-                "scene_asset_path": str(scene_file),
-            }
+    for scene_request, cache_key in reused_requests:
+        leader_id = leaders[cache_key]["asset_id"]
+        store_scene(scene_request, rendered_responses[leader_id])
+
+    rebuilt_artifacts = [
+        scene_request["asset_id"]
+        for scene_request in sorted(
+            pending_requests,
+            key=lambda item: item["beat_index"],
         )
+    ]
+    for scene_request in pending_requests + (resumed_requests or []):
+        if manifest is not None:
+            manifest.record(
+                "scene_asset:%s" % scene_request["asset_id"],
+                compute_input_digest(scene_request),
+                scene_payloads[scene_request["asset_id"]],
+                [str(scene_assets_dir / (scene_request["asset_id"] + ".json"))],
+            )
 
-    generation_result = {
-        "status": "generated",
-        "result_code": "PASS",
-        "engine": PHASE1_ALLOWED_ENGINE,
-        "prompt_pack_id": prompt_pack["prompt_pack_id"],
-        "seedance_profile": profile,
-        "scene_assets": scene_assets,
-    }
-    generation_manifest_path = _write_json(
-        output_dir / "scene_generation.json",
+    generation_result = build_generation_result(
+        prompt_pack,
+        profile,
+        scene_requests,
+        scene_payloads,
+        scene_assets_dir,
+    )
+    if asset_cache is not None:
+        generation_result["rendered_scene_count"] = len(render_queue)
+    if resumed_requests is not None:
+        generation_result["resumed_scene_count"] = len(resumed_requests)
+    generation_manifest_path = write_generation_result(
+        output_dir,
         generation_result,
+        partial_manifest,
     )
-    generation_result["scene_generation_path"] = str(generation_manifest_path)
+    if manifest is not None:
+        scene_assets = generation_result["scene_assets"]
+        manifest.record(
+            "scene_generation",
+            generation_digest,
+            generation_result,
+            [str(generation_manifest_path)]
+            + [asset["scene_asset_path"] for asset in scene_assets],
+        )
+        manifest.save()
+        rebuilt_artifacts.append("scene_generation")
+        generation_result["rebuilt_artifacts"] = rebuilt_artifacts
+    if render_latencies:
+        generation_result["latency_ms"] = round(
+            sum(render_latencies) / len(render_latencies),
+            3,
+        )
+        generation_result["rendered_seconds"] = (
+            sum(
+                scene_payloads[scene_request["asset_id"]]["duration_ms"]
+                for scene_request in render_queue
+            )
+            / 1000.0
+        )
+        generation_result["seedance_stats_recorded"] = profile_selector is not None
     return generation_result
@@ -0,0 +1,120 @@
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Dict, List, Optional
+
+from money.scene_generation.rendering import SEEDANCE_RENDER_PATH, seedance_asset_uri
+
+SERVER_POLL_INTERVAL_SECONDS = 0.05
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class SeedanceStubServer:
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        latency_by_beat: Optional[Dict[int, float]] = None,
+        failing_beats: Optional[List[int]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._latency_seconds = latency_seconds
+        self._latency_by_beat = dict(latency_by_beat or {})
+        self._failing_beats = set(failing_beats or [])
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []  # type: List[Dict[str, Any]]
+        self._server = _ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread = None  # type: Optional[threading.Thread]
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return "http://%s:%d" % (host, port)
+
+    def start(self) -> "SeedanceStubServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": SERVER_POLL_INTERVAL_SECONDS},
+                name="seedance-stub-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "SeedanceStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _render(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        beat_index = int(request.get("beat_index", 0))
+        with self._lock:
+            self.requests.append(request)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            latency = self._latency_by_beat.get(beat_index, self._latency_seconds)
+            if latency > 0:
+                time.sleep(latency)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        if beat_index in self._failing_beats:
+            return None
+        return {
+            "scene_asset_uri": seedance_asset_uri(
+                str(request["prompt_pack_id"]),
+                str(request["asset_id"]),
+            ),
+            "duration_ms": int(request["duration_ms"]),
+            "render_latency_ms": int(latency * 1000),
+        }
+
+    def _handler_class(self) -> Any:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                if self.path != SEEDANCE_RENDER_PATH:
+                    self._reply(404, {"error": "not_found"})
+                    return
+                length = int(self.headers.get("Content-Length", "0"))
+                try:
+                    request = json.loads(self.rfile.read(length).decode("utf-8"))
+                except ValueError:
+                    self._reply(400, {"error": "invalid_json"})
+                    return
+                response = stub._render(request)
+                if response is None:
+                    self._reply(503, {"error": "render_failed"})
+                    return
+                self._reply(200, response)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+            def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload, sort_keys=True).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
@@ -1,21 +1,55 @@
 from typing import List
 
+from money.script_generation.batch import (
+    ScriptGenerationBatchRunner,
+    ScriptGenerationJob,
+)
+from money.script_generation.corpus_index import ReferenceCorpusIndex
+from money.script_generation.mapped_corpus import (
+    MappedCorpusError,
+    MappedReferenceCorpus,
+    build_mapped_reference_corpus,
+)
+from money.script_generation.originality_store import (
+    OriginalityRecordStore,
+    OriginalityStoreError,
+)
 from money.script_generation.pipeline import (
     merge_script_text,
+    run_script_generation_for_locales,
     run_script_generation_pipeline,
     validate_pack_schemas,
 )
+from money.script_generation.prompt_quality import scan_prompt_quality
 from money.script_generation.schemas import (
+    CompiledPackSchema,
     PackValidationError,
+    collect_prompt_pack_errors,
+    collect_summary_pack_errors,
+    compile_pack_schema,
     validate_prompt_pack,
     validate_summary_pack,
 )
 
 
 __all__: List[str] = [
+    "CompiledPackSchema",
+    "MappedCorpusError",
+    "MappedReferenceCorpus",
+    "OriginalityRecordStore",
+    "OriginalityStoreError",
     "PackValidationError",
+    "ReferenceCorpusIndex",
+    "ScriptGenerationBatchRunner",
+    "ScriptGenerationJob",
+    "collect_prompt_pack_errors",
+    "collect_summary_pack_errors",
+    "build_mapped_reference_corpus",
+    "compile_pack_schema",
     "merge_script_text",
+    "run_script_generation_for_locales",
     "run_script_generation_pipeline",
+    "scan_prompt_quality",
     "validate_pack_schemas",
     "validate_prompt_pack",
     "validate_summary_pack",
@@ -0,0 +1,172 @@
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from money.contracts.policy_snapshot import PolicySnapshot, current_policy_snapshot
+from money.contracts.registry import ContractValidationError
+from money.script_generation.corpus_index import ReferenceCorpusIndex
+from money.script_generation.mapped_corpus import MappedReferenceCorpus
+from money.script_generation.pipeline import (
+    ScriptGenerationError,
+    run_script_generation_pipeline,
+)
+from money.script_generation.schemas import PackValidationError
+
+DEFAULT_BATCH_CHUNK_SIZE = 4
+
+ReferenceCorpus = Union[Sequence[str], ReferenceCorpusIndex, MappedReferenceCorpus]
+SharedState = Tuple[PolicySnapshot, Optional[ReferenceCorpus]]
+
+_WORKER_STATE = None  # type: Optional[SharedState]
+
+
+class ScriptGenerationJob:
+    def __init__(
+        self,
+        trend_candidate: Dict[str, Any],
+        segmented_source_analysis: Dict[str, Any],
+        locale: str,
+        output_dir: Path,
+        job_id: Optional[str] = None,
+    ) -> None:
+        self.trend_candidate = trend_candidate
+        self.segmented_source_analysis = segmented_source_analysis
+        self.locale = locale
+        self.output_dir = Path(output_dir)
+        self.job_id = job_id or "%s:%s" % (
+            trend_candidate.get("candidate_id", ""),
+            locale,
+        )
+
+
+def _initialize_worker(
+    snapshot: PolicySnapshot,
+    reference_corpus: Optional[ReferenceCorpus],
+) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (snapshot, reference_corpus)
+
+
+def _run_job(
+    job: ScriptGenerationJob,
+    snapshot: PolicySnapshot,
+    reference_corpus: Optional[ReferenceCorpus],
+    incremental: bool,
+) -> Dict[str, Any]:
+    try:
+        response = run_script_generation_pipeline(
+            trend_candidate=job.trend_candidate,
+            segmented_source_analysis=job.segmented_source_analysis,
+            locale=job.locale,
+            output_dir=job.output_dir,
+            reference_corpus=reference_corpus,
+            snapshot=snapshot,
+            incremental=incremental,
+        )
+    except (
+        ScriptGenerationError,
+        PackValidationError,
+        ContractValidationError,
+    ) as error:
+        failure = {
+            "job_id": job.job_id,
+            "locale": job.locale,
+            "status": "failed",
+            "result_code": "FAILED",
+            "reason_code": error.code,
+            "message": str(error),
+        }  # type: Dict[str, Any]
+        if isinstance(error, ScriptGenerationError) and error.details:
+            failure["details"] = error.details
+        return failure
+    except Exception as error:
+        return {
+            "job_id": job.job_id,
+            "locale": job.locale,
+            "status": "failed",
+            "result_code": "FAILED",
+            "reason_code": "SCRIPT_GENERATION_JOB_FAILED",
+            "message": "%s: %s" % (type(error).__name__, error),
+        }
+    response["job_id"] = job.job_id
+    response["locale"] = job.locale
+    return response
+
+
+def _run_chunk(
+    jobs: List[ScriptGenerationJob],
+    incremental: bool = False,
+    shared_state: Optional[SharedState] = None,
+) -> List[Dict[str, Any]]:
+    if shared_state is not None:
+        _initialize_worker(*shared_state)
+    if _WORKER_STATE is None:
+        raise RuntimeError("script generation worker was not initialized")
+    snapshot, reference_corpus = _WORKER_STATE
+    return [_run_job(job, snapshot, reference_corpus, incremental) for job in jobs]
+
+
+class ScriptGenerationBatchRunner:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        reference_corpus: Optional[ReferenceCorpus] = None,
+        snapshot: Optional[PolicySnapshot] = None,
+        incremental: bool = False,
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least one")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least one")
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._reference_corpus = reference_corpus
+        self._snapshot = snapshot
+        self._incremental = incremental
+
+    def run(self, jobs: Iterable[ScriptGenerationJob]) -> Iterator[Dict[str, Any]]:
+        snapshot = self._snapshot or current_policy_snapshot()
+        shared_state = (snapshot, self._reference_corpus)  # type: SharedState
+        job_list = list(jobs)
+        chunks = [
+            job_list[start : start + self._chunk_size]
+            for start in range(0, len(job_list), self._chunk_size)
+        ]
+        if not chunks:
+            return
+
+        if sys.version_info >= (3, 7):
+            executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_initialize_worker,
+                initargs=shared_state,
+            )
+            chunk_state = None  # type: Optional[SharedState]
+        else:
+            executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            chunk_state = shared_state
+
+        with executor:
+            futures = [
+                executor.submit(_run_chunk, chunk, self._incremental, chunk_state)
+                for chunk in chunks
+            ]  # type: List[Future]
+            for future in as_completed(futures):
+                for result in future.result():
+                    yield result
+
+    def run_all(self, jobs: Iterable[ScriptGenerationJob]) -> Dict[str, Any]:
+        results = list(self.run(jobs))
+        failed_by_code = {}  # type: Dict[str, int]
+        for result in results:
+            if result["status"] == "failed":
+                code = result["reason_code"]
+                failed_by_code[code] = failed_by_code.get(code, 0) + 1
+        return {
+            "job_count": len(results),
+            "failed_count": sum(failed_by_code.values()),
+            "failed_by_code": failed_by_code,
+            "results": results,
+        }
@@ -0,0 +1,143 @@
+import hashlib
+import random
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from money.script_generation.originality import _tokenize
+
+MERSENNE_PRIME_61 = (1 << 61) - 1
+DEFAULT_NUM_PERMUTATIONS = 64
+DEFAULT_LSH_BANDS = 16
+DEFAULT_MINHASH_SEED = 20260216
+
+SEARCH_MODES = ("exact", "lsh")
+
+
+def _token_hash(token: str) -> int:
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class ReferenceCorpusIndex:
+    def __init__(
+        self,
+        references: Optional[Iterable[str]] = None,
+        num_permutations: int = DEFAULT_NUM_PERMUTATIONS,
+        bands: int = DEFAULT_LSH_BANDS,
+        mode: str = "exact",
+        seed: int = DEFAULT_MINHASH_SEED,
+    ) -> None:
+        if mode not in SEARCH_MODES:
+            raise ValueError("mode must be one of %s" % ", ".join(SEARCH_MODES))
+        if bands < 1 or num_permutations % bands != 0:
+            raise ValueError("num_permutations must be a multiple of bands")
+        self._mode = mode
+        self._bands = bands
+        self._rows_per_band = num_permutations // bands
+        generator = random.Random(seed)
+        self._permutations = [
+            (
+                generator.randrange(1, MERSENNE_PRIME_61),
+                generator.randrange(0, MERSENNE_PRIME_61),
+            )
+            for _ in range(num_permutations)
+        ]
+        self._token_ids = {}  # type: Dict[str, int]
+        self._token_hashes = []  # type: List[int]
+        self._postings = {}  # type: Dict[int, List[int]]
+        self._reference_tokens = []  # type: List[FrozenSet[int]]
+        self._band_buckets = [
+            {} for _ in range(bands)
+        ]  # type: List[Dict[Tuple[int, ...], List[int]]]
+        if references is not None:
+            self.add_many(references)
+
+    def __len__(self) -> int:
+        return len(self._reference_tokens)
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def add(self, reference_text: str) -> int:
+        reference_id = len(self._reference_tokens)
+        tokens = _tokenize(reference_text)
+        token_ids = frozenset(self._intern_token(token) for token in tokens)
+        self._reference_tokens.append(token_ids)
+        for token_id in token_ids:
+            self._postings.setdefault(token_id, []).append(reference_id)
+        if token_ids:
+            signature = self._signature(
+                [self._token_hashes[token_id] for token_id in token_ids]
+            )
+            for band, bucket_key in enumerate(self._band_keys(signature)):
+                self._band_buckets[band].setdefault(bucket_key, []).append(reference_id)
+        return reference_id
+
+    def add_many(self, reference_texts: Iterable[str]) -> int:
+        added = 0
+        for reference_text in reference_texts:
+            self.add(reference_text)
+            added += 1
+        return added
+
+    def best_similarity(self, script_text: str, mode: Optional[str] = None) -> float:
+        tokens = _tokenize(script_text)
+        if not tokens:
+            return 0.0
+        query_ids = set()  # type: Set[int]
+        for position, token in enumerate(sorted(tokens)):
+            query_ids.add(self._token_ids.get(token, -1 - position))
+        if (mode or self._mode) == "lsh":
+            signature = self._signature([_token_hash(token) for token in tokens])
+            return self._best_lsh_similarity(query_ids, signature)
+        return self._best_exact_similarity(query_ids)
+
+    def _best_exact_similarity(self, query_ids: Set[int]) -> float:
+        overlaps = {}  # type: Dict[int, int]
+        for token_id in query_ids:
+            for reference_id in self._postings.get(token_id, ()):
+                overlaps[reference_id] = overlaps.get(reference_id, 0) + 1
+        best = 0.0
+        query_size = len(query_ids)
+        for reference_id, overlap in overlaps.items():
+            union = query_size + len(self._reference_tokens[reference_id]) - overlap
+            similarity = float(overlap) / float(union)
+            if similarity > best:
+                best = similarity
+        return best
+
+    def _best_lsh_similarity(self, query_ids: Set[int], signature: List[int]) -> float:
+        candidates = set()  # type: Set[int]
+        for band, bucket_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._band_buckets[band].get(bucket_key, ()))
+        best = 0.0
+        query_size = len(query_ids)
+        for reference_id in candidates:
+            reference_ids = self._reference_tokens[reference_id]
+            overlap = len(query_ids.intersection(reference_ids))
+            union = query_size + len(reference_ids) - overlap
+            similarity = float(overlap) / float(union)
+            if similarity > best:
+                best = similarity
+        return best
+
+    def _intern_token(self, token: str) -> int:
+        token_id = self._token_ids.get(token)
+        if token_id is None:
+            token_id = len(self._token_hashes)
+            self._token_ids[token] = token_id
+            self._token_hashes.append(_token_hash(token))
+        return token_id
+
+    def _signature(self, hashes: List[int]) -> List[int]:
+        return [
+            min((a * value + b) % MERSENNE_PRIME_61 for value in hashes)
+            for a, b in self._permutations
+        ]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, ...]]:
+        rows = self._rows_per_band
+        return [
+            tuple(signature[band * rows : (band + 1) * rows])
+            for band in range(self._bands)
+        ]
@@ -0,0 +1,249 @@
+import argparse
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from money.script_generation.originality import _tokenize
+
+MAPPED_CORPUS_MAGIC = b"MRC1"
+MAPPED_CORPUS_VERSION = 1
+HEADER_FORMAT = "<4sIIIQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+class MappedCorpusError(Exception):
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def _uint32_array(values: Iterable[int]) -> "array[int]":
+    packed = array("I", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed
+
+
+def _padding(length: int) -> bytes:
+    return b"\0" * (-length % 4)
+
+
+def build_mapped_reference_corpus(
+    reference_texts: Iterable[str],
+    output_path: Path,
+) -> Path:
+    token_sets = [_tokenize(reference_text) for reference_text in reference_texts]
+    vocabulary = sorted(set().union(*token_sets)) if token_sets else []
+    token_ids = {token: token_id for token_id, token in enumerate(vocabulary)}
+
+    encoded_tokens = [token.encode("utf-8") for token in vocabulary]
+    token_offsets = [0]
+    for encoded in encoded_tokens:
+        token_offsets.append(token_offsets[-1] + len(encoded))
+    token_blob = b"".join(encoded_tokens)
+
+    reference_offsets = [0]
+    reference_ids = []  # type: List[int]
+    for tokens in token_sets:
+        reference_ids.extend(sorted(token_ids[token] for token in tokens))
+        reference_offsets.append(len(reference_ids))
+
+    header = struct.pack(
+        HEADER_FORMAT,
+        MAPPED_CORPUS_MAGIC,
+        MAPPED_CORPUS_VERSION,
+        len(vocabulary),
+        len(token_sets),
+        len(token_blob),
+    )
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    with temp_path.open("wb") as handle:
+        handle.write(header)
+        handle.write(_uint32_array(token_offsets).tobytes())
+        handle.write(token_blob)
+        handle.write(_padding(len(token_blob)))
+        handle.write(_uint32_array(reference_offsets).tobytes())
+        handle.write(_uint32_array(reference_ids).tobytes())
+    temp_path.replace(output_path)
+    return output_path
+
+
+class MappedReferenceCorpus:
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._open()
+
+    def _open(self) -> None:
+        if sys.byteorder != "little":
+            raise MappedCorpusError(
+                code="MAPPED_CORPUS_UNSUPPORTED_PLATFORM",
+                message="mapped reference corpora require a little-endian host",
+            )
+        with self._path.open("rb") as handle:
+            try:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise MappedCorpusError(
+                    code="MAPPED_CORPUS_INVALID",
+                    message="invalid mapped reference corpus %s: file is empty"
+                    % self._path,
+                )
+        file_length = len(self._mmap)
+        if file_length < HEADER_SIZE:
+            self._invalid("file is shorter than the header")
+        header = struct.unpack_from(HEADER_FORMAT, self._mmap, 0)
+        magic, version, token_count, reference_count, blob_length = header
+        if magic != MAPPED_CORPUS_MAGIC or version != MAPPED_CORPUS_VERSION:
+            self._invalid("unrecognized header")
+
+        cursor = HEADER_SIZE
+        token_offsets_end = cursor + 4 * (token_count + 1)
+        blob_end = token_offsets_end + blob_length
+        reference_offsets_start = blob_end + len(_padding(blob_length))
+        reference_offsets_end = reference_offsets_start + 4 * (reference_count + 1)
+        if reference_offsets_end > file_length:
+            self._invalid("section sizes exceed file length")
+        (id_count,) = struct.unpack_from("<I", self._mmap, reference_offsets_end - 4)
+        ids_end = reference_offsets_end + 4 * id_count
+        if ids_end > file_length:
+            self._invalid("token id section exceeds file length")
+
+        view = memoryview(self._mmap)
+        self._token_offsets = view[cursor:token_offsets_end].cast("I")
+        self._token_blob = view[token_offsets_end:blob_end]
+        self._reference_offsets = view[
+            reference_offsets_start:reference_offsets_end
+        ].cast("I")
+        self._reference_ids = view[reference_offsets_end:ids_end].cast("I")
+        view.release()
+        self._token_count = token_count
+        self._reference_count = reference_count
+
+    def _invalid(self, reason: str) -> None:
+        self._mmap.close()
+        raise MappedCorpusError(
+            code="MAPPED_CORPUS_INVALID",
+            message="invalid mapped reference corpus %s: %s" % (self._path, reason),
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def token_count(self) -> int:
+        return self._token_count
+
+    def __len__(self) -> int:
+        return self._reference_count
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"path": str(self._path)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._path = Path(state["path"])
+        self._open()
+
+    def __enter__(self) -> "MappedReferenceCorpus":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._token_offsets.release()
+        self._token_blob.release()
+        self._reference_offsets.release()
+        self._reference_ids.release()
+        self._mmap.close()
+
+    def token_id(self, token: str) -> Optional[int]:
+        encoded = token.encode("utf-8")
+        low = 0
+        high = self._token_count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self._token_at(middle)
+            if candidate < encoded:
+                low = middle + 1
+            elif candidate > encoded:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def reference_token_ids(self, reference_id: int) -> List[int]:
+        start = self._reference_offsets[reference_id]
+        end = self._reference_offsets[reference_id + 1]
+        return self._reference_ids[start:end].tolist()
+
+    def best_similarity(self, script_text: str) -> float:
+        tokens = _tokenize(script_text)
+        if not tokens:
+            return 0.0
+        query_ids = set()  # type: Set[int]
+        for token in tokens:
+            token_id = self.token_id(token)
+            if token_id is not None:
+                query_ids.add(token_id)
+        if not query_ids:
+            return 0.0
+
+        query_size = len(tokens)
+        offsets = self._reference_offsets
+        reference_ids = self._reference_ids
+        best = 0.0
+        for reference_id in range(self._reference_count):
+            start = offsets[reference_id]
+            end = offsets[reference_id + 1]
+            overlap = 0
+            for position in range(start, end):
+                if reference_ids[position] in query_ids:
+                    overlap += 1
+            if overlap:
+                union = query_size + (end - start) - overlap
+                similarity = float(overlap) / float(union)
+                if similarity > best:
+                    best = similarity
+        return best
+
+    def _token_at(self, token_id: int) -> bytes:
+        start = self._token_offsets[token_id]
+        end = self._token_offsets[token_id + 1]
+        return self._token_blob[start:end].tobytes()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input", help="JSON list or newline-delimited reference texts")
+    parser.add_argument("output")
+    args = parser.parse_args(argv)
+
+    raw = Path(args.input).read_text(encoding="utf-8")
+    if raw.lstrip().startswith("["):
+        reference_texts = [str(item) for item in json.loads(raw)]
+    else:
+        reference_texts = [line for line in raw.splitlines() if line.strip()]
+    output_path = build_mapped_reference_corpus(reference_texts, Path(args.output))
+    with MappedReferenceCorpus(output_path) as corpus:
+        print(
+            json.dumps(
+                {
+                    "path": str(output_path),
+                    "reference_count": len(corpus),
+                    "token_count": corpus.token_count,
+                },
+                sort_keys=True,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
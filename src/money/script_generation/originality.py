@@ -2,7 +2,12 @@ import hashlib
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Union, cast
+
+if TYPE_CHECKING:
+    from money.script_generation.corpus_index import ReferenceCorpusIndex
+    from money.script_generation.mapped_corpus import MappedReferenceCorpus
+    from money.script_generation.originality_store import OriginalityRecordStore
 
 
 TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
@@ -20,11 +25,22 @@ def _jaccard_similarity(left: Set[str], right: Set[str]) -> float:
     return float(len(left.intersection(right))) / float(len(union))
 
 
-def compute_similarity_score(script_text: str, reference_texts: Iterable[str]) -> float:
+def compute_similarity_score(
+    script_text: str,
+    reference_texts: Union[
+        Iterable[str],
+        "ReferenceCorpusIndex",
+        "MappedReferenceCorpus",
+    ],
+) -> float:
+    best_similarity_fn = getattr(reference_texts, "best_similarity", None)
+    if best_similarity_fn is not None:
+        return round(best_similarity_fn(script_text), 4)
+
     script_tokens = _tokenize(script_text)
     best_similarity = 0.0
 
-    for reference_text in reference_texts:
+    for reference_text in cast(Iterable[str], reference_texts):
         similarity = _jaccard_similarity(script_tokens, _tokenize(reference_text))
         if similarity > best_similarity:
             best_similarity = similarity
@@ -50,6 +66,7 @@ def persist_originality_score(
     similarity_score: float,
     originality_threshold: float,
     reference_count: int,
+    record_store: Optional["OriginalityRecordStore"] = None,
 ) -> Dict[str, Any]:
     similarity_trace_id = build_similarity_trace_id(
         candidate_id=candidate_id,
@@ -72,6 +89,12 @@ def persist_originality_score(
         else "PASS",
     }
 
+    if record_store is not None:
+        location = record_store.append(payload)
+        payload["path"] = location["segment_path"]
+        payload["segment_offset"] = location["segment_offset"]
+        return payload
+
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / ("%s.json" % draft_id)
     output_path.write_text(
@@ -0,0 +1,344 @@
+import argparse
+import json
+import shutil
+import threading
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+CURRENT_FILENAME = "CURRENT"
+GENERATION_PREFIX = "generation-"
+GENERATION_TEMPLATE = GENERATION_PREFIX + "{0:06d}"
+INDEX_FILENAME = "index.ndjson"
+SEGMENT_TEMPLATE = "segment-{0:06d}.ndjson"
+
+RecordLocation = Tuple[int, int, int]
+
+
+class OriginalityStoreError(Exception):
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    encoded = json.dumps(record, sort_keys=True, separators=(",", ":"))
+    return (encoded + "\n").encode("utf-8")
+
+
+class OriginalityRecordStore:
+    def __init__(
+        self,
+        root: Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+    ) -> None:
+        if max_segment_bytes < 1:
+            raise ValueError("max_segment_bytes must be at least one")
+        self._root = Path(root)
+        self._max_segment_bytes = max_segment_bytes
+        self._lock = threading.Lock()
+        self._index = {}  # type: Dict[str, RecordLocation]
+        self._segment_handle = None  # type: Optional[IO[bytes]]
+        self._index_handle = None  # type: Optional[IO[str]]
+        self._open()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def segment_count(self) -> int:
+        return self._active_segment
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, draft_id: object) -> bool:
+        return draft_id in self._index
+
+    @property
+    def generation_dir(self) -> Path:
+        return self._root / GENERATION_TEMPLATE.format(self._generation)
+
+    def segment_path(self, segment: int) -> Path:
+        return self.generation_dir / SEGMENT_TEMPLATE.format(segment)
+
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        draft_id = str(record.get("draft_id", "")).strip()
+        if not draft_id:
+            raise OriginalityStoreError(
+                code="ORIGINALITY_RECORD_DRAFT_ID_REQUIRED",
+                message="originality records require a draft_id",
+            )
+        encoded = _encode_record(record)
+        with self._lock:
+            if (
+                self._active_size > 0
+                and self._active_size + len(encoded) > self._max_segment_bytes
+            ):
+                self._rotate()
+            segment_handle, index_handle = self._handles()
+            offset = self._active_size
+            segment_handle.write(encoded)
+            segment_handle.flush()
+            self._active_size += len(encoded)
+            location = (self._active_segment, offset, len(encoded))
+            index_handle.write(self._index_line(draft_id, location))
+            index_handle.flush()
+            self._index[draft_id] = location
+            self._stored_count += 1
+        return {
+            "segment_path": str(self.segment_path(location[0])),
+            "segment_offset": offset,
+        }
+
+    def get(self, draft_id: str) -> Optional[Dict[str, Any]]:
+        location = self._index.get(draft_id)
+        if location is None:
+            return None
+        return self._read(location)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        locations = sorted(self._index.values())
+        for location in locations:
+            yield self._read(location)
+
+    def export_json(self, output_dir: Path) -> int:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        exported = 0
+        for record in self.iter_records():
+            output_path = output_dir / ("%s.json" % record["draft_id"])
+            output_path.write_text(
+                json.dumps(record, indent=2, sort_keys=True) + "\n",
+                encoding="utf-8",
+            )
+            exported += 1
+        return exported
+
+    def compact(self) -> Dict[str, Any]:
+        with self._lock:
+            segment_count_before = self._active_segment
+            live_records = [
+                self._read(location) for location in sorted(self._index.values())
+            ]
+            stored_count = self._stored_count
+            self._close_handles()
+
+            retired_dir = self.generation_dir
+            compact_dir = self._root / GENERATION_TEMPLATE.format(self._generation + 1)
+            if compact_dir.exists():
+                shutil.rmtree(str(compact_dir))
+            compact_dir.mkdir(parents=True)
+            segment = 1
+            size = 0
+            index_lines = []  # type: List[str]
+            handle = (compact_dir / SEGMENT_TEMPLATE.format(segment)).open("wb")
+            try:
+                for record in live_records:
+                    encoded = _encode_record(record)
+                    if size > 0 and size + len(encoded) > self._max_segment_bytes:
+                        handle.close()
+                        segment += 1
+                        size = 0
+                        segment_path = compact_dir / SEGMENT_TEMPLATE.format(segment)
+                        handle = segment_path.open("wb")
+                    handle.write(encoded)
+                    location = (segment, size, len(encoded))
+                    index_lines.append(self._index_line(record["draft_id"], location))
+                    size += len(encoded)
+            finally:
+                handle.close()
+
+            (compact_dir / INDEX_FILENAME).write_text(
+                "".join(index_lines),
+                encoding="utf-8",
+            )
+            self._write_current(compact_dir.name)
+            shutil.rmtree(str(retired_dir))
+            self._open()
+
+        return {
+            "record_count": len(live_records),
+            "dropped_count": stored_count - len(live_records),
+            "segment_count_before": segment_count_before,
+            "segment_count_after": self._active_segment,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handles()
+
+    def __enter__(self) -> "OriginalityRecordStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _open(self) -> None:
+        self._generation = self._current_generation()
+        segment_dir = self.generation_dir
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        for path in self._root.glob(GENERATION_PREFIX + "*"):
+            if path.is_dir() and path != segment_dir:
+                shutil.rmtree(str(path))
+        segments = sorted(
+            int(path.name[len("segment-") : -len(".ndjson")])
+            for path in segment_dir.glob("segment-*.ndjson")
+        )
+        self._active_segment = segments[-1] if segments else 1
+        self._index = {}
+        self._stored_count = 0
+
+        indexed_end = {}  # type: Dict[int, int]
+        index_path = segment_dir / INDEX_FILENAME
+        if index_path.exists():
+            with index_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                        location = (
+                            int(entry["segment"]),
+                            int(entry["offset"]),
+                            int(entry["length"]),
+                        )
+                        draft_id = str(entry["draft_id"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    self._index[draft_id] = location
+                    self._stored_count += 1
+                    end = location[1] + location[2]
+                    if end > indexed_end.get(location[0], 0):
+                        indexed_end[location[0]] = end
+
+        for segment in segments:
+            self._recover_unindexed(segment, indexed_end.get(segment, 0))
+        active_path = self.segment_path(self._active_segment)
+        self._active_size = active_path.stat().st_size if active_path.exists() else 0
+
+    def _recover_unindexed(self, segment: int, indexed_end: int) -> None:
+        path = self.segment_path(segment)
+        size = path.stat().st_size
+        if size <= indexed_end:
+            return
+        recovered = []  # type: List[Tuple[str, RecordLocation]]
+        valid_end = indexed_end
+        with path.open("rb") as handle:
+            handle.seek(indexed_end)
+            offset = indexed_end
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    draft_id = str(json.loads(line.decode("utf-8"))["draft_id"])
+                except (ValueError, KeyError, TypeError):
+                    break
+                recovered.append((draft_id, (segment, offset, len(line))))
+                offset += len(line)
+                valid_end = offset
+        if valid_end < size:
+            with path.open("r+b") as handle:
+                handle.truncate(valid_end)
+        if recovered:
+            with (self.generation_dir / INDEX_FILENAME).open(
+                "a", encoding="utf-8"
+            ) as handle:
+                for draft_id, location in recovered:
+                    handle.write(self._index_line(draft_id, location))
+                    self._index[draft_id] = location
+                    self._stored_count += 1
+
+    def _current_generation(self) -> int:
+        current_path = self._root / CURRENT_FILENAME
+        if not current_path.exists():
+            self._root.mkdir(parents=True, exist_ok=True)
+            self._write_current(GENERATION_TEMPLATE.format(1))
+            return 1
+        name = current_path.read_text(encoding="utf-8").strip()
+        try:
+            if not name.startswith(GENERATION_PREFIX):
+                raise ValueError(name)
+            return int(name[len(GENERATION_PREFIX) :])
+        except ValueError:
+            raise OriginalityStoreError(
+                code="ORIGINALITY_STORE_CURRENT_INVALID",
+                message="unrecognized store generation %r in %s" % (name, current_path),
+            )
+
+    def _write_current(self, generation_name: str) -> None:
+        current_path = self._root / CURRENT_FILENAME
+        temp_path = current_path.with_name(CURRENT_FILENAME + ".tmp")
+        temp_path.write_text(generation_name + "\n", encoding="utf-8")
+        temp_path.replace(current_path)
+
+    def _handles(self) -> Tuple[IO[bytes], IO[str]]:
+        if self._segment_handle is None:
+            self._segment_handle = self.segment_path(self._active_segment).open("ab")
+        if self._index_handle is None:
+            index_path = self.generation_dir / INDEX_FILENAME
+            self._index_handle = index_path.open("a", encoding="utf-8")
+        return self._segment_handle, self._index_handle
+
+    def _rotate(self) -> None:
+        if self._segment_handle is not None:
+            self._segment_handle.close()
+            self._segment_handle = None
+        self._active_segment += 1
+        self._active_size = 0
+
+    def _close_handles(self) -> None:
+        if self._segment_handle is not None:
+            self._segment_handle.close()
+            self._segment_handle = None
+        if self._index_handle is not None:
+            self._index_handle.close()
+            self._index_handle = None
+
+    def _read(self, location: RecordLocation) -> Dict[str, Any]:
+        segment, offset, length = location
+        with self.segment_path(segment).open("rb") as handle:
+            handle.seek(offset)
+            payload = handle.read(length)
+        return json.loads(payload.decode("utf-8"))
+
+    @staticmethod
+    def _index_line(draft_id: str, location: RecordLocation) -> str:
+        segment, offset, length = location
+        return (
+            json.dumps(
+                {
+                    "draft_id": draft_id,
+                    "segment": segment,
+                    "offset": offset,
+                    "length": length,
+                },
+                sort_keys=True,
+            )
+            + "\n"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+    compact_parser = subparsers.add_parser("compact")
+    compact_parser.add_argument("root")
+    export_parser = subparsers.add_parser("export")
+    export_parser.add_argument("root")
+    export_parser.add_argument("output_dir")
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 2
+    with OriginalityRecordStore(Path(args.root)) as store:
+        if args.command == "compact":
+            summary = store.compact()
+        else:
+            summary = {"exported_count": store.export_json(Path(args.output_dir))}
+    print(json.dumps(summary, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
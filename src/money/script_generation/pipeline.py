@@ -1,32 +1,40 @@
+import functools
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+from money.contracts.build_manifest import BuildManifest, compute_input_digest
+from money.contracts.policy_snapshot import PolicySnapshot, current_policy_snapshot
 from money.contracts.validate_task1 import validate_contract
+from money.matching import PhraseMatcher
+from money.script_generation.corpus_index import ReferenceCorpusIndex
+from money.script_generation.mapped_corpus import MappedReferenceCorpus
 from money.script_generation.originality import (
     compute_similarity_score,
     persist_originality_score,
 )
+from money.script_generation.originality_store import OriginalityRecordStore
+from money.script_generation.prompt_quality import scan_prompt_quality
 from money.script_generation.schemas import (
     PackValidationError,
     validate_prompt_pack,
     validate_summary_pack,
 )
 
-
-ROOT_DIR = Path(__file__).resolve().parents[3]
-POLICY_PATH = ROOT_DIR / "docs" / "policy" / "locale_compliance_policy.json"
+PACK_SCHEMA_VERSION = "2026-02-16"
 
 
 class ScriptGenerationError(Exception):
-    def __init__(self, code: str, message: str) -> None:
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
         super().__init__(message)
         self.code = code
-
-
-def _load_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+        self.details = details or {}
 
 
 def _write_json(path: Path, payload: Dict[str, Any]) -> Path:
@@ -106,16 +114,14 @@ def _build_factual_quality(
     source_facts: Sequence[str],
     segments: Sequence[Dict[str, Any]],
 ) -> Dict[str, Any]:
-    joined_segment_text = " ".join(segment["summary"].lower() for segment in segments)
+    joined_segment_text = " ".join(segment["summary"] for segment in segments)
     checked_facts = [fact.strip() for fact in source_facts if fact and fact.strip()]
 
     if not checked_facts:
         factual_precision = 1.0
     else:
-        matched_count = 0
-        for fact in checked_facts:
-            if fact.lower() in joined_segment_text:
-                matched_count += 1
+        matched_facts = PhraseMatcher(checked_facts).find(joined_segment_text)
+        matched_count = sum(1 for fact in checked_facts if fact in matched_facts)
         factual_precision = round(float(matched_count) / float(len(checked_facts)), 4)
 
     hallucination_rate = round(max(0.0, 1.0 - factual_precision), 4)
@@ -159,6 +165,14 @@ def build_summary_pack(
     trend_candidate: Dict[str, Any],
     segmented_source_analysis: Dict[str, Any],
     locale: str,
+) -> Dict[str, Any]:
+    summary_core = _build_summary_core(trend_candidate, segmented_source_analysis)
+    return _localize_summary_pack(summary_core, locale)
+
+
+def _build_summary_core(
+    trend_candidate: Dict[str, Any],
+    segmented_source_analysis: Dict[str, Any],
 ) -> Dict[str, Any]:
     candidate_id = str(trend_candidate.get("candidate_id", "")).strip()
     topic = str(trend_candidate.get("topic", "")).strip()
@@ -219,12 +233,10 @@ def build_summary_pack(
         "max_duration_jump_ratio": _max_duration_jump_ratio(beat_map),
     }
 
-    summary_pack = {
-        "schema_version": "2026-02-16",
-        "summary_id": _stable_id("summary", [candidate_id, locale, source_analysis_id]),
+    return {
+        "schema_version": PACK_SCHEMA_VERSION,
         "source_analysis_id": source_analysis_id,
         "candidate_id": candidate_id,
-        "locale": locale,
         "topic": topic,
         "analysis_only": True,
         "factual_quality": _build_factual_quality(source_facts, segments),
@@ -233,6 +245,15 @@ def build_summary_pack(
         "pacing_map": pacing_map,
     }
 
+
+def _localize_summary_pack(summary_core: Dict[str, Any], locale: str) -> Dict[str, Any]:
+    summary_pack = dict(summary_core)
+    summary_pack["summary_id"] = _stable_id(
+        "summary",
+        [summary_core["candidate_id"], locale, summary_core["source_analysis_id"]],
+    )
+    summary_pack["locale"] = locale
+
     validate_summary_pack(summary_pack)
     if not summary_pack["factual_quality"]["passes"]:
         raise ScriptGenerationError(
@@ -243,44 +264,11 @@ def build_summary_pack(
     return summary_pack
 
 
-def _compute_ambiguity_score(scene_prompts: Sequence[Dict[str, Any]]) -> float:
-    ambiguous_tokens = set(["thing", "things", "stuff", "maybe", "somehow", "etc"])
-
-    token_count = 0
-    ambiguous_count = 0
-    for scene_prompt in scene_prompts:
-        words = scene_prompt["prompt_text"].lower().split()
-        for raw_word in words:
-            cleaned_word = raw_word.strip(".,:;!?()[]{}\"")
-            if not cleaned_word:
-                continue
-            token_count += 1
-            if cleaned_word in ambiguous_tokens:
-                ambiguous_count += 1
-
-    if token_count == 0:
-        return 1.0
-    return round(float(ambiguous_count) / float(token_count), 4)
-
-
-def _detect_policy_violations(scene_prompts: Sequence[Dict[str, Any]]) -> List[str]:
-    policy_phrases = [
-        "guaranteed profit",
-        "risk free return",
-        "medical cure",
-        "illegal trick",
-        "bet now",
-    ]
-    joined_text = " ".join(scene["prompt_text"].lower() for scene in scene_prompts)
-
-    violations: List[str] = []
-    for phrase in policy_phrases:
-        if phrase in joined_text:
-            violations.append(phrase)
-    return violations
+def build_prompt_pack(summary_pack: Dict[str, Any]) -> Dict[str, Any]:
+    return _localize_prompt_pack(_build_prompt_core(summary_pack), summary_pack)
 
 
-def build_prompt_pack(summary_pack: Dict[str, Any]) -> Dict[str, Any]:
+def _build_prompt_core(summary_pack: Dict[str, Any]) -> Dict[str, Any]:
     shot_duration_constraints = {
         "min_ms": 700,
         "max_ms": 1800,
@@ -309,10 +297,6 @@ def build_prompt_pack(summary_pack: Dict[str, Any]) -> Dict[str, Any]:
 
         scene_prompts.append(
             {
-                "prompt_id": _stable_id(
-                    "prompt",
-                    [summary_pack["summary_id"], str(beat["beat_index"])],
-                ),
                 "beat_index": beat["beat_index"],
                 "script_role": keypoint["role"],
                 "prompt_text": prompt_text,
@@ -330,12 +314,40 @@ def build_prompt_pack(summary_pack: Dict[str, Any]) -> Dict[str, Any]:
         )
 
     ambiguity_threshold = 0.15
-    ambiguity_score = _compute_ambiguity_score(scene_prompts)
-    policy_violations = _detect_policy_violations(scene_prompts)
-    policy_pass = len(policy_violations) == 0
+    quality_scan = scan_prompt_quality(scene_prompts)
+    policy_violations = quality_scan["policy_violations"]
+
+    return {
+        "beat_windows": beat_windows,
+        "shot_duration_constraints": shot_duration_constraints,
+        "scene_prompts": scene_prompts,
+        "quality_checks": {
+            "schema_valid": True,
+            "ambiguity_score": quality_scan["ambiguity_score"],
+            "ambiguity_threshold": ambiguity_threshold,
+            "policy_violations": policy_violations,
+            "policy_pass": len(policy_violations) == 0,
+        },
+        "prompt_breakdown": quality_scan["prompt_breakdown"],
+    }
+
+
+def _localize_prompt_pack(
+    prompt_core: Dict[str, Any],
+    summary_pack: Dict[str, Any],
+) -> Dict[str, Any]:
+    scene_prompts = []
+    for scene_prompt in prompt_core["scene_prompts"]:
+        localized_prompt = dict(scene_prompt)
+        localized_prompt["prompt_id"] = _stable_id(
+            "prompt",
+            [summary_pack["summary_id"], str(scene_prompt["beat_index"])],
+        )
+        scene_prompts.append(localized_prompt)
+    quality_checks = prompt_core["quality_checks"]
 
     prompt_pack = {
-        "schema_version": "2026-02-16",
+        "schema_version": PACK_SCHEMA_VERSION,
         "prompt_pack_id": _stable_id(
             "prompt-pack",
             [summary_pack["summary_id"], summary_pack["locale"]],
@@ -345,28 +357,33 @@ def build_prompt_pack(summary_pack: Dict[str, Any]) -> Dict[str, Any]:
         "locale": summary_pack["locale"],
         "seedance_profile_id": "seedance-default-v1",
         "rhythm_fidelity_target": "medium_high",
-        "beat_windows": beat_windows,
-        "shot_duration_constraints": shot_duration_constraints,
+        "beat_windows": prompt_core["beat_windows"],
+        "shot_duration_constraints": prompt_core["shot_duration_constraints"],
         "scene_prompts": scene_prompts,
-        "quality_checks": {
-            "schema_valid": True,
-            "ambiguity_score": ambiguity_score,
-            "ambiguity_threshold": ambiguity_threshold,
-            "policy_violations": policy_violations,
-            "policy_pass": policy_pass,
-        },
+        "quality_checks": dict(quality_checks),
     }
 
     validate_prompt_pack(prompt_pack)
-    if ambiguity_score > ambiguity_threshold:
+    prompt_breakdown = prompt_core["prompt_breakdown"]
+    if quality_checks["ambiguity_score"] > quality_checks["ambiguity_threshold"]:
         raise ScriptGenerationError(
             code="PROMPT_PACK_AMBIGUITY_BLOCKED",
             message="prompt pack ambiguity score exceeded threshold",
+            details={
+                "prompt_breakdown": [
+                    entry for entry in prompt_breakdown if entry["ambiguous_tokens"]
+                ]
+            },
         )
-    if not policy_pass:
+    if not quality_checks["policy_pass"]:
         raise ScriptGenerationError(
             code="PROMPT_PACK_POLICY_BLOCKED",
             message="prompt pack policy check failed",
+            details={
+                "prompt_breakdown": [
+                    entry for entry in prompt_breakdown if entry["policy_violations"]
+                ]
+            },
         )
 
     return prompt_pack
@@ -403,15 +420,19 @@ def merge_script_text(script_draft: Dict[str, Any]) -> str:
     )
 
 
-def _load_originality_threshold(locale: str) -> float:
-    policy = _load_json(POLICY_PATH)
-    locale_rules = policy.get("locale_rules", {})
-    if locale not in locale_rules:
+def _load_originality_threshold(
+    locale: str,
+    snapshot: Optional[PolicySnapshot] = None,
+) -> float:
+    if snapshot is None:
+        snapshot = current_policy_snapshot()
+    rules = snapshot.rules_for(locale)
+    if rules is None:
         raise ScriptGenerationError(
             code="POLICY_LOCALE_UNSUPPORTED",
             message="locale not found in policy: %s" % locale,
         )
-    return float(locale_rules[locale]["originality_threshold"])
+    return rules.originality_threshold
 
 
 def _default_reference_corpus(segmented_source_analysis: Dict[str, Any]) -> List[str]:
@@ -427,35 +448,280 @@ def _default_reference_corpus(segmented_source_analysis: Dict[str, Any]) -> List
     return references
 
 
+def _reference_corpus_digest(
+    reference_corpus: Optional[
+        Union[Sequence[str], ReferenceCorpusIndex, MappedReferenceCorpus]
+    ],
+) -> Optional[str]:
+    if reference_corpus is None:
+        return "analysis-default"
+    if isinstance(reference_corpus, ReferenceCorpusIndex):
+        return None
+    if isinstance(reference_corpus, MappedReferenceCorpus):
+        stat = reference_corpus.path.stat()
+        return compute_input_digest(
+            [str(reference_corpus.path), stat.st_size, stat.st_mtime_ns]
+        )
+    return compute_input_digest(list(reference_corpus))
+
+
+def _artifact_digests(
+    trend_candidate: Dict[str, Any],
+    segmented_source_analysis: Dict[str, Any],
+    locale: str,
+    originality_threshold: float,
+    corpus_digest: Optional[str],
+) -> Tuple[str, Optional[str]]:
+    pack_digest = compute_input_digest(
+        {
+            "schema_version": PACK_SCHEMA_VERSION,
+            "trend_candidate": trend_candidate,
+            "segmented_source_analysis": segmented_source_analysis,
+            "locale": locale,
+        }
+    )
+    if corpus_digest is None:
+        return pack_digest, None
+    draft_digest = compute_input_digest(
+        {
+            "packs": pack_digest,
+            "originality_threshold": originality_threshold,
+            "reference_corpus": corpus_digest,
+        }
+    )
+    return pack_digest, draft_digest
+
+
 def run_script_generation_pipeline(
     trend_candidate: Dict[str, Any],
     segmented_source_analysis: Dict[str, Any],
     locale: str,
     output_dir: Path,
-    reference_corpus: Optional[Sequence[str]] = None,
+    reference_corpus: Optional[
+        Union[Sequence[str], ReferenceCorpusIndex, MappedReferenceCorpus]
+    ] = None,
     originality_threshold: Optional[float] = None,
+    snapshot: Optional[PolicySnapshot] = None,
+    incremental: bool = False,
+    originality_store: Optional[OriginalityRecordStore] = None,
 ) -> Dict[str, Any]:
+    if snapshot is None:
+        snapshot = current_policy_snapshot()
     if originality_threshold is None:
-        originality_threshold = _load_originality_threshold(locale)
+        originality_threshold = _load_originality_threshold(locale, snapshot)
+
+    digests = None  # type: Optional[Tuple[str, Optional[str]]]
+    if incremental:
+        digests = _artifact_digests(
+            trend_candidate,
+            segmented_source_analysis,
+            locale,
+            originality_threshold,
+            _reference_corpus_digest(reference_corpus),
+        )
+    if reference_corpus is None:
+        reference_corpus = _default_reference_corpus(segmented_source_analysis)
+    corpus = reference_corpus
 
-    summary_pack = build_summary_pack(
-        trend_candidate=trend_candidate,
-        segmented_source_analysis=segmented_source_analysis,
-        locale=locale,
-    )
-    prompt_pack = build_prompt_pack(summary_pack)
+    def build_packs() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        summary_pack = build_summary_pack(
+            trend_candidate=trend_candidate,
+            segmented_source_analysis=segmented_source_analysis,
+            locale=locale,
+        )
+        return summary_pack, build_prompt_pack(summary_pack)
 
-    summary_path = _write_json(output_dir / "summary_pack.json", summary_pack)
-    prompt_path = _write_json(output_dir / "prompt_pack.json", prompt_pack)
+    def score_script(summary_pack: Dict[str, Any]) -> Tuple[Dict[str, str], float]:
+        sections = _build_script_sections(summary_pack)
+        script_text = "%s %s %s" % (sections["hook"], sections["body"], sections["cta"])
+        return sections, compute_similarity_score(script_text, corpus)
 
-    sections = _build_script_sections(summary_pack)
-    draft_id = _stable_id("draft", [summary_pack["candidate_id"], locale, summary_pack["topic"]])
+    return _run_locale(
+        output_dir=output_dir,
+        originality_threshold=originality_threshold,
+        reference_count=len(corpus),
+        snapshot=snapshot,
+        build_packs=build_packs,
+        score_script=score_script,
+        digests=digests,
+        originality_store=originality_store,
+    )
 
+
+def run_script_generation_for_locales(
+    trend_candidate: Dict[str, Any],
+    segmented_source_analysis: Dict[str, Any],
+    locales: Sequence[str],
+    output_dir: Path,
+    reference_corpus: Optional[
+        Union[Sequence[str], ReferenceCorpusIndex, MappedReferenceCorpus]
+    ] = None,
+    originality_thresholds: Optional[Dict[str, float]] = None,
+    snapshot: Optional[PolicySnapshot] = None,
+    incremental: bool = False,
+    originality_store: Optional[OriginalityRecordStore] = None,
+) -> Dict[str, Dict[str, Any]]:
+    unique_locales = list(dict.fromkeys(locales))
+    if not unique_locales:
+        raise ScriptGenerationError(
+            code="LOCALES_REQUIRED",
+            message="at least one locale is required",
+        )
+    if snapshot is None:
+        snapshot = current_policy_snapshot()
+    thresholds = {}  # type: Dict[str, float]
+    for locale in unique_locales:
+        if originality_thresholds is not None and locale in originality_thresholds:
+            thresholds[locale] = originality_thresholds[locale]
+        else:
+            thresholds[locale] = _load_originality_threshold(locale, snapshot)
+
+    corpus_digest = _reference_corpus_digest(reference_corpus) if incremental else None
     if reference_corpus is None:
         reference_corpus = _default_reference_corpus(segmented_source_analysis)
+    corpus = reference_corpus
+    shared = {}  # type: Dict[str, Any]
+
+    def build_packs_for(locale: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if "summary_core" not in shared:
+            shared["summary_core"] = _build_summary_core(
+                trend_candidate,
+                segmented_source_analysis,
+            )
+        summary_pack = _localize_summary_pack(shared["summary_core"], locale)
+        if "prompt_core" not in shared:
+            shared["prompt_core"] = _build_prompt_core(summary_pack)
+        return summary_pack, _localize_prompt_pack(shared["prompt_core"], summary_pack)
+
+    def score_script(summary_pack: Dict[str, Any]) -> Tuple[Dict[str, str], float]:
+        if "score" not in shared:
+            sections = _build_script_sections(summary_pack)
+            script_text = "%s %s %s" % (
+                sections["hook"],
+                sections["body"],
+                sections["cta"],
+            )
+            shared["score"] = (sections, compute_similarity_score(script_text, corpus))
+        return shared["score"]
+
+    results = {}  # type: Dict[str, Dict[str, Any]]
+    for locale in unique_locales:
+        digests = None  # type: Optional[Tuple[str, Optional[str]]]
+        if incremental:
+            digests = _artifact_digests(
+                trend_candidate,
+                segmented_source_analysis,
+                locale,
+                thresholds[locale],
+                corpus_digest,
+            )
+        results[locale] = _run_locale(
+            output_dir=output_dir / locale,
+            originality_threshold=thresholds[locale],
+            reference_count=len(corpus),
+            snapshot=snapshot,
+            build_packs=functools.partial(build_packs_for, locale),
+            score_script=score_script,
+            digests=digests,
+            originality_store=originality_store,
+        )
+    return results
+
 
-    script_text = "%s %s %s" % (sections["hook"], sections["body"], sections["cta"])
-    similarity_score = compute_similarity_score(script_text, reference_corpus)
+def _run_locale(
+    *,
+    output_dir: Path,
+    originality_threshold: float,
+    reference_count: int,
+    snapshot: PolicySnapshot,
+    build_packs: Callable[[], Tuple[Dict[str, Any], Dict[str, Any]]],
+    score_script: Callable[[Dict[str, Any]], Tuple[Dict[str, str], float]],
+    digests: Optional[Tuple[str, Optional[str]]],
+    originality_store: Optional[OriginalityRecordStore],
+) -> Dict[str, Any]:
+    manifest = None  # type: Optional[BuildManifest]
+    summary_pack = None  # type: Optional[Dict[str, Any]]
+    if digests is not None:
+        pack_digest, draft_digest = digests
+        manifest = BuildManifest.for_output_dir(output_dir)
+        if draft_digest is not None:
+            cached = manifest.lookup("script_draft", draft_digest)
+            if cached is not None:
+                cached["policy_snapshot_id"] = snapshot.snapshot_id
+                cached["rebuilt_artifacts"] = []
+                return cached
+        cached_packs = manifest.lookup("packs", pack_digest)
+        if cached_packs is not None:
+            summary_path = Path(cached_packs["summary_pack_path"])
+            prompt_path = Path(cached_packs["prompt_pack_path"])
+            summary_pack = json.loads(summary_path.read_text(encoding="utf-8"))
+
+    rebuilt_artifacts = []  # type: List[str]
+    if summary_pack is None:
+        summary_pack, prompt_pack = build_packs()
+        summary_path = _write_json(output_dir / "summary_pack.json", summary_pack)
+        prompt_path = _write_json(output_dir / "prompt_pack.json", prompt_pack)
+        rebuilt_artifacts.extend(["summary_pack", "prompt_pack"])
+        if manifest is not None:
+            manifest.record(
+                "packs",
+                pack_digest,
+                {
+                    "summary_pack_path": str(summary_path),
+                    "prompt_pack_path": str(prompt_path),
+                },
+                [str(summary_path), str(prompt_path)],
+            )
+
+    sections, similarity_score = score_script(summary_pack)
+    response = _write_draft_artifacts(
+        summary_pack=summary_pack,
+        summary_path=summary_path,
+        prompt_path=prompt_path,
+        sections=sections,
+        similarity_score=similarity_score,
+        reference_count=reference_count,
+        originality_threshold=originality_threshold,
+        output_dir=output_dir,
+        snapshot=snapshot,
+        originality_store=originality_store,
+    )
+    if manifest is None:
+        return response
+
+    rebuilt_artifacts.append("script_draft")
+    if draft_digest is not None:
+        manifest.record(
+            "script_draft",
+            draft_digest,
+            response,
+            [
+                response["summary_pack_path"],
+                response["prompt_pack_path"],
+                response["script_draft_path"],
+                response["originality_record_path"],
+            ],
+        )
+    manifest.save()
+    response["rebuilt_artifacts"] = rebuilt_artifacts
+    return response
+
+
+def _write_draft_artifacts(
+    *,
+    summary_pack: Dict[str, Any],
+    summary_path: Path,
+    prompt_path: Path,
+    sections: Dict[str, str],
+    similarity_score: float,
+    reference_count: int,
+    originality_threshold: float,
+    output_dir: Path,
+    snapshot: PolicySnapshot,
+    originality_store: Optional[OriginalityRecordStore],
+) -> Dict[str, Any]:
+    locale = summary_pack["locale"]
+    draft_id = _stable_id("draft", [summary_pack["candidate_id"], locale, summary_pack["topic"]])
     originality_record = persist_originality_score(
         output_dir=output_dir / "originality",
         draft_id=draft_id,
@@ -463,7 +729,8 @@ def run_script_generation_pipeline(
         locale=locale,
         similarity_score=similarity_score,
         originality_threshold=originality_threshold,
-        reference_count=len(reference_corpus),
+        reference_count=reference_count,
+        record_store=originality_store,
     )
 
     result_code = (
@@ -496,6 +763,7 @@ def run_script_generation_pipeline(
         "prompt_pack_path": str(prompt_path),
         "script_draft_path": str(script_draft_path),
         "originality_record_path": originality_record["path"],
+        "policy_snapshot_id": snapshot.snapshot_id,
     }
     if result_code != "PASS":
         response["rejection"] = {
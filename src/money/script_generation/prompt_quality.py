@@ -0,0 +1,62 @@
+from typing import Any, Dict, List, Sequence, Set
+
+from money.matching import get_phrase_matcher
+
+AMBIGUOUS_TOKENS = frozenset(["thing", "things", "stuff", "maybe", "somehow", "etc"])
+POLICY_VIOLATION_PHRASES = (
+    "guaranteed profit",
+    "risk free return",
+    "medical cure",
+    "illegal trick",
+    "bet now",
+)
+TOKEN_STRIP_CHARACTERS = ".,:;!?()[]{}\""
+
+
+def scan_prompt_quality(scene_prompts: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    matcher = get_phrase_matcher(POLICY_VIOLATION_PHRASES)
+    token_count = 0
+    ambiguous_count = 0
+    violated = set()  # type: Set[str]
+    prompt_breakdown = []  # type: List[Dict[str, Any]]
+
+    for scene_prompt in scene_prompts:
+        lowered_text = scene_prompt["prompt_text"].lower()
+        prompt_token_count = 0
+        ambiguous_hits = []  # type: List[str]
+        for raw_word in lowered_text.split():
+            cleaned_word = raw_word.strip(TOKEN_STRIP_CHARACTERS)
+            if not cleaned_word:
+                continue
+            prompt_token_count += 1
+            if cleaned_word in AMBIGUOUS_TOKENS:
+                ambiguous_hits.append(cleaned_word)
+
+        found = matcher.find(lowered_text, lowered=True)
+        policy_hits = [phrase for phrase in POLICY_VIOLATION_PHRASES if phrase in found]
+        violated.update(policy_hits)
+        token_count += prompt_token_count
+        ambiguous_count += len(ambiguous_hits)
+        prompt_breakdown.append(
+            {
+                "beat_index": scene_prompt.get("beat_index"),
+                "token_count": prompt_token_count,
+                "ambiguous_tokens": ambiguous_hits,
+                "policy_violations": policy_hits,
+            }
+        )
+
+    if token_count == 0:
+        ambiguity_score = 1.0
+    else:
+        ambiguity_score = round(float(ambiguous_count) / float(token_count), 4)
+
+    return {
+        "token_count": token_count,
+        "ambiguous_count": ambiguous_count,
+        "ambiguity_score": ambiguity_score,
+        "policy_violations": [
+            phrase for phrase in POLICY_VIOLATION_PHRASES if phrase in violated
+        ],
+        "prompt_breakdown": prompt_breakdown,
+    }
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 
 SUMMARY_PACK_SCHEMA = {
@@ -257,99 +257,218 @@ def _check_type(value: Any, schema_type: str) -> bool:
     return False
 
 
-def _validate_schema_node(value: Any, schema: Dict[str, Any], field_path: str) -> None:
-    schema_type = schema.get("type")
-    if schema_type is not None and not _check_type(value, schema_type):
-        raise PackValidationError(
-            code="PACK_TYPE_MISMATCH",
-            field=field_path,
-            message="type mismatch at %s" % field_path,
-        )
+class _PackIssue:
+    __slots__ = ("code", "message", "segments")
 
-    enum_values = schema.get("enum")
-    if enum_values is not None and value not in enum_values:
-        raise PackValidationError(
-            code="PACK_ENUM_VIOLATION",
+    def __init__(self, code: str, message: str, segments: List[str]) -> None:
+        self.code = code
+        self.message = message
+        self.segments = segments
+
+    def to_error(self, root_path: str) -> PackValidationError:
+        field_path = root_path + "".join(reversed(self.segments))
+        return PackValidationError(
+            code=self.code,
             field=field_path,
-            message="enum violation at %s" % field_path,
+            message=self.message % field_path,
         )
 
-    if schema_type == "string":
-        min_length = schema.get("minLength")
-        if min_length is not None and len(value) < min_length:
-            raise PackValidationError(
-                code="PACK_VALUE_RANGE",
-                field=field_path,
-                message="string too short at %s" % field_path,
-            )
 
+NodeValidator = Callable[[Any, List[_PackIssue], bool], bool]
+
+
+def _is_string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, list)
+
+
+def _is_object(value: Any) -> bool:
+    return isinstance(value, dict)
+
+
+_TYPE_CHECKERS = {
+    "string": _is_string,
+    "number": _is_number,
+    "integer": _is_integer,
+    "boolean": _is_boolean,
+    "array": _is_array,
+    "object": _is_object,
+}  # type: Dict[str, Callable[[Any], bool]]
+
+
+def _type_checker(schema_type: str) -> Callable[[Any], bool]:
+    checker = _TYPE_CHECKERS.get(schema_type)
+    if checker is not None:
+        return checker
+
+    def _check(value: Any) -> bool:
+        return _check_type(value, schema_type)
+
+    return _check
+
+
+def _prefix_issues(issues: List[_PackIssue], start: int, segment: str) -> None:
+    for index in range(start, len(issues)):
+        issues[index].segments.append(segment)
+
+
+def _compile_node(schema: Dict[str, Any]) -> NodeValidator:
+    schema_type = schema.get("type")
+    type_check = _type_checker(schema_type) if schema_type is not None else None
+    enum_values = schema.get("enum")
+    min_length = schema.get("minLength") if schema_type == "string" else None
+    minimum = None
+    maximum = None
     if schema_type in {"number", "integer"}:
         minimum = schema.get("minimum")
         maximum = schema.get("maximum")
+
+    min_items = None
+    item_validator = None  # type: Optional[NodeValidator]
+    if schema_type == "array":
+        min_items = schema.get("minItems")
+        if schema.get("items") is not None:
+            item_validator = _compile_node(schema["items"])
+
+    is_object = schema_type == "object"
+    required = tuple(schema.get("required", [])) if is_object else ()
+    allowed_fields = None  # type: Optional[FrozenSet[str]]
+    property_validators = ()  # type: Tuple[Tuple[str, NodeValidator], ...]
+    if is_object:
+        properties = schema.get("properties", {})
+        if schema.get("additionalProperties") is False:
+            allowed_fields = frozenset(properties.keys())
+        property_validators = tuple(
+            (name, _compile_node(property_schema))
+            for name, property_schema in properties.items()
+        )
+
+    def _validate(value: Any, issues: List[_PackIssue], collect: bool) -> bool:
+        if type_check is not None and not type_check(value):
+            issues.append(_PackIssue("PACK_TYPE_MISMATCH", "type mismatch at %s", []))
+            return False
+        if enum_values is not None and value not in enum_values:
+            issues.append(_PackIssue("PACK_ENUM_VIOLATION", "enum violation at %s", []))
+            return False
+        if min_length is not None and len(value) < min_length:
+            issues.append(_PackIssue("PACK_VALUE_RANGE", "string too short at %s", []))
+            return False
         if minimum is not None and value < minimum:
-            raise PackValidationError(
-                code="PACK_VALUE_RANGE",
-                field=field_path,
-                message="value below minimum at %s" % field_path,
+            issues.append(
+                _PackIssue("PACK_VALUE_RANGE", "value below minimum at %s", [])
             )
+            return False
         if maximum is not None and value > maximum:
-            raise PackValidationError(
-                code="PACK_VALUE_RANGE",
-                field=field_path,
-                message="value above maximum at %s" % field_path,
+            issues.append(
+                _PackIssue("PACK_VALUE_RANGE", "value above maximum at %s", [])
             )
+            return False
 
-    if schema_type == "array":
-        min_items = schema.get("minItems")
+        valid = True
         if min_items is not None and len(value) < min_items:
-            raise PackValidationError(
-                code="PACK_VALUE_RANGE",
-                field=field_path,
-                message="array too short at %s" % field_path,
-            )
-        item_schema = schema.get("items")
-        if item_schema is not None:
+            issues.append(_PackIssue("PACK_VALUE_RANGE", "array too short at %s", []))
+            if not collect:
+                return False
+            valid = False
+        if item_validator is not None:
             for index, item in enumerate(value):
-                _validate_schema_node(
-                    item,
-                    item_schema,
-                    "%s[%d]" % (field_path, index),
-                )
+                start = len(issues)
+                if not item_validator(item, issues, collect):
+                    _prefix_issues(issues, start, "[%d]" % index)
+                    if not collect:
+                        return False
+                    valid = False
 
-    if schema_type == "object":
-        properties = schema.get("properties", {})
-        required = schema.get("required", [])
+        if not is_object:
+            return valid
 
         for required_field in required:
             if required_field not in value:
-                raise PackValidationError(
-                    code="PACK_REQUIRED_FIELD",
-                    field="%s.%s" % (field_path, required_field),
-                    message="missing required field %s.%s"
-                    % (field_path, required_field),
+                issues.append(
+                    _PackIssue(
+                        "PACK_REQUIRED_FIELD",
+                        "missing required field %s",
+                        [".%s" % required_field],
+                    )
                 )
+                if not collect:
+                    return False
+                valid = False
 
-        if schema.get("additionalProperties") is False:
-            extra_fields = sorted(set(value.keys()) - set(properties.keys()))
+        if allowed_fields is not None:
+            extra_fields = [field for field in value if field not in allowed_fields]
             if extra_fields:
-                raise PackValidationError(
-                    code="PACK_ADDITIONAL_PROPERTY",
-                    field="%s.%s" % (field_path, extra_fields[0]),
-                    message="additional property is not allowed at %s.%s"
-                    % (field_path, extra_fields[0]),
-                )
+                extra_fields.sort()
+                if not collect:
+                    extra_fields = extra_fields[:1]
+                for extra_field in extra_fields:
+                    issues.append(
+                        _PackIssue(
+                            "PACK_ADDITIONAL_PROPERTY",
+                            "additional property is not allowed at %s",
+                            [".%s" % extra_field],
+                        )
+                    )
+                if not collect:
+                    return False
+                valid = False
 
-        for property_name, property_schema in properties.items():
-            if property_name in value:
-                _validate_schema_node(
-                    value[property_name],
-                    property_schema,
-                    "%s.%s" % (field_path, property_name),
-                )
+        for property_name, property_validator in property_validators:
+            if property_name not in value:
+                continue
+            start = len(issues)
+            if not property_validator(value[property_name], issues, collect):
+                _prefix_issues(issues, start, ".%s" % property_name)
+                if not collect:
+                    return False
+                valid = False
+
+        return valid
+
+    return _validate
+
+
+class CompiledPackSchema:
+    def __init__(self, schema: Dict[str, Any], root_path: str) -> None:
+        self.root_path = root_path
+        self._validate_node = _compile_node(schema)
+
+    def validate(self, payload: Any) -> None:
+        issues = []  # type: List[_PackIssue]
+        if not self._validate_node(payload, issues, False):
+            raise issues[0].to_error(self.root_path)
+
+    def collect_errors(self, payload: Any) -> List[PackValidationError]:
+        issues = []  # type: List[_PackIssue]
+        self._validate_node(payload, issues, True)
+        return [issue.to_error(self.root_path) for issue in issues]
+
+
+def compile_pack_schema(schema: Dict[str, Any], root_path: str) -> CompiledPackSchema:
+    return CompiledPackSchema(schema, root_path)
+
+
+_SUMMARY_PACK_VALIDATOR = compile_pack_schema(SUMMARY_PACK_SCHEMA, "summary_pack")
+_PROMPT_PACK_VALIDATOR = compile_pack_schema(PROMPT_PACK_SCHEMA, "prompt_pack")
 
 
 def validate_summary_pack(payload: Dict[str, Any]) -> Dict[str, str]:
-    _validate_schema_node(payload, SUMMARY_PACK_SCHEMA, "summary_pack")
+    _SUMMARY_PACK_VALIDATOR.validate(payload)
     return {
         "status": "accepted",
         "result_code": "PASS",
@@ -358,9 +477,17 @@ def validate_summary_pack(payload: Dict[str, Any]) -> Dict[str, str]:
 
 
 def validate_prompt_pack(payload: Dict[str, Any]) -> Dict[str, str]:
-    _validate_schema_node(payload, PROMPT_PACK_SCHEMA, "prompt_pack")
+    _PROMPT_PACK_VALIDATOR.validate(payload)
     return {
         "status": "accepted",
         "result_code": "PASS",
         "entity": "prompt_pack",
     }
+
+
+def collect_summary_pack_errors(payload: Dict[str, Any]) -> List[PackValidationError]:
+    return _SUMMARY_PACK_VALIDATOR.collect_errors(payload)
+
+
+def collect_prompt_pack_errors(payload: Dict[str, Any]) -> List[PackValidationError]:
+    return _PROMPT_PACK_VALIDATOR.collect_errors(payload)
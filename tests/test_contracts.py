@@ -0,0 +1,251 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from money.contracts import (
+    ContractRegistry,
+    ContractValidationError,
+    PolicySnapshot,
+    PolicySnapshotCache,
+)
+from money.contracts.policy_snapshot import POLICY_PATH
+from money.contracts.registry import SCHEMA_PATH
+from money.contracts.validate_task1 import (
+    evaluate_policy,
+    validate_contract,
+    validate_contract_batch,
+)
+from money.localization.policy_gate import evaluate_localized_variant_policy
+
+
+def _trend_payload() -> Dict[str, Any]:
+    return {
+        "candidate_id": "trend-001",
+        "source_platform": "youtube",
+        "external_id": "abc123",
+        "topic": "budget hacks",
+        "signal_score": 0.66,
+        "captured_at": "2026-02-16T00:00:00Z",
+    }
+
+
+def test_registry_validates_without_rereading_schema(tmp_path: Path) -> None:
+    schema_path = tmp_path / "contracts.schema.json"
+    shutil.copyfile(str(SCHEMA_PATH), str(schema_path))
+    registry = ContractRegistry(schema_path)
+    schema_path.unlink()
+
+    registry.validate("trend_candidate", _trend_payload())
+
+    payload = _trend_payload()
+    payload["source_platform"] = "vimeo"
+    with pytest.raises(ContractValidationError) as error:
+        registry.validate("trend_candidate", payload)
+    assert error.value.code == "CONTRACT_ENUM_VIOLATION"
+    assert error.value.field == "source_platform"
+
+
+def test_registry_resolves_ref_enums_and_reloads_on_mtime_change(
+    tmp_path: Path,
+) -> None:
+    schema_path = tmp_path / "contracts.schema.json"
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+    registry = ContractRegistry(schema_path)
+
+    receipt = {
+        "event_id": "evt-1",
+        "receipt_id": "receipt-1",
+        "locale": "KO-KR",
+        "platform": "youtube",
+        "gross_revenue": 1.0,
+        "net_revenue": 0.5,
+        "currency": "USD",
+        "event_timestamp": "2026-02-16T00:00:00Z",
+    }
+    with pytest.raises(ContractValidationError) as error:
+        registry.validate("revenue_event", receipt)
+    assert error.value.code == "CONTRACT_ENUM_VIOLATION"
+    assert error.value.field == "locale"
+    assert registry.reload_if_changed() is False
+
+    schema["$defs"]["locale_code"]["enum"].append("KO-KR")
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+    _bump_mtime(schema_path)
+
+    assert registry.reload_if_changed() is True
+    registry.validate("revenue_event", receipt)
+
+
+def test_validate_contract_keeps_first_error_semantics() -> None:
+    payload = _trend_payload()
+    payload.pop("topic")
+    payload["unexpected"] = True
+
+    with pytest.raises(ContractValidationError) as error:
+        validate_contract("trend_candidate", payload)
+    assert error.value.code == "CONTRACT_REQUIRED_FIELD"
+    assert error.value.field == "topic"
+
+    payload = _trend_payload()
+    payload["signal_score"] = 1.5
+    with pytest.raises(ContractValidationError) as error:
+        validate_contract("trend_candidate", payload)
+    assert error.value.code == "CONTRACT_TYPE_MISMATCH"
+    assert "above maximum" in str(error.value)
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+
+def test_policy_snapshot_is_immutable_and_shared_until_policy_changes(
+    tmp_path: Path,
+) -> None:
+    policy_path = tmp_path / "policy.json"
+    policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    policy_path.write_text(json.dumps(policy), encoding="utf-8")
+    cache = PolicySnapshotCache(policy_path)
+
+    first = cache.current()
+    rules = first.rules_for("JA-JP")
+    assert rules is not None
+    assert "deceptive_before_after" in rules.blocked_categories
+    assert isinstance(rules.blocked_categories, frozenset)
+    with pytest.raises(TypeError):
+        rules.category_reason_code["new"] = "X"  # type: ignore[index]
+    assert cache.current() is first
+    assert cache.reload_if_changed() is False
+
+    _bump_mtime(policy_path)
+    assert cache.reload_if_changed() is False
+    assert cache.current() is first
+
+    policy["policy_version"] = "2026-03-01"
+    policy["locale_rules"]["JA-JP"]["originality_threshold"] = 0.5
+    policy_path.write_text(json.dumps(policy), encoding="utf-8")
+    _bump_mtime(policy_path)
+    assert cache.reload_if_changed() is True
+
+    second = cache.current()
+    assert second.policy_version == "2026-03-01"
+    assert second.snapshot_id != first.snapshot_id
+    assert cache.get(first.policy_version) is first
+
+    blocked = evaluate_policy("JA-JP", [], 0.6, snapshot=second)
+    allowed = evaluate_policy("JA-JP", [], 0.6, snapshot=first)
+    assert blocked["policy_code"] == "POLICY_SIMILARITY_THRESHOLD_EXCEEDED"
+    assert blocked["policy_snapshot_id"] == second.snapshot_id
+    assert allowed["result_code"] == "ALLOW"
+    assert allowed["policy_snapshot_id"] == first.snapshot_id
+
+
+def _receipt(index: int) -> Dict[str, Any]:
+    return {
+        "receipt_id": "receipt-%d" % index,
+        "variant_id": "variant-%d" % index,
+        "platform": "youtube",
+        "publish_status": "success",
+        "platform_post_id": "post-%d" % index,
+        "idempotency_key": "key-%d" % index,
+        "published_at": "2026-02-16T00:00:00Z",
+    }
+
+
+def test_batch_validation_reports_every_error_without_raising() -> None:
+    records = [_receipt(index) for index in range(4)]
+    records[1]["platform"] = "vimeo"
+    records[1]["extra_b"] = 1
+    records[1]["extra_a"] = 2
+    records[3].pop("variant_id")
+
+    report = validate_contract_batch("publish_receipt", iter(records))
+
+    assert report["status"] == "rejected"
+    assert report["result_code"] == "BLOCKED_CONTRACT"
+    assert report["record_count"] == 4
+    assert report["valid_count"] == 2
+    assert report["invalid_count"] == 2
+    assert report["error_counts"] == {
+        "CONTRACT_ADDITIONAL_PROPERTY": 2,
+        "CONTRACT_ENUM_VIOLATION": 1,
+        "CONTRACT_REQUIRED_FIELD": 1,
+    }
+    assert [entry["index"] for entry in report["record_errors"]] == [1, 3]
+    assert [error["field"] for error in report["record_errors"][0]["errors"]] == [
+        "extra_a",
+        "extra_b",
+        "platform",
+    ]
+
+
+def test_batch_validation_accepts_columnar_input() -> None:
+    records = [_receipt(index) for index in range(3)]
+    columns = {field: [record[field] for record in records] for field in records[0]}
+    columns["publish_status"][2] = "unknown"
+
+    report = validate_contract_batch("publish_receipt", columns)
+
+    assert report["record_count"] == 3
+    assert report["invalid_count"] == 1
+    assert report["record_errors"][0]["index"] == 2
+    assert report["record_errors"][0]["errors"][0]["code"] == "CONTRACT_ENUM_VIOLATION"
+
+    columns["platform"] = columns["platform"][:2]
+    with pytest.raises(ContractValidationError) as error:
+        validate_contract_batch("publish_receipt", columns)
+    assert error.value.field == "platform"
+
+
+def test_policy_snapshot_cache_refreshes_on_throttled_current_calls(
+    tmp_path: Path,
+) -> None:
+    policy_path = tmp_path / "policy.json"
+    policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    policy_path.write_text(json.dumps(policy), encoding="utf-8")
+    clock = [100.0]
+    cache = PolicySnapshotCache(
+        policy_path,
+        refresh_interval_seconds=30.0,
+        clock=lambda: clock[0],
+    )
+    first = cache.current()
+
+    policy["policy_version"] = "2026-04-01"
+    policy_path.write_text(json.dumps(policy), encoding="utf-8")
+    _bump_mtime(policy_path)
+
+    clock[0] = 129.0
+    assert cache.current() is first
+
+    clock[0] = 130.0
+    second = cache.current()
+    assert second.policy_version == "2026-04-01"
+
+    policy_path.write_text("{not json", encoding="utf-8")
+    _bump_mtime(policy_path)
+    clock[0] = 200.0
+    assert cache.current() is second
+
+
+def test_localized_policy_gate_uses_the_supplied_snapshot(tmp_path: Path) -> None:
+    policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    policy["policy_version"] = "2026-05-01"
+    policy["locale_rules"]["EN-US"]["originality_threshold"] = 0.1
+    strict = PolicySnapshot.from_text(json.dumps(policy))
+
+    result = evaluate_localized_variant_policy(
+        locale="EN-US",
+        localized_script="a plain budgeting checklist",
+        similarity_score=0.2,
+        snapshot=strict,
+    )
+
+    assert result["policy_code"] == "POLICY_SIMILARITY_THRESHOLD_EXCEEDED"
+    assert result["originality_threshold"] == 0.1
+    assert result["policy_snapshot_id"] == strict.snapshot_id
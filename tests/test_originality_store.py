@@ -0,0 +1,173 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from money.script_generation import OriginalityRecordStore, OriginalityStoreError
+from money.script_generation.originality import persist_originality_score
+from money.script_generation.pipeline import run_script_generation_pipeline
+
+
+def _persist(store: OriginalityRecordStore, index: int, score: float) -> Dict[str, Any]:
+    return persist_originality_score(
+        output_dir=store.root / "unused",
+        draft_id="draft-%03d" % index,
+        candidate_id="trend-%03d" % index,
+        locale="EN-US",
+        similarity_score=score,
+        originality_threshold=0.8,
+        reference_count=3,
+        record_store=store,
+    )
+
+
+def test_store_appends_rotates_and_reopens(tmp_path: Path) -> None:
+    with OriginalityRecordStore(tmp_path / "store", max_segment_bytes=600) as store:
+        for index in range(10):
+            record = _persist(store, index, 0.1)
+        assert store.segment_count > 1
+        assert record["path"] == str(store.segment_path(store.segment_count))
+        assert not (tmp_path / "store" / "unused").exists()
+
+    reopened = OriginalityRecordStore(tmp_path / "store", max_segment_bytes=600)
+    assert len(reopened) == 10
+    stored = reopened.get("draft-007")
+    assert stored is not None
+    assert stored["candidate_id"] == "trend-007"
+    assert stored["result_code"] == "PASS"
+    assert reopened.get("draft-999") is None
+    reopened.close()
+
+
+def test_store_compaction_drops_superseded_records(tmp_path: Path) -> None:
+    store = OriginalityRecordStore(tmp_path / "store", max_segment_bytes=600)
+    for index in range(6):
+        _persist(store, index, 0.1)
+    for index in range(6):
+        _persist(store, index, 0.9)
+    segments_before = store.segment_count
+
+    summary = store.compact()
+
+    assert summary["record_count"] == 6
+    assert summary["dropped_count"] == 6
+    assert summary["segment_count_before"] == segments_before
+    assert summary["segment_count_after"] < segments_before
+    latest = store.get("draft-003")
+    assert latest is not None
+    assert latest["result_code"] == "BLOCKED_ORIGINALITY"
+    _persist(store, 42, 0.2)
+    store.close()
+
+    reopened = OriginalityRecordStore(tmp_path / "store", max_segment_bytes=600)
+    assert len(reopened) == 7
+    reopened.close()
+
+
+def test_store_ignores_generations_left_by_an_interrupted_compaction(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "store"
+    with OriginalityRecordStore(root, max_segment_bytes=600) as store:
+        for index in range(4):
+            _persist(store, index, 0.1)
+        live_dir = store.generation_dir
+    unfinished_dir = root / "generation-000002"
+    unfinished_dir.mkdir()
+    (unfinished_dir / "index.ndjson").write_text('{"draft_id": "d', encoding="utf-8")
+
+    with OriginalityRecordStore(root, max_segment_bytes=600) as store:
+        assert store.generation_dir == live_dir
+        assert len(store) == 4
+        assert not unfinished_dir.exists()
+        store.compact()
+        compacted_dir = store.generation_dir
+    assert compacted_dir != live_dir
+    assert not live_dir.exists()
+    current = (root / "CURRENT").read_text(encoding="utf-8")
+    assert current.strip() == compacted_dir.name
+
+    live_dir.mkdir()
+    (live_dir / "segment-000001.ndjson").write_bytes(b"stale\n")
+    with OriginalityRecordStore(root, max_segment_bytes=600) as store:
+        assert store.generation_dir == compacted_dir
+        assert len(store) == 4
+    assert not live_dir.exists()
+
+
+def test_store_export_matches_per_draft_layout(tmp_path: Path) -> None:
+    legacy = persist_originality_score(
+        output_dir=tmp_path / "legacy",
+        draft_id="draft-001",
+        candidate_id="trend-001",
+        locale="EN-US",
+        similarity_score=0.1,
+        originality_threshold=0.8,
+        reference_count=3,
+    )
+    with OriginalityRecordStore(tmp_path / "store") as store:
+        _persist(store, 1, 0.1)
+        exported = store.export_json(tmp_path / "export")
+
+    assert exported == 1
+    exported_text = (tmp_path / "export" / "draft-001.json").read_text(encoding="utf-8")
+    assert exported_text == Path(legacy["path"]).read_text(encoding="utf-8")
+
+
+def test_store_recovers_unindexed_tail_and_partial_line(tmp_path: Path) -> None:
+    with OriginalityRecordStore(tmp_path / "store") as store:
+        _persist(store, 1, 0.1)
+        segment_path = store.segment_path(1)
+    with segment_path.open("ab") as handle:
+        handle.write(json.dumps({"draft_id": "draft-002"}).encode("utf-8") + b"\n")
+        handle.write(b'{"draft_id": "draft-0')
+
+    with OriginalityRecordStore(tmp_path / "store") as store:
+        assert len(store) == 2
+        assert store.get("draft-002") == {"draft_id": "draft-002"}
+        assert segment_path.read_bytes().endswith(b"\n")
+        _persist(store, 3, 0.1)
+        assert store.get("draft-003") is not None
+
+
+def test_store_requires_draft_id(tmp_path: Path) -> None:
+    with OriginalityRecordStore(tmp_path / "store") as store:
+        with pytest.raises(OriginalityStoreError) as error:
+            store.append({"candidate_id": "trend-001"})
+    assert error.value.code == "ORIGINALITY_RECORD_DRAFT_ID_REQUIRED"
+
+
+def test_pipeline_writes_originality_records_to_store(tmp_path: Path) -> None:
+    trend_candidate = {
+        "candidate_id": "trend-001",
+        "topic": "weekly grocery budgeting",
+    }
+    analysis = {
+        "analysis_id": "analysis-001",
+        "source_facts": [],
+        "segments": [
+            {
+                "segment_id": "seg-%d" % index,
+                "start_ms": index * 1500,
+                "end_ms": (index + 1) * 1500,
+                "summary": "budget step number %d for the week" % index,
+            }
+            for index in range(3)
+        ],
+    }
+    with OriginalityRecordStore(tmp_path / "store") as store:
+        result = run_script_generation_pipeline(
+            trend_candidate=trend_candidate,
+            segmented_source_analysis=analysis,
+            locale="EN-US",
+            output_dir=tmp_path / "script",
+            originality_store=store,
+        )
+        draft = result["script_draft"]
+        record = store.get(draft["draft_id"])
+
+    assert record is not None
+    assert record["similarity_trace_id"] == draft["similarity_trace_id"]
+    assert result["originality_record_path"] == str(store.segment_path(1))
+    assert not (tmp_path / "script" / "originality").exists()
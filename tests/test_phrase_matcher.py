@@ -0,0 +1,41 @@
+from money.localization.policy_gate import evaluate_localized_variant_policy
+from money.matching import PhraseMatcher, get_phrase_matcher
+
+
+def test_matcher_finds_overlapping_and_nested_phrases_case_insensitively() -> None:
+    phrases = ["he", "she", "his", "hers", "Risk Free", "free return"]
+    matcher = PhraseMatcher(phrases)
+    text = "Ushers promise a RISK FREE RETURN"
+
+    found = matcher.find(text)
+
+    assert found == {phrase for phrase in phrases if phrase.lower() in text.lower()}
+    assert found == {"he", "she", "hers", "Risk Free", "free return"}
+    assert matcher.contains_any(text)
+    assert not matcher.contains_any("nothing to see")
+
+
+def test_matcher_handles_multibyte_phrases() -> None:
+    matcher = PhraseMatcher(["絶対に治る", "違法"])
+
+    assert matcher.find("この方法は絶対に治るとは言えない") == {"絶対に治る"}
+    assert matcher.find("") == set()
+
+
+def test_matcher_cache_reuses_automaton_per_phrase_set() -> None:
+    first = get_phrase_matcher(["casino", "gambling"])
+    second = get_phrase_matcher(("gambling", "casino"))
+
+    assert first is second
+    assert get_phrase_matcher(["casino"]) is not first
+
+
+def test_policy_gate_detects_locale_keywords_with_matcher() -> None:
+    result = evaluate_localized_variant_policy(
+        locale="EN-SEA",
+        localized_script="Join the CASINO night for a crypto guarantee bonus",
+        similarity_score=0.1,
+    )
+
+    assert result["categories"] == ["crypto_guarantee", "gambling_promotion"]
+    assert result["result_code"] == "BLOCKED_POLICY"
@@ -0,0 +1,119 @@
+import pickle
+import random
+from pathlib import Path
+
+import pytest
+
+from money.script_generation import (
+    MappedCorpusError,
+    MappedReferenceCorpus,
+    ReferenceCorpusIndex,
+    build_mapped_reference_corpus,
+)
+from money.script_generation.originality import compute_similarity_score
+
+VOCABULARY = [
+    "budget",
+    "pantry",
+    "weekly",
+    "grocery",
+    "checklist",
+    "savings",
+    "invest",
+    "index",
+    "fund",
+    "credit",
+    "score",
+    "debt",
+    "snowball",
+    "meal",
+    "prep",
+    "cashback",
+    "reset",
+    "audit",
+    "cap",
+    "drift",
+]
+
+
+def _random_text(generator: random.Random) -> str:
+    words = [generator.choice(VOCABULARY) for _ in range(generator.randint(0, 9))]
+    return " ".join(words)
+
+
+def test_exact_index_matches_linear_jaccard_scan() -> None:
+    generator = random.Random(7)
+    references = [_random_text(generator) for _ in range(300)]
+    index = ReferenceCorpusIndex(references[:150])
+    index.add_many(references[150:])
+    assert len(index) == 300
+
+    for _ in range(100):
+        script_text = _random_text(generator) + " unseen tokens"
+        assert compute_similarity_score(script_text, index) == compute_similarity_score(
+            script_text,
+            references,
+        )
+
+
+def test_lsh_mode_finds_near_duplicates_and_supports_incremental_add() -> None:
+    generator = random.Random(11)
+    index = ReferenceCorpusIndex(mode="lsh")
+    for position in range(200):
+        words = [generator.choice(VOCABULARY) for _ in range(12)]
+        index.add(" ".join("ref%d%s" % (position, word) for word in words))
+    script_text = "weekly pantry audit with a fixed grocery cap and drift review"
+    assert index.best_similarity(script_text) == 0.0
+
+    index.add(script_text + " bonus")
+    expected = compute_similarity_score(script_text, [script_text + " bonus"])
+    assert compute_similarity_score(script_text, index) == expected
+    assert index.best_similarity(script_text, mode="exact") == index.best_similarity(
+        script_text
+    )
+
+
+
+def test_mapped_corpus_matches_linear_scan_and_reopens_after_pickle(
+    tmp_path: Path,
+) -> None:
+    generator = random.Random(23)
+    references = [_random_text(generator) for _ in range(120)]
+    corpus_path = build_mapped_reference_corpus(references, tmp_path / "refs.mrc")
+
+    with MappedReferenceCorpus(corpus_path) as corpus:
+        assert len(corpus) == 120
+        assert corpus.token_id("budget") is not None
+        assert corpus.token_id("missing") is None
+        for _ in range(60):
+            script_text = _random_text(generator) + " unseen tokens"
+            expected = compute_similarity_score(script_text, references)
+            assert compute_similarity_score(script_text, corpus) == expected
+
+        restored = pickle.loads(pickle.dumps(corpus))
+        assert restored.reference_token_ids(5) == corpus.reference_token_ids(5)
+        restored.close()
+
+    (tmp_path / "broken.mrc").write_bytes(b"nope")
+    with pytest.raises(MappedCorpusError) as error:
+        MappedReferenceCorpus(tmp_path / "broken.mrc")
+    assert error.value.code == "MAPPED_CORPUS_INVALID"
+
+
+def test_mapped_corpus_rejects_truncated_and_empty_files(tmp_path: Path) -> None:
+    generator = random.Random(29)
+    references = [_random_text(generator) for _ in range(20)]
+    corpus_path = build_mapped_reference_corpus(references, tmp_path / "refs.mrc")
+    payload = corpus_path.read_bytes()
+
+    candidates = {
+        "empty.mrc": b"",
+        "header-only.mrc": payload[:24],
+        "truncated-offsets.mrc": payload[: len(payload) // 3],
+        "truncated-ids.mrc": payload[:-4],
+    }
+    for name, content in candidates.items():
+        (tmp_path / name).write_bytes(content)
+        with pytest.raises(MappedCorpusError) as error:
+            MappedReferenceCorpus(tmp_path / name)
+        assert error.value.code == "MAPPED_CORPUS_INVALID"
@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from money.scene_generation import (
+    ConcurrentSceneRenderer,
+    HttpSeedanceClient,
+    SceneAssetCache,
+    SceneGenerationError,
+    SeedanceStubServer,
+    run_seedance_scene_generation,
+    scene_cache_key,
+)
+from money.script_generation.pipeline import build_prompt_pack, build_summary_pack
+
+
+def _prompt_pack(locale: str) -> Dict[str, Any]:
+    summary_pack = build_summary_pack(
+        trend_candidate={"candidate_id": "trend-001", "topic": "weekly meal prep"},
+        segmented_source_analysis={
+            "analysis_id": "analysis-001",
+            "source_facts": [],
+            "segments": [
+                {
+                    "segment_id": "seg-%d" % index,
+                    "start_ms": index * 1200,
+                    "end_ms": (index + 1) * 1200,
+                    "summary": "prep step %d with a labelled container" % index,
+                }
+                for index in range(3)
+            ],
+        },
+        locale=locale,
+    )
+    return build_prompt_pack(summary_pack)
+
+
+def test_cache_evicts_least_recently_used_entries() -> None:
+    cache = SceneAssetCache(max_entries=2)
+    cache.put("a", {"scene_asset_uri": "seedance://a"})
+    cache.put("b", {"scene_asset_uri": "seedance://b"})
+    assert cache.get("a") is not None
+    cache.put("c", {"scene_asset_uri": "seedance://c"})
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.stats() == {
+        "entries": 2,
+        "bytes": cache.total_bytes,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_cache_respects_byte_budget() -> None:
+    cache = SceneAssetCache(max_entries=10, max_bytes=100)
+    cache.put("a", {"scene_asset_uri": "seedance://a", "asset_bytes": 60})
+    cache.put("b", {"scene_asset_uri": "seedance://b", "asset_bytes": 30})
+    cache.put("c", {"scene_asset_uri": "seedance://c", "asset_bytes": 30})
+
+    assert "a" not in cache
+    assert cache.total_bytes == 60
+    oversized = {"scene_asset_uri": "seedance://x", "asset_bytes": 101}
+    assert not cache.put("huge", oversized)
+    assert "huge" not in cache
+
+
+def test_identical_beats_across_locales_render_once(tmp_path: Path) -> None:
+    cache = SceneAssetCache()
+    en_us_pack = _prompt_pack("EN-US")
+    en_sea_pack = _prompt_pack("EN-SEA")
+    assert en_us_pack["prompt_pack_id"] != en_sea_pack["prompt_pack_id"]
+
+    with SeedanceStubServer() as server:
+        renderer = ConcurrentSceneRenderer(client=HttpSeedanceClient(server.base_url))
+        en_us = run_seedance_scene_generation(
+            prompt_pack=en_us_pack,
+            output_dir=tmp_path / "en-us",
+            renderer=renderer,
+            asset_cache=cache,
+        )
+        en_sea = run_seedance_scene_generation(
+            prompt_pack=en_sea_pack,
+            output_dir=tmp_path / "en-sea",
+            renderer=renderer,
+            asset_cache=cache,
+        )
+
+    assert len(server.requests) == 3
+    assert en_us["rendered_scene_count"] == 3
+    assert en_sea["rendered_scene_count"] == 0
+    assert [asset["scene_asset_uri"] for asset in en_sea["scene_assets"]] == [
+        asset["scene_asset_uri"] for asset in en_us["scene_assets"]
+    ]
+    for asset in en_sea["scene_assets"]:
+        assert Path(asset["scene_asset_path"]).exists()
+    assert cache.stats()["hits"] == 3
+    first_prompt = en_us_pack["scene_prompts"][0]
+    assert (
+        scene_cache_key(
+            first_prompt["prompt_text"],
+            "seedance-default-v1",
+            first_prompt["target_duration_ms"],
+        )
+        in cache
+    )
+
+
+def test_duplicate_beats_within_one_pack_render_once(tmp_path: Path) -> None:
+    prompt_pack = _prompt_pack("EN-US")
+    duplicate_text = prompt_pack["scene_prompts"][0]["prompt_text"]
+    prompt_pack["scene_prompts"][2]["prompt_text"] = duplicate_text
+    prompt_pack["scene_prompts"][2]["target_duration_ms"] = prompt_pack[
+        "scene_prompts"
+    ][0]["target_duration_ms"]
+
+    result = run_seedance_scene_generation(
+        prompt_pack=prompt_pack,
+        output_dir=tmp_path,
+        asset_cache=SceneAssetCache(),
+    )
+
+    assert result["rendered_scene_count"] == 2
+    assets = result["scene_assets"]
+    assert assets[2]["scene_asset_uri"] == assets[0]["scene_asset_uri"]
+
+
+def test_scenes_are_cached_as_they_complete_even_if_the_pack_fails(
+    tmp_path: Path,
+) -> None:
+    cache = SceneAssetCache()
+    prompt_pack = _prompt_pack("EN-US")
+
+    with SeedanceStubServer(failing_beats=[2], latency_by_beat={2: 0.2}) as server:
+        renderer = ConcurrentSceneRenderer(client=HttpSeedanceClient(server.base_url))
+        with pytest.raises(SceneGenerationError):
+            run_seedance_scene_generation(
+                prompt_pack=prompt_pack,
+                output_dir=tmp_path / "failed",
+                renderer=renderer,
+                asset_cache=cache,
+            )
+
+    assert len(cache) == 2
+    with SeedanceStubServer() as server:
+        renderer = ConcurrentSceneRenderer(client=HttpSeedanceClient(server.base_url))
+        result = run_seedance_scene_generation(
+            prompt_pack=prompt_pack,
+            output_dir=tmp_path / "retry",
+            renderer=renderer,
+            asset_cache=cache,
+        )
+
+    assert [request["beat_index"] for request in server.requests] == [2]
+    assert result["rendered_scene_count"] == 1
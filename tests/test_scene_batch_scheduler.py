@@ -0,0 +1,233 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from money.scene_generation import (
+    ClientSceneBatchEngine,
+    SceneBatchScheduler,
+    SeedanceRenderError,
+    iter_completed_scenes,
+    run_seedance_scene_generation,
+)
+from money.script_generation.pipeline import build_prompt_pack, build_summary_pack
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _RecordingEngine(ClientSceneBatchEngine):
+    def __init__(self, failing_pack_ids: Sequence[str] = ()) -> None:
+        super().__init__()
+        self.batches = []  # type: List[List[Dict[str, Any]]]
+        self._failing_pack_ids = set(failing_pack_ids)
+
+    def render_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self.batches.append(list(requests))
+        for request in requests:
+            if request["prompt_pack_id"] in self._failing_pack_ids:
+                raise SeedanceRenderError(
+                    code="SEEDANCE_RENDER_UNAVAILABLE",
+                    message="render farm unavailable",
+                )
+        return super().render_batch(requests)
+
+
+class _ReentrantEngine(ClientSceneBatchEngine):
+    def __init__(self) -> None:
+        super().__init__()
+        self.scheduler = None  # type: Optional[SceneBatchScheduler]
+        self.stats_during_render = []  # type: List[Dict[str, Any]]
+
+    def render_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        assert self.scheduler is not None
+        scheduler = self.scheduler
+        observer = threading.Thread(
+            target=lambda: self.stats_during_render.append(scheduler.stats())
+        )
+        observer.start()
+        observer.join(timeout=5)
+        return super().render_batch(requests)
+
+
+class _BrokenEngine(ClientSceneBatchEngine):
+    def render_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        raise KeyError("scene_asset_uri")
+
+
+def _prompt_pack(candidate_id: str) -> Dict[str, Any]:
+    summary_pack = build_summary_pack(
+        trend_candidate={"candidate_id": candidate_id, "topic": "weekly meal prep"},
+        segmented_source_analysis={
+            "analysis_id": "analysis-%s" % candidate_id,
+            "source_facts": [],
+            "segments": [
+                {
+                    "segment_id": "seg-%d" % index,
+                    "start_ms": index * 1200,
+                    "end_ms": (index + 1) * 1200,
+                    "summary": "prep step %d with a labelled container" % index,
+                }
+                for index in range(3)
+            ],
+        },
+        locale="EN-US",
+    )
+    return build_prompt_pack(summary_pack)
+
+
+def test_scheduler_fills_batches_across_packs_and_waits_for_stragglers(
+    tmp_path: Path,
+) -> None:
+    clock = _FakeClock()
+    engine = _RecordingEngine()
+    scheduler = SceneBatchScheduler(
+        engine=engine,
+        max_batch_size=4,
+        max_wait_seconds=5.0,
+        clock=clock,
+    )
+    packs = [_prompt_pack("trend-%03d" % index) for index in range(3)]
+    for pack in packs:
+        assert scheduler.submit(pack, tmp_path / pack["prompt_pack_id"]) == 3
+
+    first_results = scheduler.poll()
+    assert [len(batch) for batch in engine.batches] == [4, 4]
+    assert [result["prompt_pack_id"] for result in first_results] == [
+        packs[0]["prompt_pack_id"],
+        packs[1]["prompt_pack_id"],
+    ]
+    assert scheduler.queued_count() == 1
+    assert scheduler.seconds_until_due() == 5.0
+
+    clock.now += 4.0
+    assert scheduler.poll() == []
+    clock.now += 1.0
+    last_results = scheduler.poll()
+    assert [len(batch) for batch in engine.batches] == [4, 4, 1]
+    assert [result["prompt_pack_id"] for result in last_results] == [
+        packs[2]["prompt_pack_id"]
+    ]
+    assert scheduler.stats()["mean_batch_size"] == 3.0
+    assert scheduler.seconds_until_due() is None
+
+    for pack, result in zip(packs, first_results + last_results):
+        output_dir = tmp_path / pack["prompt_pack_id"]
+        persisted = json.loads(
+            (output_dir / "scene_generation.json").read_text(encoding="utf-8")
+        )
+        direct = run_seedance_scene_generation(
+            pack,
+            tmp_path / "direct" / pack["prompt_pack_id"],
+        )
+        assert persisted["scene_assets"] == result["scene_assets"]
+        assert [asset["scene_asset_uri"] for asset in result["scene_assets"]] == [
+            asset["scene_asset_uri"] for asset in direct["scene_assets"]
+        ]
+        assert len(list(iter_completed_scenes(output_dir))) == 3
+
+
+def test_scheduler_orders_batches_by_monetization_score(tmp_path: Path) -> None:
+    engine = _RecordingEngine()
+    scheduler = SceneBatchScheduler(engine=engine, max_batch_size=3)
+    low = _prompt_pack("trend-low")
+    high = _prompt_pack("trend-high")
+    scheduler.submit(low, tmp_path / "low", {"monetization_score": 0.2})
+    scheduler.submit(high, tmp_path / "high", {"monetization_score": 0.9})
+
+    results = scheduler.flush()
+
+    assert [request["prompt_pack_id"] for request in engine.batches[0]] == [
+        high["prompt_pack_id"]
+    ] * 3
+    assert [result["scheduled_priority"] for result in results] == [0.9, 0.2]
+
+
+def test_scheduler_groups_batches_by_seedance_profile(tmp_path: Path) -> None:
+    engine = _RecordingEngine()
+    scheduler = SceneBatchScheduler(engine=engine, max_batch_size=8)
+    for candidate_id, profile in [("a", "speed"), ("b", "quality"), ("c", "speed")]:
+        scheduler.submit(
+            _prompt_pack("trend-%s" % candidate_id),
+            tmp_path / candidate_id,
+            seedance_profile=profile,
+        )
+
+    results = scheduler.flush()
+
+    assert len(results) == 3
+    assert [
+        sorted(set(request["seedance_profile"] for request in batch))
+        for batch in engine.batches
+    ] == [["quality"], ["speed"]]
+    assert [len(batch) for batch in engine.batches] == [3, 6]
+
+
+def test_scheduler_fails_only_packs_in_the_failed_batch(tmp_path: Path) -> None:
+    failing = _prompt_pack("trend-fail")
+    healthy = _prompt_pack("trend-ok")
+    engine = _RecordingEngine(failing_pack_ids=[failing["prompt_pack_id"]])
+    scheduler = SceneBatchScheduler(engine=engine, max_batch_size=2)
+    scheduler.submit(failing, tmp_path / "fail", {"monetization_score": 1.0})
+    scheduler.submit(healthy, tmp_path / "ok")
+
+    results = scheduler.flush()
+
+    statuses = {result["prompt_pack_id"]: result["status"] for result in results}
+    assert statuses == {
+        failing["prompt_pack_id"]: "failed",
+        healthy["prompt_pack_id"]: "generated",
+    }
+    assert results[0]["reason_code"] == "SEEDANCE_RENDER_UNAVAILABLE"
+    assert scheduler.stats()["queued_scenes"] == 0
+    assert scheduler.stats()["pending_packs"] == 0
+    assert not (tmp_path / "fail" / "scene_generation.json").exists()
+
+
+def test_scheduler_tracks_oldest_wait_after_partial_batches(tmp_path: Path) -> None:
+    clock = _FakeClock()
+    scheduler = SceneBatchScheduler(
+        engine=_RecordingEngine(),
+        max_batch_size=4,
+        max_wait_seconds=5.0,
+        clock=clock,
+    )
+    scheduler.submit(_prompt_pack("trend-a"), tmp_path / "a")
+    clock.now += 3.0
+    scheduler.submit(_prompt_pack("trend-b"), tmp_path / "b")
+
+    assert len(scheduler.poll()) == 1
+    assert scheduler.queued_count() == 2
+    clock.now += 1.0
+    assert scheduler.seconds_until_due() == 4.0
+
+
+def test_scheduler_renders_outside_its_lock(tmp_path: Path) -> None:
+    engine = _ReentrantEngine()
+    scheduler = SceneBatchScheduler(engine=engine, max_batch_size=3)
+    engine.scheduler = scheduler
+    scheduler.submit(_prompt_pack("trend-a"), tmp_path / "a")
+
+    results = scheduler.flush()
+
+    assert [result["status"] for result in results] == ["generated"]
+    assert len(engine.stats_during_render) == 1
+    assert engine.stats_during_render[0]["pending_packs"] == 1
+
+
+def test_scheduler_fails_packs_on_unexpected_engine_errors(tmp_path: Path) -> None:
+    scheduler = SceneBatchScheduler(engine=_BrokenEngine(), max_batch_size=2)
+    pack = _prompt_pack("trend-a")
+    scheduler.submit(pack, tmp_path / "a")
+
+    results = scheduler.flush()
+
+    assert [result["status"] for result in results] == ["failed"]
+    assert results[0]["reason_code"] == "SCENE_BATCH_RENDER_FAILED"
+    assert scheduler.stats()["queued_scenes"] == 0
+    assert scheduler.stats()["pending_packs"] == 0
@@ -0,0 +1,175 @@
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from money.orchestration.service import WorkflowOrchestrationService
+from money.scene_generation import (
+    ConcurrentSceneRenderer,
+    HttpSeedanceClient,
+    SceneGenerationError,
+    SeedanceStubServer,
+    iter_completed_scenes,
+    run_seedance_scene_generation,
+)
+from money.scene_generation.partial_manifest import partial_manifest_path
+from money.script_generation.pipeline import build_prompt_pack, build_summary_pack
+
+
+def _prompt_pack(beat_count: int) -> Dict[str, Any]:
+    summary_pack = build_summary_pack(
+        trend_candidate={"candidate_id": "trend-001", "topic": "weekly meal prep"},
+        segmented_source_analysis={
+            "analysis_id": "analysis-001",
+            "source_facts": [],
+            "segments": [
+                {
+                    "segment_id": "seg-%d" % index,
+                    "start_ms": index * 1200,
+                    "end_ms": (index + 1) * 1200,
+                    "summary": "prep step %d with a labelled container" % index,
+                }
+                for index in range(beat_count)
+            ],
+        },
+        locale="EN-US",
+    )
+    return build_prompt_pack(summary_pack)
+
+
+def _renderer(server: SeedanceStubServer) -> ConcurrentSceneRenderer:
+    return ConcurrentSceneRenderer(
+        client=HttpSeedanceClient(server.base_url),
+        max_workers=6,
+        default_profile_concurrency=6,
+    )
+
+
+def test_failed_generation_keeps_completed_scenes_and_resume_renders_the_rest(
+    tmp_path: Path,
+) -> None:
+    with SeedanceStubServer(failing_beats=[4], latency_by_beat={4: 0.2}) as server:
+        with pytest.raises(SceneGenerationError):
+            run_seedance_scene_generation(
+                prompt_pack=_prompt_pack(6),
+                output_dir=tmp_path,
+                renderer=_renderer(server),
+            )
+
+    assert not (tmp_path / "scene_generation.json").exists()
+    completed = list(iter_completed_scenes(tmp_path))
+    assert sorted(scene["beat_index"] for scene in completed) == [1, 2, 3, 5, 6]
+
+    with SeedanceStubServer() as server:
+        result = run_seedance_scene_generation(
+            prompt_pack=_prompt_pack(6),
+            output_dir=tmp_path,
+            renderer=_renderer(server),
+            resume=True,
+        )
+
+    assert [request["beat_index"] for request in server.requests] == [4]
+    assert result["resumed_scene_count"] == 5
+    assert [asset["beat_index"] for asset in result["scene_assets"]] == [
+        1, 2, 3, 4, 5, 6,
+    ]
+    streamed = list(iter_completed_scenes(tmp_path))
+    assert sorted(streamed, key=lambda scene: scene["beat_index"]) == [
+        dict(asset, asset_id=Path(asset["scene_asset_path"]).stem)
+        for asset in result["scene_assets"]
+    ]
+    last_entry = partial_manifest_path(tmp_path).read_text().splitlines()[-1]
+    assert json.loads(last_entry)["kind"] == "finalized"
+    assert json.loads(last_entry)["scene_count"] == 6
+
+
+def test_resume_rerenders_mismatched_scene_assets(tmp_path: Path) -> None:
+    first = run_seedance_scene_generation(
+        prompt_pack=_prompt_pack(3),
+        output_dir=tmp_path,
+    )
+    tampered_path = Path(first["scene_assets"][1]["scene_asset_path"])
+    tampered = json.loads(tampered_path.read_text(encoding="utf-8"))
+    tampered["source_prompt_text"] = "an older prompt"
+    tampered_path.write_text(json.dumps(tampered), encoding="utf-8")
+    Path(first["scene_assets"][2]["scene_asset_path"]).write_text("{", encoding="utf-8")
+
+    with SeedanceStubServer() as server:
+        result = run_seedance_scene_generation(
+            prompt_pack=_prompt_pack(3),
+            output_dir=tmp_path,
+            renderer=_renderer(server),
+            resume=True,
+        )
+
+    assert sorted(request["beat_index"] for request in server.requests) == [2, 3]
+    assert result["resumed_scene_count"] == 1
+    assert result["scene_assets"] == first["scene_assets"]
+
+
+def test_completed_scenes_stream_while_generation_runs(tmp_path: Path) -> None:
+    streamed = []  # type: List[Dict[str, Any]]
+    with SeedanceStubServer(latency_by_beat={1: 0.02, 2: 0.1, 3: 0.2}) as server:
+        worker = threading.Thread(
+            target=run_seedance_scene_generation,
+            kwargs={
+                "prompt_pack": _prompt_pack(3),
+                "output_dir": tmp_path,
+                "renderer": _renderer(server),
+            },
+        )
+        worker.start()
+        for scene in iter_completed_scenes(tmp_path, follow=True, timeout_seconds=10):
+            streamed.append(scene)
+            if len(streamed) == 1:
+                assert not (tmp_path / "scene_generation.json").exists()
+        worker.join()
+
+    assert [scene["beat_index"] for scene in streamed] == [1, 2, 3]
+    assert (tmp_path / "scene_generation.json").exists()
+
+
+def test_stream_times_out_when_generation_never_finalizes(tmp_path: Path) -> None:
+    with pytest.raises(SceneGenerationError) as error:
+        list(iter_completed_scenes(tmp_path, follow=True, timeout_seconds=0.1))
+
+    assert error.value.code == "SCENE_STREAM_TIMEOUT"
+
+
+def test_orchestrator_requests_resume_on_scene_generation_retries() -> None:
+    attempts = []  # type: List[Dict[str, Any]]
+
+    def scene_handler(
+        _context: Dict[str, Any],
+        metadata: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        attempts.append(dict(metadata))
+        if len(attempts) == 1:
+            return {"status": "retryable", "reason_code": "SEEDANCE_RENDER_UNAVAILABLE"}
+        return {"status": "success"}
+
+    handlers = {
+        stage: (lambda _context, _metadata: {"status": "success"})
+        for stage in [
+            "trend_ingestion",
+            "script_generation",
+            "localization",
+            "review",
+            "publish",
+        ]
+    }
+    handlers["scene_generation"] = scene_handler
+    service = WorkflowOrchestrationService(
+        per_video_budget_cap_usd=10.0,
+        daily_spend_cap_usd=100.0,
+    )
+    result = service.run_workflow(
+        workflow_id="workflow-resume-001",
+        run_date="2026-02-16",
+        stage_handlers=handlers,
+    )
+
+    assert result["status"] == "completed"
+    assert [attempt["resume"] for attempt in attempts] == [False, True]
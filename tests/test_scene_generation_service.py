@@ -124,3 +124,33 @@ def test_generation_enforces_seedance_single_engine_policy(tmp_path: Path) -> No
         )
 
     assert error.value.code == "BLOCKED_ENGINE_POLICY"
+
+
+def test_incremental_generation_skips_unchanged_scene_assets(tmp_path: Path) -> None:
+    first = run_seedance_scene_generation(
+        prompt_pack=_prompt_pack_fixture(),
+        output_dir=tmp_path,
+        incremental=True,
+    )
+    assert len(first["rebuilt_artifacts"]) == 4
+
+    asset_paths = [Path(asset["scene_asset_path"]) for asset in first["scene_assets"]]
+    mtimes = [path.stat().st_mtime_ns for path in asset_paths]
+    second = run_seedance_scene_generation(
+        prompt_pack=_prompt_pack_fixture(),
+        output_dir=tmp_path,
+        incremental=True,
+    )
+    assert second["rebuilt_artifacts"] == []
+    assert second["scene_assets"] == first["scene_assets"]
+    assert [path.stat().st_mtime_ns for path in asset_paths] == mtimes
+
+    changed_pack = _prompt_pack_fixture()
+    changed_pack["scene_prompts"][1]["prompt_text"] += " Use warmer lighting."
+    third = run_seedance_scene_generation(
+        prompt_pack=changed_pack,
+        output_dir=tmp_path,
+        incremental=True,
+    )
+    changed_asset_id = Path(third["scene_assets"][1]["scene_asset_path"]).stem
+    assert third["rebuilt_artifacts"] == [changed_asset_id, "scene_generation"]
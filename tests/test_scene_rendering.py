@@ -0,0 +1,102 @@
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from money.scene_generation import (
+    ConcurrentSceneRenderer,
+    HttpSeedanceClient,
+    SceneGenerationError,
+    SeedanceStubServer,
+    run_seedance_scene_generation,
+)
+from money.script_generation.pipeline import build_prompt_pack, build_summary_pack
+
+BEAT_COUNT = 12
+
+
+def _prompt_pack(beat_count: int = BEAT_COUNT) -> Dict[str, Any]:
+    summary_pack = build_summary_pack(
+        trend_candidate={"candidate_id": "trend-001", "topic": "weekly meal prep"},
+        segmented_source_analysis={
+            "analysis_id": "analysis-001",
+            "source_facts": [],
+            "segments": [
+                {
+                    "segment_id": "seg-%d" % index,
+                    "start_ms": index * 1200,
+                    "end_ms": (index + 1) * 1200,
+                    "summary": "prep step %d with a labelled container" % index,
+                }
+                for index in range(beat_count)
+            ],
+        },
+        locale="EN-US",
+    )
+    return build_prompt_pack(summary_pack)
+
+
+def test_concurrent_rendering_returns_beat_order_in_slowest_scene_time(
+    tmp_path: Path,
+) -> None:
+    latency_by_beat = {beat: 0.05 + 0.02 * (BEAT_COUNT - beat) for beat in range(1, 13)}
+    slowest = max(latency_by_beat.values())
+    with SeedanceStubServer(latency_by_beat=latency_by_beat) as server:
+        renderer = ConcurrentSceneRenderer(
+            client=HttpSeedanceClient(server.base_url),
+            max_workers=BEAT_COUNT,
+            default_profile_concurrency=BEAT_COUNT,
+        )
+        started = time.monotonic()
+        result = run_seedance_scene_generation(
+            prompt_pack=_prompt_pack(),
+            output_dir=tmp_path / "http",
+            renderer=renderer,
+        )
+        elapsed = time.monotonic() - started
+
+    assert elapsed < slowest * 3
+    assert elapsed < sum(latency_by_beat.values())
+    assert [asset["beat_index"] for asset in result["scene_assets"]] == list(
+        range(1, BEAT_COUNT + 1)
+    )
+    local = run_seedance_scene_generation(
+        prompt_pack=_prompt_pack(),
+        output_dir=tmp_path / "local",
+    )
+    assert [asset["scene_asset_uri"] for asset in result["scene_assets"]] == [
+        asset["scene_asset_uri"] for asset in local["scene_assets"]
+    ]
+
+
+def test_renderer_enforces_per_profile_concurrency(tmp_path: Path) -> None:
+    with SeedanceStubServer(latency_seconds=0.05) as server:
+        renderer = ConcurrentSceneRenderer(
+            client=HttpSeedanceClient(server.base_url),
+            max_workers=8,
+            profile_concurrency={"seedance-quality-v1": 2},
+        )
+        run_seedance_scene_generation(
+            prompt_pack=_prompt_pack(6),
+            output_dir=tmp_path,
+            seedance_profile="seedance-quality-v1",
+            renderer=renderer,
+        )
+
+    assert len(server.requests) == 6
+    assert server.max_in_flight == 2
+
+
+def test_render_failure_surfaces_scene_generation_error(tmp_path: Path) -> None:
+    with SeedanceStubServer(failing_beats=[2]) as server:
+        renderer = ConcurrentSceneRenderer(client=HttpSeedanceClient(server.base_url))
+        with pytest.raises(SceneGenerationError) as error:
+            run_seedance_scene_generation(
+                prompt_pack=_prompt_pack(3),
+                output_dir=tmp_path,
+                renderer=renderer,
+            )
+
+    assert error.value.code == "SEEDANCE_RENDER_REJECTED"
+    assert not (tmp_path / "scene_generation.json").exists()
@@ -0,0 +1,177 @@
+import pickle
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from money.contracts.policy_snapshot import current_policy_snapshot
+from money.script_generation import (
+    ReferenceCorpusIndex,
+    ScriptGenerationBatchRunner,
+    ScriptGenerationJob,
+)
+from money.script_generation.pipeline import run_script_generation_pipeline
+
+
+def _trend_candidate(index: int) -> Dict[str, Any]:
+    return {
+        "candidate_id": "trend-%03d" % index,
+        "source_platform": "youtube",
+        "external_id": "yt-%03d" % index,
+        "topic": "weekly grocery budgeting %d" % index,
+        "signal_score": 0.88,
+        "captured_at": "2026-02-16T00:00:00Z",
+    }
+
+
+def _segmented_source_analysis(segment_count: int = 3) -> Dict[str, Any]:
+    summaries = [
+        "audit one pantry category first and reveal hidden spend",
+        "set a fixed cap for weekday meals and track drift nightly",
+        "close with a weekly reset checklist and next-action reminder",
+    ]
+    return {
+        "analysis_id": "analysis-001",
+        "source_facts": ["audit one pantry category first"],
+        "segments": [
+            {
+                "segment_id": "seg-%d" % (index + 1),
+                "start_ms": index * 1500,
+                "end_ms": (index + 1) * 1500,
+                "summary": summaries[index],
+            }
+            for index in range(segment_count)
+        ],
+    }
+
+
+def test_policy_snapshot_survives_pickling() -> None:
+    snapshot = current_policy_snapshot()
+    restored = pickle.loads(pickle.dumps(snapshot))
+
+    assert restored.snapshot_id == snapshot.snapshot_id
+    assert restored.supported_locales() == snapshot.supported_locales()
+    rules = restored.rules_for("EN-US")
+    original_rules = snapshot.rules_for("EN-US")
+    assert rules is not None and original_rules is not None
+    assert rules.originality_threshold == original_rules.originality_threshold
+    assert dict(rules.category_reason_code) == dict(original_rules.category_reason_code)
+
+
+def test_batch_runner_streams_results_and_reports_failure_codes(tmp_path: Path) -> None:
+    jobs = [
+        ScriptGenerationJob(
+            trend_candidate=_trend_candidate(index),
+            segmented_source_analysis=_segmented_source_analysis(),
+            locale=locale,
+            output_dir=tmp_path / "batch" / str(index) / locale,
+        )
+        for index in range(3)
+        for locale in ("EN-US", "JA-JP")
+    ]
+    jobs.append(
+        ScriptGenerationJob(
+            trend_candidate=_trend_candidate(8),
+            segmented_source_analysis=_segmented_source_analysis(),
+            locale="XX-XX",
+            output_dir=tmp_path / "batch" / "unsupported",
+        )
+    )
+    jobs.append(
+        ScriptGenerationJob(
+            trend_candidate=_trend_candidate(9),
+            segmented_source_analysis=_segmented_source_analysis(segment_count=2),
+            locale="EN-US",
+            output_dir=tmp_path / "batch" / "short",
+        )
+    )
+
+    runner = ScriptGenerationBatchRunner(max_workers=2, chunk_size=3)
+    report = runner.run_all(jobs)
+
+    assert report["job_count"] == len(jobs)
+    assert report["failed_count"] == 2
+    assert report["failed_by_code"] == {
+        "POLICY_LOCALE_UNSUPPORTED": 1,
+        "SEGMENTS_MIN_ITEMS": 1,
+    }
+    results = {result["job_id"]: result for result in report["results"]}
+    assert sorted(results) == sorted(job.job_id for job in jobs)
+
+    expected = run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(1),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="JA-JP",
+        output_dir=tmp_path / "serial",
+    )
+    batched = results["trend-001:JA-JP"]
+    assert batched["status"] == expected["status"]
+    assert batched["script_draft"] == expected["script_draft"]
+    assert Path(batched["script_draft_path"]).exists()
+
+
+def test_batch_runner_isolates_unexpected_job_errors(tmp_path: Path) -> None:
+    (tmp_path / "blocked").write_text("not a directory", encoding="utf-8")
+    jobs = [
+        ScriptGenerationJob(
+            trend_candidate=_trend_candidate(index),
+            segmented_source_analysis=_segmented_source_analysis(),
+            locale="EN-US",
+            output_dir=output_dir,
+        )
+        for index, output_dir in enumerate(
+            [tmp_path / "ok", tmp_path / "blocked" / "EN-US"]
+        )
+    ]
+
+    report = ScriptGenerationBatchRunner(max_workers=1, chunk_size=2).run_all(jobs)
+
+    assert report["job_count"] == 2
+    assert report["failed_by_code"] == {"SCRIPT_GENERATION_JOB_FAILED": 1}
+    results = {result["job_id"]: result for result in report["results"]}
+    assert results["trend-000:EN-US"]["status"] != "failed"
+    failure = results["trend-001:EN-US"]
+    assert failure["status"] == "failed"
+    assert failure["result_code"] == "FAILED"
+    assert failure["message"].startswith("NotADirectoryError")
+
+
+def test_batch_runner_shares_reference_corpus_with_workers(tmp_path: Path) -> None:
+    baseline = run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(1),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="EN-US",
+        output_dir=tmp_path / "baseline",
+    )
+    draft = baseline["script_draft"]
+    corpus = ReferenceCorpusIndex(
+        ["%s %s %s" % (draft["hook"], draft["body"], draft["cta"])]
+    )
+
+    runner = ScriptGenerationBatchRunner(
+        max_workers=1,
+        chunk_size=1,
+        reference_corpus=corpus,
+    )
+    results = list(
+        runner.run(
+            [
+                ScriptGenerationJob(
+                    trend_candidate=_trend_candidate(1),
+                    segmented_source_analysis=_segmented_source_analysis(),
+                    locale="EN-US",
+                    output_dir=tmp_path / "indexed",
+                )
+            ]
+        )
+    )
+
+    assert len(results) == 1
+    assert results[0]["result_code"] == "BLOCKED_ORIGINALITY"
+
+
+def test_batch_runner_rejects_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        ScriptGenerationBatchRunner(chunk_size=0)
+    with pytest.raises(ValueError):
+        ScriptGenerationBatchRunner(max_workers=0)
@@ -1,11 +1,26 @@
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 import pytest
 
-from money.script_generation.pipeline import merge_script_text, run_script_generation_pipeline
-from money.script_generation.schemas import PackValidationError, validate_prompt_pack
+from money.script_generation import (
+    MappedReferenceCorpus,
+    ReferenceCorpusIndex,
+    build_mapped_reference_corpus,
+)
+from money.script_generation.pipeline import (
+    ScriptGenerationError,
+    merge_script_text,
+    run_script_generation_for_locales,
+    run_script_generation_pipeline,
+)
+from money.script_generation.prompt_quality import scan_prompt_quality
+from money.script_generation.schemas import (
+    PackValidationError,
+    collect_prompt_pack_errors,
+    validate_prompt_pack,
+)
 
 
 def _trend_candidate() -> Dict[str, Any]:
@@ -156,6 +171,36 @@ def test_prompt_pack_schema_validation_rejects_missing_beat_windows(
     assert error.value.field == "prompt_pack.beat_windows"
 
 
+def test_prompt_pack_collect_mode_reports_every_schema_error(
+    tmp_path: Path,
+) -> None:
+    run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="EN-US",
+        output_dir=tmp_path,
+    )
+    prompt_pack = _load_json(tmp_path / "prompt_pack.json")
+    assert collect_prompt_pack_errors(prompt_pack) == []
+
+    prompt_pack.pop("beat_windows")
+    prompt_pack["locale"] = "FR-FR"
+    prompt_pack["scene_prompts"][1]["target_duration_ms"] = 0
+    prompt_pack["scene_prompts"][2]["prompt_text"] = "short"
+
+    errors = collect_prompt_pack_errors(prompt_pack)
+    assert [(error.code, error.field) for error in errors] == [
+        ("PACK_REQUIRED_FIELD", "prompt_pack.beat_windows"),
+        ("PACK_ENUM_VIOLATION", "prompt_pack.locale"),
+        ("PACK_VALUE_RANGE", "prompt_pack.scene_prompts[1].target_duration_ms"),
+        ("PACK_VALUE_RANGE", "prompt_pack.scene_prompts[2].prompt_text"),
+    ]
+
+    with pytest.raises(PackValidationError) as error:
+        validate_prompt_pack(prompt_pack)
+    assert error.value.field == errors[0].field
+
+
 def test_pipeline_outputs_are_deterministic_for_same_input(tmp_path: Path) -> None:
     first_output_dir = tmp_path / "first"
     second_output_dir = tmp_path / "second"
@@ -183,3 +228,189 @@ def test_pipeline_outputs_are_deterministic_for_same_input(tmp_path: Path) -> No
     assert first_summary_pack == second_summary_pack
     assert first_prompt_pack == second_prompt_pack
     assert first_script_draft == second_script_draft
+
+
+def test_pipeline_accepts_reference_corpus_index(tmp_path: Path) -> None:
+    baseline = run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="EN-US",
+        output_dir=tmp_path / "baseline",
+    )
+    corpus = ReferenceCorpusIndex([merge_script_text(baseline["script_draft"])])
+
+    blocked = run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="EN-US",
+        output_dir=tmp_path / "indexed",
+        reference_corpus=corpus,
+    )
+
+    assert blocked["result_code"] == "BLOCKED_ORIGINALITY"
+    assert blocked["script_draft"]["similarity_score"] == 1.0
+    originality = _load_json(Path(blocked["originality_record_path"]))
+    assert originality["reference_count"] == 1
+
+    mapped_path = build_mapped_reference_corpus(
+        [merge_script_text(baseline["script_draft"])],
+        tmp_path / "refs.mrc",
+    )
+    with MappedReferenceCorpus(mapped_path) as mapped:
+        mapped_result = run_script_generation_pipeline(
+            trend_candidate=_trend_candidate(),
+            segmented_source_analysis=_segmented_source_analysis(),
+            locale="EN-US",
+            output_dir=tmp_path / "mapped",
+            reference_corpus=mapped,
+        )
+    assert mapped_result["script_draft"]["similarity_score"] == 1.0
+
+
+def test_multi_locale_generation_matches_single_locale_runs(tmp_path: Path) -> None:
+    locales = ["EN-US", "EN-SEA", "JA-JP"]
+    results = run_script_generation_for_locales(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locales=locales,
+        output_dir=tmp_path / "batched",
+    )
+
+    assert sorted(results) == sorted(locales)
+    for locale in locales:
+        single = run_script_generation_pipeline(
+            trend_candidate=_trend_candidate(),
+            segmented_source_analysis=_segmented_source_analysis(),
+            locale=locale,
+            output_dir=tmp_path / "single" / locale,
+        )
+        batched = results[locale]
+        assert batched["result_code"] == single["result_code"]
+        assert batched["script_draft"] == single["script_draft"]
+        assert Path(batched["prompt_pack_path"]).parent == tmp_path / "batched" / locale
+        for key in ("summary_pack_path", "prompt_pack_path", "originality_record_path"):
+            assert _load_json(Path(batched[key])) == _load_json(Path(single[key]))
+
+    prompt_ids = set()  # type: Set[str]
+    for locale in locales:
+        prompt_pack = _load_json(Path(results[locale]["prompt_pack_path"]))
+        prompt_ids.update(
+            prompt["prompt_id"] for prompt in prompt_pack["scene_prompts"]
+        )
+    assert len(prompt_ids) == 3 * len(locales)
+
+
+def test_multi_locale_generation_rejects_unsupported_locale_before_writing(
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(ScriptGenerationError) as error:
+        run_script_generation_for_locales(
+            trend_candidate=_trend_candidate(),
+            segmented_source_analysis=_segmented_source_analysis(),
+            locales=["EN-US", "XX-XX"],
+            output_dir=tmp_path,
+        )
+
+    assert error.value.code == "POLICY_LOCALE_UNSUPPORTED"
+    assert not (tmp_path / "EN-US").exists()
+
+
+def test_incremental_pipeline_reuses_unchanged_artifacts(tmp_path: Path) -> None:
+    first = run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="EN-US",
+        output_dir=tmp_path,
+        incremental=True,
+    )
+    assert first["rebuilt_artifacts"] == ["summary_pack", "prompt_pack", "script_draft"]
+    summary_mtime = (tmp_path / "summary_pack.json").stat().st_mtime_ns
+
+    second = run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="EN-US",
+        output_dir=tmp_path,
+        incremental=True,
+    )
+    assert second["rebuilt_artifacts"] == []
+    assert second["script_draft"] == first["script_draft"]
+
+    retuned = run_script_generation_pipeline(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locale="EN-US",
+        output_dir=tmp_path,
+        originality_threshold=0.1,
+        incremental=True,
+    )
+    assert retuned["rebuilt_artifacts"] == ["script_draft"]
+    assert retuned["script_draft"]["originality_threshold"] == 0.1
+    assert (tmp_path / "summary_pack.json").stat().st_mtime_ns == summary_mtime
+
+
+def test_incremental_multi_locale_run_redoes_changed_locale(tmp_path: Path) -> None:
+    locales = ["EN-US", "EN-SEA", "JA-JP"]
+    first = run_script_generation_for_locales(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locales=locales,
+        output_dir=tmp_path,
+        incremental=True,
+    )
+    assert all(first[locale]["rebuilt_artifacts"] for locale in locales)
+
+    second = run_script_generation_for_locales(
+        trend_candidate=_trend_candidate(),
+        segmented_source_analysis=_segmented_source_analysis(),
+        locales=locales,
+        output_dir=tmp_path,
+        originality_thresholds={"JA-JP": 0.05},
+        incremental=True,
+    )
+    assert second["EN-US"]["rebuilt_artifacts"] == []
+    assert second["EN-SEA"]["rebuilt_artifacts"] == []
+    assert second["JA-JP"]["rebuilt_artifacts"] == ["script_draft"]
+    assert second["JA-JP"]["result_code"] == "BLOCKED_ORIGINALITY"
+
+
+def test_prompt_quality_scan_reports_per_beat_breakdown() -> None:
+    scan = scan_prompt_quality(
+        [
+            {"beat_index": 1, "prompt_text": "Show the pantry audit, (maybe) twice."},
+            {"beat_index": 2, "prompt_text": "Promise a RISK FREE RETURN and bet now!"},
+            {"beat_index": 3, "prompt_text": "Close on the checklist."},
+        ]
+    )
+
+    assert scan["token_count"] == 18
+    assert scan["ambiguous_count"] == 1
+    assert scan["ambiguity_score"] == round(1.0 / 18.0, 4)
+    assert scan["policy_violations"] == ["risk free return", "bet now"]
+    assert [entry["token_count"] for entry in scan["prompt_breakdown"]] == [6, 8, 4]
+    assert scan["prompt_breakdown"][0]["ambiguous_tokens"] == ["maybe"]
+    assert scan["prompt_breakdown"][1]["policy_violations"] == [
+        "risk free return",
+        "bet now",
+    ]
+    assert scan["prompt_breakdown"][2]["policy_violations"] == []
+
+
+def test_policy_block_identifies_offending_beat(tmp_path: Path) -> None:
+    analysis = _segmented_source_analysis()
+    analysis["segments"][1]["summary"] = (
+        "set a fixed cap for weekday meals for a guaranteed profit"
+    )
+
+    with pytest.raises(ScriptGenerationError) as error:
+        run_script_generation_pipeline(
+            trend_candidate=_trend_candidate(),
+            segmented_source_analysis=analysis,
+            locale="EN-US",
+            output_dir=tmp_path,
+        )
+
+    assert error.value.code == "PROMPT_PACK_POLICY_BLOCKED"
+    breakdown = error.value.details["prompt_breakdown"]
+    assert [entry["beat_index"] for entry in breakdown] == [2]
+    assert breakdown[0]["policy_violations"] == ["guaranteed profit"]
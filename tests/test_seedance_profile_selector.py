@@ -0,0 +1,260 @@
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from money.orchestration.service import (
+    DEFAULT_SEEDANCE_PROFILE_FALLBACK_ORDER,
+    DeterministicStageHandlerFactory,
+    WorkflowOrchestrationService,
+)
+from money.scene_generation import (
+    ConcurrentSceneRenderer,
+    HttpSeedanceClient,
+    LocalSeedanceClient,
+    SceneGenerationError,
+    SeedanceProfileSelector,
+    SeedanceRenderError,
+    SeedanceStubServer,
+    run_seedance_scene_generation,
+)
+from money.script_generation.pipeline import build_prompt_pack, build_summary_pack
+
+QUALITY, BALANCED, SPEED = DEFAULT_SEEDANCE_PROFILE_FALLBACK_ORDER
+
+
+class _SlowClient(LocalSeedanceClient):
+    def __init__(self, delay_seconds: float, failing_beats: Any = ()) -> None:
+        self._delay_seconds = delay_seconds
+        self._failing_beats = set(failing_beats)
+
+    def render_scene(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(self._delay_seconds)
+        if request["beat_index"] in self._failing_beats:
+            raise SeedanceRenderError(
+                code="SEEDANCE_RENDER_REJECTED",
+                message="beat %s rejected" % request["beat_index"],
+            )
+        return super().render_scene(request)
+
+
+def _selector(**kwargs: Any) -> SeedanceProfileSelector:
+    return SeedanceProfileSelector(DEFAULT_SEEDANCE_PROFILE_FALLBACK_ORDER, **kwargs)
+
+
+def _prompt_pack() -> Dict[str, Any]:
+    summary_pack = build_summary_pack(
+        trend_candidate={"candidate_id": "trend-001", "topic": "weekly meal prep"},
+        segmented_source_analysis={
+            "analysis_id": "analysis-001",
+            "source_facts": [],
+            "segments": [
+                {
+                    "segment_id": "seg-%d" % index,
+                    "start_ms": index * 1200,
+                    "end_ms": (index + 1) * 1200,
+                    "summary": "prep step %d with a labelled container" % index,
+                }
+                for index in range(3)
+            ],
+        },
+        locale="EN-US",
+    )
+    return build_prompt_pack(summary_pack)
+
+
+def test_selector_without_stats_follows_preference_order() -> None:
+    selector = _selector()
+
+    assert selector.select() == QUALITY
+    assert selector.select([QUALITY]) == BALANCED
+    assert selector.select([QUALITY, BALANCED]) == SPEED
+    assert selector.select([QUALITY, BALANCED, SPEED]) == SPEED
+
+
+def test_selector_degrades_flaky_and_slow_profiles() -> None:
+    selector = _selector(latency_target_ms=1500, min_samples=4)
+    for latency_ms in [900, 1000, 1100, 4000]:
+        selector.record(QUALITY, succeeded=True, latency_ms=latency_ms)
+    for succeeded in [True, False, False, True]:
+        selector.record(BALANCED, succeeded=succeeded, latency_ms=800)
+
+    quality_stats = selector.profile_stats(QUALITY)
+    assert quality_stats["p50_latency_ms"] == 1000
+    assert quality_stats["p95_latency_ms"] == 4000
+    assert selector.profile_stats(BALANCED)["success_rate"] == 0.5
+    assert selector.ranked_profiles() == [SPEED, QUALITY, BALANCED]
+    assert selector.select() == SPEED
+
+
+def test_selector_enforces_cost_per_second_target() -> None:
+    selector = _selector(cost_target_usd_per_second=0.05, min_samples=2)
+    for _ in range(2):
+        selector.record(QUALITY, succeeded=True, cost_usd=0.6, rendered_seconds=6)
+        selector.record(BALANCED, succeeded=True, cost_usd=0.24, rendered_seconds=6)
+
+    assert selector.profile_stats(QUALITY)["cost_per_second_usd"] == 0.1
+    assert selector.select() == BALANCED
+
+
+def test_selector_persists_rolling_window(tmp_path: Path) -> None:
+    stats_path = tmp_path / "seedance_profile_stats.json"
+    selector = _selector(window_size=3, stats_path=stats_path)
+    for latency_ms in [100, 200, 300, 400]:
+        selector.record(QUALITY, succeeded=True, latency_ms=latency_ms)
+    assert selector.save() == stats_path
+
+    reloaded = _selector(window_size=3, stats_path=stats_path)
+
+    assert reloaded.stats() == selector.stats()
+    assert reloaded.profile_stats(QUALITY)["sample_count"] == 3
+    assert reloaded.profile_stats(QUALITY)["p50_latency_ms"] == 300
+
+
+def test_orchestrator_skips_a_flaky_profile_before_burning_retries(
+    tmp_path: Path,
+) -> None:
+    selector = _selector(min_samples=2, stats_path=tmp_path / "stats.json")
+    selector.record(QUALITY, succeeded=False)
+    selector.record(QUALITY, succeeded=False)
+    factory = DeterministicStageHandlerFactory(
+        scripted_outcomes={
+            "scene_generation": [
+                {"status": "retryable_failure", "reason_code": "SEEDANCE_TIMEOUT"},
+                {"status": "success", "latency_ms": 1200, "rendered_seconds": 4},
+            ]
+        }
+    )
+    service = WorkflowOrchestrationService(
+        per_video_budget_cap_usd=10.0,
+        daily_spend_cap_usd=100.0,
+        seedance_profile_selector=selector,
+    )
+
+    result = service.run_workflow(
+        workflow_id="workflow-adaptive-profile-001",
+        run_date="2026-02-16",
+        stage_handlers=factory.build_handlers(),
+    )
+
+    assert result["state"] == "published"
+    assert [item["seedance_profile"] for item in result["seedance_profile_trace"]] == [
+        BALANCED,
+        SPEED,
+    ]
+    reloaded = _selector(stats_path=tmp_path / "stats.json")
+    assert reloaded.profile_stats(BALANCED)["success_rate"] == 0.0
+    assert reloaded.profile_stats(SPEED)["p50_latency_ms"] == 1200
+    assert reloaded.profile_stats(SPEED)["cost_per_second_usd"] == 0.4
+
+
+def test_scene_generation_records_render_stats_for_selected_profile(
+    tmp_path: Path,
+) -> None:
+    selector = _selector(min_samples=1)
+    selector.record(QUALITY, succeeded=False)
+    with SeedanceStubServer(latency_seconds=0.02) as server:
+        renderer = ConcurrentSceneRenderer(client=HttpSeedanceClient(server.base_url))
+        result = run_seedance_scene_generation(
+            prompt_pack=_prompt_pack(),
+            output_dir=tmp_path / "ok",
+            renderer=renderer,
+            profile_selector=selector,
+        )
+
+    assert result["seedance_profile"] == BALANCED
+    stats = selector.profile_stats(BALANCED)
+    assert stats["sample_count"] == 3
+    assert stats["success_rate"] == 1.0
+    assert stats["p95_latency_ms"] == 20
+
+    with SeedanceStubServer(failing_beats=[1, 2, 3]) as server:
+        renderer = ConcurrentSceneRenderer(client=HttpSeedanceClient(server.base_url))
+        with pytest.raises(SceneGenerationError) as error:
+            run_seedance_scene_generation(
+                prompt_pack=_prompt_pack(),
+                output_dir=tmp_path / "failing",
+                seedance_profile=SPEED,
+                renderer=renderer,
+                profile_selector=selector,
+            )
+
+    assert error.value.code == "SEEDANCE_RENDER_REJECTED"
+    assert selector.profile_stats(SPEED)["success_rate"] == 0.0
+
+
+def test_scene_generation_times_each_render_separately(tmp_path: Path) -> None:
+    selector = _selector()
+    renderer = ConcurrentSceneRenderer(client=_SlowClient(0.05), max_workers=1)
+
+    result = run_seedance_scene_generation(
+        prompt_pack=_prompt_pack(),
+        output_dir=tmp_path / "ok",
+        seedance_profile=QUALITY,
+        renderer=renderer,
+        profile_selector=selector,
+    )
+
+    stats = selector.profile_stats(QUALITY)
+    assert stats["sample_count"] == 3
+    assert 50 <= stats["p95_latency_ms"] < 100
+    assert 50 <= result["latency_ms"] < 100
+    assert result["rendered_seconds"] == 3.6
+    assert result["seedance_stats_recorded"] is True
+    persisted = (tmp_path / "ok" / "scene_generation.json").read_text(encoding="utf-8")
+    assert "latency_ms" not in persisted
+
+    renderer = ConcurrentSceneRenderer(
+        client=_SlowClient(0.05, failing_beats=[3]),
+        max_workers=1,
+    )
+    with pytest.raises(SceneGenerationError) as error:
+        run_seedance_scene_generation(
+            prompt_pack=_prompt_pack(),
+            output_dir=tmp_path / "failing",
+            seedance_profile=SPEED,
+            renderer=renderer,
+            profile_selector=selector,
+        )
+
+    assert error.value.details["seedance_stats_recorded"] is True
+    stats = selector.profile_stats(SPEED)
+    assert stats["sample_count"] == 3
+    assert stats["success_rate"] == 0.6667
+    assert stats["p95_latency_ms"] < 100
+
+
+def test_orchestrator_records_only_render_outcomes_it_owns() -> None:
+    selector = _selector()
+    factory = DeterministicStageHandlerFactory(
+        scripted_outcomes={
+            "scene_generation": [
+                {"status": "retryable_failure", "reason_code": "SCENE_OUTPUT_LOCKED"},
+                {
+                    "status": "retryable_failure",
+                    "reason_code": "SEEDANCE_RENDER_UNAVAILABLE",
+                    "seedance_stats_recorded": True,
+                },
+                {"status": "success", "latency_ms": 900, "rendered_seconds": 3},
+            ]
+        }
+    )
+    service = WorkflowOrchestrationService(
+        per_video_budget_cap_usd=10.0,
+        daily_spend_cap_usd=100.0,
+        max_retries_per_stage=3,
+        seedance_profile_selector=selector,
+    )
+
+    result = service.run_workflow(
+        workflow_id="workflow-adaptive-profile-002",
+        run_date="2026-02-16",
+        stage_handlers=factory.build_handlers(),
+    )
+
+    assert result["state"] == "published"
+    assert selector.profile_stats(QUALITY)["sample_count"] == 0
+    assert selector.profile_stats(BALANCED)["sample_count"] == 0
+    assert selector.profile_stats(SPEED)["sample_count"] == 1
+    assert selector.profile_stats(SPEED)["p50_latency_ms"] == 900
@@ -0,0 +1,102 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from money.ingestion import (
+    NdjsonFileFeed,
+    TrendFeedCollector,
+    TrendIngestionService,
+    TrendSourceAdapter,
+)
+
+
+def _write_feed(path: Path, source_platform: str, count: int) -> Path:
+    lines = []
+    for index in range(count):
+        lines.append(
+            json.dumps(
+                {
+                    "source_platform": source_platform,
+                    "external_id": "%s-%d" % (source_platform, index),
+                    "topic": "collector topic",
+                    "signal_score": 0.5,
+                    "captured_at": "2026-02-16T14:00:00Z",
+                    "analysis_only": False,
+                }
+            )
+        )
+    lines.append(lines[0])
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+class _TrackingFeed(TrendSourceAdapter):
+    in_flight = 0
+    peak_in_flight = 0
+
+    def __init__(self, source_platform: str, pages: int) -> None:
+        super().__init__(source_platform)
+        self._pages = pages
+
+    async def fetch_batch(self) -> List[Dict[str, Any]]:
+        _TrackingFeed.in_flight += 1
+        _TrackingFeed.peak_in_flight = max(
+            _TrackingFeed.peak_in_flight,
+            _TrackingFeed.in_flight,
+        )
+        await asyncio.sleep(0.01)
+        _TrackingFeed.in_flight -= 1
+        if self._pages == 0:
+            return []
+        self._pages -= 1
+        return [
+            {
+                "source_platform": "youtube",
+                "external_id": "%s-page-%d" % (self.source_platform, self._pages),
+                "topic": "tracking topic",
+                "signal_score": 0.4,
+                "captured_at": "2026-02-16T14:30:00Z",
+                "analysis_only": False,
+            }
+        ]
+
+
+def test_collector_pulls_feeds_concurrently_into_bulk_ingestion(tmp_path: Path) -> None:
+    service = TrendIngestionService()
+    feeds = [
+        NdjsonFileFeed(
+            "youtube",
+            _write_feed(tmp_path / "youtube.ndjson", "youtube", 5),
+            page_size=2,
+            latency_seconds=0.01,
+        ),
+        NdjsonFileFeed(
+            "tiktok",
+            _write_feed(tmp_path / "tiktok.ndjson", "tiktok", 3),
+            page_size=2,
+            latency_seconds=0.01,
+        ),
+        NdjsonFileFeed("youtube-missing", tmp_path / "missing.ndjson"),
+    ]
+
+    report = TrendFeedCollector(service, feeds, queue_size=1).collect_sync()
+
+    assert report.records_by_platform == {"youtube": 6, "tiktok": 4}
+    assert report.created_count == 8
+    assert report.duplicate_count == 2
+    assert report.record_count == 10
+    assert service.candidate_count() == 8
+    assert list(report.source_errors) == ["youtube-missing"]
+
+
+def test_collector_bounds_concurrent_fetches() -> None:
+    _TrackingFeed.in_flight = 0
+    _TrackingFeed.peak_in_flight = 0
+    service = TrendIngestionService()
+    feeds = [_TrackingFeed("feed-%d" % index, pages=3) for index in range(6)]
+
+    report = TrendFeedCollector(service, feeds, max_concurrency=2).collect_sync()
+
+    assert report.created_count == 18
+    assert _TrackingFeed.peak_in_flight == 2
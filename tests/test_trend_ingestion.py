@@ -1,9 +1,24 @@
 import json
+import sys
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List
 
 import pytest
 
-from money.ingestion import IngestionError, TrendIngestionService
+from money.ingestion import (
+    MONETIZATION_WEIGHT_PROFILES,
+    BloomFilter,
+    CandidateStore,
+    IngestionError,
+    TokenBucketRateLimiter,
+    TrendCandidate,
+    TrendIngestionService,
+    score_monetization_columns,
+)
+from money.ingestion.memory_benchmark import run_memory_benchmark
+from money.ingestion.ranking import CandidateRankingIndex
+from money.ingestion.scoring import numpy_available
 
 
 def test_duplicate_trend_ingestion_is_idempotent_and_writes_evidence() -> None:
@@ -142,3 +157,461 @@ def test_rate_limit_enforces_backoff_for_new_candidates() -> None:
 
     assert exc.value.code == "RATE_LIMIT_BACKOFF_REQUIRED"
     assert "retry_after_seconds=12" in str(exc.value)
+
+
+def test_ingest_many_dedupes_validates_and_caps_new_candidates() -> None:
+    service = TrendIngestionService(max_new_candidates=3)
+    service.ingest(
+        source_platform="youtube",
+        external_id="bulk-0",
+        topic="side hustles",
+        signal_score=0.55,
+        captured_at="2026-02-16T07:00:00Z",
+        analysis_only=False,
+    )
+
+    def _record(external_id: str, **overrides: object) -> dict:
+        record = {
+            "source_platform": "tiktok",
+            "external_id": external_id,
+            "topic": "bulk topic",
+            "signal_score": 0.61,
+            "captured_at": "2026-02-16T07:30:00Z",
+            "analysis_only": False,
+            "engagement_velocity": 0.80,
+            "advertiser_fit": 0.60,
+            "region_match": 0.70,
+        }
+        record.update(overrides)
+        return record
+
+    records = [
+        _record("bulk-0", source_platform="youtube"),
+        _record("bulk-1"),
+        _record("bulk-1"),
+        _record("bulk-2", signal_score=1.5),
+        _record("bulk-3", metadata={"media_url": "https://example.com/a.mp4"}),
+        _record("bulk-4"),
+        _record("bulk-5"),
+    ]
+
+    result = service.ingest_many(iter(records), chunk_size=2, include_results=True)
+
+    assert result.record_count == 7
+    assert result.created_count == 2
+    assert result.duplicate_count == 2
+    assert result.rejected_count == 3
+    assert result.rejected_by_code == {
+        "CONTRACT_TYPE_MISMATCH": 1,
+        "SOURCE_MEDIA_REUSE_FORBIDDEN": 1,
+        "RATE_LIMIT_BACKOFF_REQUIRED": 1,
+    }
+    assert result.results is not None
+    assert [item["status"] for item in result.results] == [
+        "duplicate",
+        "created",
+        "duplicate",
+        "rejected",
+        "rejected",
+        "created",
+        "rejected",
+    ]
+    assert service.candidate_count() == 3
+
+    single = TrendIngestionService().ingest(**_record("bulk-1"))
+    bulk_candidate = service.list_ranked_candidates()[0]
+    assert bulk_candidate.candidate_id == single.candidate.candidate_id
+    assert bulk_candidate.monetization_score == single.candidate.monetization_score
+
+
+def test_ingest_many_rejects_malformed_records_without_aborting() -> None:
+    service = TrendIngestionService()
+    service.ingest(
+        source_platform="youtube",
+        external_id="123",
+        topic="emergency funds",
+        signal_score=0.5,
+        captured_at="2026-02-16T09:00:00Z",
+        analysis_only=False,
+    )
+
+    def _record(external_id: object, **overrides: object) -> dict:
+        record = {
+            "source_platform": "youtube",
+            "external_id": external_id,
+            "topic": "malformed batch",
+            "signal_score": 0.6,
+            "captured_at": "2026-02-16T09:30:00Z",
+            "analysis_only": False,
+        }
+        record.update(overrides)
+        return record
+
+    records = [
+        _record("ok-1"),
+        _record("ok-2"),
+        _record("bad-velocity", engagement_velocity=None),
+        _record("bad-flag", analysis_only="false"),
+        _record(123),
+        _record("ok-3"),
+    ]
+
+    result = service.ingest_many(records, chunk_size=2, include_results=True)
+
+    assert result.created_count == 3
+    assert result.duplicate_count == 0
+    assert result.rejected_by_code == {"CONTRACT_TYPE_MISMATCH": 3}
+    assert result.results is not None
+    assert [item["status"] for item in result.results] == [
+        "created",
+        "created",
+        "rejected",
+        "rejected",
+        "rejected",
+        "created",
+    ]
+    assert service.candidate_count() == 4
+
+
+def _rank_order(candidate: TrendCandidate) -> tuple:
+    return (
+        -candidate.monetization_score,
+        candidate.captured_at,
+        candidate.candidate_id,
+    )
+
+
+def test_ranking_index_serves_top_k_and_cursor_pages() -> None:
+    service = TrendIngestionService()
+    platforms = ["youtube", "tiktok"]
+    records = [
+        {
+            "source_platform": platforms[index % 2],
+            "external_id": "rank-%d" % index,
+            "topic": "ranking topic",
+            "signal_score": round((index * 37 % 100) / 100.0, 2),
+            "captured_at": "2026-02-16T08:%02d:00Z" % (index % 7),
+            "analysis_only": index % 4 == 0,
+        }
+        for index in range(40)
+    ]
+    result = service.ingest_many(records, chunk_size=16)
+    assert result.created_count == 40
+
+    expected = sorted(service._candidates_by_id.values(), key=_rank_order)
+    assert service.list_ranked_candidates() == expected
+    assert service.top_k(5) == expected[:5]
+    assert service.top_k(3, publishable_only=True, source_platform="tiktok") == [
+        item
+        for item in expected
+        if item.source_platform == "tiktok" and not item.analysis_only
+    ][:3]
+
+    pages = []
+    page, cursor = service.list_ranked_page(7, publishable_only=True)
+    pages.extend(page)
+    while cursor is not None:
+        page, cursor = service.list_ranked_page(7, cursor=cursor, publishable_only=True)
+        pages.extend(page)
+    assert pages == [item for item in expected if not item.analysis_only]
+    assert len(pages) == 30
+
+    with pytest.raises(IngestionError) as exc:
+        service.list_ranked_page(5, cursor="not-a-cursor")
+    assert exc.value.code == "RANKING_CURSOR_INVALID"
+
+
+def test_ranking_cursor_round_trips_free_form_fields() -> None:
+    index = CandidateRankingIndex()
+    candidates = [
+        TrendCandidate(
+            "trend|%d" % position,
+            "youtube",
+            "ext-%d" % position,
+            "cursor topic",
+            0.5,
+            "2026-02-16|T10:00:00Z",
+            0.5,
+            False,
+            "beat_map.json",
+            "pacing_map.json",
+        )
+        for position in range(3)
+    ]
+    for candidate in candidates:
+        index.add(candidate)
+
+    first, cursor = index.page(2)
+    assert cursor is not None
+    rest, next_cursor = index.page(2, cursor=cursor)
+    assert first + rest == candidates
+    assert next_cursor is None
+
+
+def test_columnar_scoring_matches_scalar_path_and_rescores_pool() -> None:
+    service = TrendIngestionService()
+    factors = [
+        (0.74, 0.80, 0.60, 0.70),
+        (1.40, -0.20, 0.33, 0.90),
+        (0.10, 0.95, 0.05, 0.00),
+        (0.51, 0.50, 0.40, 0.60),
+    ]
+    for position, (signal, velocity, fit, region) in enumerate(factors):
+        service.ingest(
+            source_platform="youtube",
+            external_id="score-%d" % position,
+            topic="scoring parity",
+            signal_score=min(signal, 1.0),
+            captured_at="2026-02-16T10:00:00Z",
+            analysis_only=False,
+            engagement_velocity=velocity,
+            advertiser_fit=fit,
+            region_match=region,
+        )
+    scalar_scores = {
+        item.candidate_id: item.monetization_score
+        for item in service.list_ranked_candidates()
+    }
+
+    signals, velocities, fits, regions = [list(column) for column in zip(*factors)]
+    array_scores = score_monetization_columns(
+        signals,
+        velocities,
+        fits,
+        regions,
+        use_numpy=False,
+    )
+    assert array_scores[1] == pytest.approx(0.55 + 0.15 * 0.33 + 0.05 * 0.9)
+    if numpy_available():
+        numpy_scores = score_monetization_columns(
+            signals,
+            velocities,
+            fits,
+            regions,
+            use_numpy=True,
+        )
+        assert numpy_scores == array_scores
+
+    profile = MONETIZATION_WEIGHT_PROFILES["engagement_first"]
+    assert service.rescore_candidates(profile) == 4
+    assert service.monetization_weights is profile
+    rescored = service.list_ranked_candidates()
+    assert rescored[0].external_id == "score-0"
+    assert [item.monetization_score for item in rescored] == sorted(
+        (item.monetization_score for item in rescored),
+        reverse=True,
+    )
+
+    service.rescore_candidates(MONETIZATION_WEIGHT_PROFILES["default"])
+    assert {
+        item.candidate_id: item.monetization_score
+        for item in service.list_ranked_candidates()
+    } == scalar_scores
+
+
+def test_token_bucket_limiter_refills_per_platform_and_reports_retry_after() -> None:
+    clock = [1000.0]
+    limiter = TokenBucketRateLimiter(
+        refill_rate_per_second=0.5,
+        burst_size=2,
+        clock=lambda: clock[0],
+    )
+    service = TrendIngestionService(max_new_candidates=1, rate_limiter=limiter)
+
+    def _ingest(source_platform: str, external_id: str) -> None:
+        service.ingest(
+            source_platform=source_platform,
+            external_id=external_id,
+            topic="steady throughput",
+            signal_score=0.5,
+            captured_at="2026-02-16T11:00:00Z",
+            analysis_only=False,
+            backoff_attempt=5,
+        )
+
+    _ingest("youtube", "bucket-1")
+    _ingest("youtube", "bucket-2")
+    _ingest("tiktok", "bucket-3")
+
+    clock[0] += 0.5
+    with pytest.raises(IngestionError) as exc:
+        _ingest("youtube", "bucket-4")
+    assert exc.value.code == "RATE_LIMIT_BACKOFF_REQUIRED"
+    assert exc.value.retry_after_seconds == pytest.approx(1.5)
+    assert "retry_after_seconds=1.5" in str(exc.value)
+
+    clock[0] += 1.5
+    _ingest("youtube", "bucket-4")
+    assert service.candidate_count() == 4
+
+    bulk = service.ingest_many(
+        [
+            {
+                "source_platform": "tiktok",
+                "external_id": "bucket-bulk-%d" % index,
+                "topic": "steady throughput",
+                "signal_score": 0.5,
+                "captured_at": "2026-02-16T11:05:00Z",
+                "analysis_only": False,
+            }
+            for index in range(3)
+        ]
+    )
+    assert bulk.created_count == 2
+    assert bulk.rejected_by_code == {"RATE_LIMIT_BACKOFF_REQUIRED": 1}
+
+
+def test_candidate_store_dedupes_across_service_restarts(tmp_path: Path) -> None:
+    store_path = tmp_path / "candidates.sqlite3"
+    records = [
+        {
+            "source_platform": "youtube",
+            "external_id": "persist-%d" % index,
+            "topic": "restart safety",
+            "signal_score": 0.6,
+            "captured_at": "2026-02-16T12:00:00Z",
+            "analysis_only": index == 0,
+            "advertiser_fit": 0.9,
+        }
+        for index in range(3)
+    ]
+    first_store = CandidateStore(store_path, bloom_capacity=1000)
+    first_service = TrendIngestionService(candidate_store=first_store)
+    first_service.ingest_many(records[:2])
+    single = first_service.ingest(**records[2])  # type: ignore[arg-type]
+    first_store.close()
+
+    restarted_store = CandidateStore(store_path, bloom_capacity=1000)
+    assert restarted_store.count() == 3
+    assert restarted_store.might_contain("youtube", "persist-1")
+    assert not restarted_store.might_contain("tiktok", "never-seen")
+
+    service = TrendIngestionService(candidate_store=restarted_store)
+    replay = service.ingest_many(records + [dict(records[0], external_id="persist-9")])
+    assert replay.created_count == 1
+    assert replay.duplicate_count == 3
+
+    again = service.ingest(**records[2])  # type: ignore[arg-type]
+    assert again.created is False
+    assert again.candidate.candidate_id == single.candidate.candidate_id
+    assert again.candidate.advertiser_fit == 0.9
+    assert again.candidate.monetization_score == single.candidate.monetization_score
+    restarted_store.close()
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=500, false_positive_rate=0.01)
+    keys = [("key-%d" % index).encode("utf-8") for index in range(500)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(
+        ("miss-%d" % index).encode("utf-8") in bloom for index in range(2000)
+    )
+    assert false_positives < 100
+
+
+def test_trend_candidate_is_slotted_with_lazy_artifact_paths() -> None:
+    candidate = TrendCandidate(
+        "trend-abc",
+        "".join(["you", "tube"]),
+        "ext-1",
+        "compact storage",
+        0.5,
+        "2026-02-16T13:00:00Z",
+        0.5,
+        False,
+    )
+
+    assert not hasattr(candidate, "__dict__")
+    assert candidate.source_platform is sys.intern("youtube")
+    assert candidate.beat_map_artifact == "artifacts/trend-abc/beat_map.json"
+    assert candidate.pacing_map_artifact == "artifacts/trend-abc/pacing_map.json"
+
+    candidate.beat_map_artifact = "custom/beat_map.json"
+    assert candidate.beat_map_artifact == "custom/beat_map.json"
+    with pytest.raises(AttributeError):
+        candidate.unexpected = True  # type: ignore[attr-defined]
+
+    report = run_memory_benchmark(2000)
+    assert report["compact_bytes_per_candidate"] < report["legacy_bytes_per_candidate"]
+
+
+def test_ttl_eviction_drops_stale_candidates_and_tombstones_their_keys() -> None:
+    now = [datetime(2026, 2, 16, 12, 0, 0)]
+    service = TrendIngestionService(
+        candidate_ttl_seconds=3600,
+        now_provider=lambda: now[0],
+    )
+
+    def _record(external_id: str, captured_at: str) -> dict:
+        return {
+            "source_platform": "youtube",
+            "external_id": external_id,
+            "topic": "ttl topic",
+            "signal_score": 0.5,
+            "captured_at": captured_at,
+            "analysis_only": False,
+        }
+
+    service.ingest_many(
+        [
+            _record("ttl-old", "2026-02-16T11:10:00Z"),
+            _record("ttl-new", "2026-02-16T11:50:00Z"),
+        ]
+    )
+    stale = service.ingest_many(
+        [_record("ttl-stale", "2026-02-16T10:00:00Z")],
+        include_results=True,
+    )
+    assert stale.rejected_by_code == {"TREND_CANDIDATE_EXPIRED": 1}
+    assert service.candidate_count() == 2
+
+    now[0] = datetime(2026, 2, 16, 12, 30, 0)
+    assert service.evict_expired() == 1
+    assert [item.external_id for item in service.list_ranked_candidates()] == [
+        "ttl-new"
+    ]
+    assert service.tombstone_count() == 1
+
+    with pytest.raises(IngestionError) as exc:
+        service.ingest(**_record("ttl-old", "2026-02-16T12:20:00Z"))
+    assert exc.value.code == "TREND_CANDIDATE_EXPIRED"
+
+    now[0] = datetime(2026, 2, 17, 0, 0, 0)
+    replay = service.ingest_many([_record("ttl-new", "2026-02-16T23:30:00Z")])
+    assert replay.rejected_by_code == {"TREND_CANDIDATE_EXPIRED": 1}
+    assert service.candidate_count() == 0
+
+
+def test_tombstones_expire_after_the_staleness_horizon() -> None:
+    now = [datetime(2026, 2, 16, 0, 0, 0)]
+    service = TrendIngestionService(
+        max_new_candidates=100000,
+        candidate_ttl_seconds=600,
+        now_provider=lambda: now[0],
+    )
+
+    tombstone_counts = []  # type: List[int]
+    for cycle in range(50):
+        captured_at = now[0].strftime("%Y-%m-%dT%H:%M:%SZ")
+        service.ingest_many(
+            [
+                {
+                    "source_platform": "youtube",
+                    "external_id": "cycle-%d-%d" % (cycle, index),
+                    "topic": "ttl churn",
+                    "signal_score": 0.5,
+                    "captured_at": captured_at,
+                    "analysis_only": False,
+                }
+                for index in range(20)
+            ]
+        )
+        now[0] += timedelta(seconds=300)
+        service.evict_expired()
+        tombstone_counts.append(service.tombstone_count())
+
+    assert max(tombstone_counts) <= 60
+    assert tombstone_counts[-1] == tombstone_counts[-10]